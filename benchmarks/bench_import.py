@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Benchmark of ``import cesiumpy`` time.
+
+Each statement is run in a fresh interpreter. The second statement also
+creates the default geocoder, which had been created on import.
+
+    $ python benchmarks/bench_import.py
+"""
+
+from __future__ import print_function, unicode_literals
+
+import subprocess
+import sys
+import timeit
+
+
+def _bench(label, stmt, repeat=10):
+    cmd = [sys.executable, '-c', stmt]
+    best = min(timeit.repeat(lambda: subprocess.check_call(cmd),
+                             number=1, repeat=repeat))
+    print('{0:<40} {1:8.1f} ms'.format(label, best * 1000))
+    return best
+
+
+def main():
+    _bench('python startup', 'pass')
+    lazy = _bench('import cesiumpy', 'import cesiumpy')
+    eager = _bench('import cesiumpy + default geocoder',
+                   'import cesiumpy; cesiumpy.geocode.get_geocoder()')
+    print('geocoder creation deferred: {0:.1f} ms'.format((eager - lazy) * 1000))
+
+    stmt = 'import sys, cesiumpy; assert "geopy" not in sys.modules'
+    subprocess.check_call([sys.executable, '-c', stmt])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Micro-benchmark of JavaScript serialization.
+
+Compares ``cesiumpy.util.common.to_jsscalar`` against the previous
+isinstance-based implementation, which is kept below as a reference.
+
+    $ python benchmarks/bench_serialize.py
+"""
+
+from __future__ import print_function, unicode_literals
+
+import timeit
+
+import numpy as np
+import six
+
+from cesiumpy.entities.cartesian import Cartesian3Array
+import cesiumpy.util.common as com
+
+
+def _legacy_to_jsscalar(x):
+    """ previous implementation of to_jsscalar """
+
+    from cesiumpy.base import _CesiumObject, _CesiumEnum
+    if isinstance(x, (_CesiumObject, _CesiumEnum)):
+        return x.script
+
+    if isinstance(x, bool):
+        x = 'true' if x else 'false'
+    elif isinstance(x, six.string_types):
+        x = '"{0}"'.format(x)
+    elif isinstance(x, dict):
+        x = ''.join(com.to_jsobject(x))
+    elif isinstance(x, list):
+        x = [str(_legacy_to_jsscalar(e)) for e in x]
+        x = '[{0}]'.format(', '.join(x))
+    return x
+
+
+def _legacy_cartesian3array(c):
+    rep = """Cesium.Cartesian3.fromDegreesArray({x})"""
+    return rep.format(x=_legacy_to_jsscalar(c.x))
+
+
+def _bench(label, stmt, number):
+    best = min(timeit.repeat(stmt, number=number, repeat=5))
+    print('{0:<40} {1:10.1f} us'.format(label, best / number * 1e6))
+    return best
+
+
+def main():
+    n = 100000
+    rs = np.random.RandomState(1)
+    lon = rs.uniform(-180, 180, n)
+    lat = rs.uniform(-90, 90, n)
+    values = np.column_stack([lon, lat]).ravel()
+
+    c = Cartesian3Array(values)
+    assert c.script == _legacy_cartesian3array(c)
+
+    print('Cartesian3Array with {0} points'.format(n))
+    old = _bench('legacy to_jsscalar', lambda: _legacy_cartesian3array(c), 10)
+    new = _bench('to_jsscalar', lambda: c.script, 10)
+    print('speedup: {0:.1f}x'.format(old / new))
+
+    print()
+    print('ndarray with {0} elements'.format(n * 2))
+    _bench('to_jsscalar', lambda: com.to_jsscalar(values), 10)
+
+    print()
+    props = dict(a=1.5, b='x', c=True, d=[1, 2, 3])
+    print('small mapping')
+    old = _bench('legacy to_jsscalar',
+                 lambda: [_legacy_to_jsscalar(v) for v in props.values()], 10000)
+    new = _bench('to_jsscalar',
+                 lambda: [com.to_jsscalar(v) for v in props.values()], 10000)
+    print('speedup: {0:.1f}x'.format(old / new))
+
+
+if __name__ == '__main__':
+    main()
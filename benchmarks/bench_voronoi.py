@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Benchmark of clipped Voronoi regions.
+
+Compares ``Voronoi._get_coordinates``, which closes and clips regions with
+arrays, against the loop which builds a shapely Polygon per region. The loop
+is skipped for large inputs as it takes minutes. The time of
+``scipy.spatial.Voronoi`` itself is shown for reference.
+
+    $ python benchmarks/bench_voronoi.py
+    $ python benchmarks/bench_voronoi.py 1000 10000
+"""
+
+from __future__ import print_function, unicode_literals
+
+import sys
+import time
+
+import numpy as np
+
+import cesiumpy
+
+
+# the loop is run up to this number of sites
+_LOOP_LIMIT = 100000
+
+
+def _bench(label, func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        best = min(best, time.time() - start)
+    print('{0:<40} {1:10.3f} s'.format(label, best))
+    return best
+
+
+def main(sizes):
+    rs = np.random.RandomState(1)
+    for n in sizes:
+        points = rs.uniform(0, 1, (n, 2)) * [60, 30] + [100, 20]
+        repeat = 3 if n <= 10000 else 1
+
+        print('{0} sites'.format(n))
+        start = time.time()
+        vor = cesiumpy.spatial.Voronoi(points)
+        print('{0:<40} {1:10.3f} s'.format('scipy.spatial.Voronoi', time.time() - start))
+
+        new = _bench('vectorized', vor._get_coordinates, repeat=repeat)
+        if n <= _LOOP_LIMIT:
+            old = _bench('loop', vor._get_coordinates_loop, repeat=repeat)
+            print('speedup: {0:.1f}x'.format(old / new))
+        print()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        sizes = [int(n) for n in sys.argv[1:]]
+    else:
+        sizes = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+    main(sizes)
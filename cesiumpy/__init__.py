@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # coding: utf-8
 
+from cesiumpy.options import options, option_context                           # noqa
+
 # data
 import cesiumpy.data.country                                                    # noqa
 countries = cesiumpy.data.country.CountryLoader()                               # noqa
@@ -11,10 +13,15 @@ import cesiumpy.entities.color
 color = cesiumpy.entities.color.ColorFactory()                                  # noqa
 
 from cesiumpy.entities.cartesian import Cartesian2, Cartesian3, Cartesian4      # noqa
+from cesiumpy.entities.condition import DistanceDisplayCondition                # noqa
 from cesiumpy.entities.entity import (Point, Label, Billboard, Ellipse,         # noqa
                                       Ellipsoid, Corridor, Cylinder,            # noqa
                                       Polyline, PolylineVolume, Wall,           # noqa
                                       Rectangle, Box, Polygon)                  # noqa
+from cesiumpy.entities.collection import (PointCollection, LabelCollection,    # noqa
+                                          PinCollection, CylinderCollection,    # noqa
+                                          ClusterCollection,                    # noqa
+                                          PolygonCollection)                    # noqa
 from cesiumpy.entities.model import Model                                       # noqa
 from cesiumpy.entities.pinbuilder import Pin                                    # noqa
 from cesiumpy.entities.transform import Transforms                              # noqa
@@ -23,6 +30,7 @@ from cesiumpy.entities.transform import Transforms
 import cesiumpy.extension as extension                                          # noqa
 from cesiumpy.extension import geocode                                          # noqa
 from cesiumpy.extension import io                                               # noqa
+from cesiumpy.extension import simplify                                         # noqa
 from cesiumpy.extension import spatial                                          # noqa
 
 from cesiumpy.camera import Camera                                              # noqa
@@ -3,11 +3,14 @@
 
 from __future__ import unicode_literals
 
+import os
 import six
 import traitlets
 
+from cesiumpy.options import _iter_with_options
 import cesiumpy.util.common as com
 import cesiumpy.util.html as html
+import cesiumpy.util.spatialindex as spatialindex
 from cesiumpy.util.trait import _JavaScriptObject, _JavaScriptEnum, _DIV
 
 
@@ -22,6 +25,11 @@ class _CesiumEnum(_JavaScriptEnum):
     pass
 
 
+@com.register_jsconverter((_CesiumObject, _CesiumEnum))
+def _cesium_to_js(x):
+    return x.script
+
+
 class _CesiumBase(_CesiumObject):
     """
     Base class for Cesium Widget / Viewer
@@ -48,6 +56,9 @@ class _CesiumBase(_CesiumObject):
 
     terrainExaggeration = traitlets.Float(allow_none=True)
 
+    # not a Cesium property, excluded from _props
+    precision = traitlets.Int(allow_none=True)
+
     def __init__(self, divid=None, width='100%', height='100%',
                  clock=None, imageryProvider=None, terrainProvider=None,
                  skyBox=None, skyAtmosphere=None, sceneMode=None,
@@ -55,7 +66,7 @@ class _CesiumBase(_CesiumObject):
                  mapProjection=None, globe=None, useDefaultRenderLoop=None,
                  targetFrameRate=None, showRenderLoopErrors=None,
                  contextOptions=None, creditContainer=None,
-                 terrainExaggeration=None):
+                 terrainExaggeration=None, precision=None):
 
         self.div = _DIV(divid=divid, width=width, height=height)
 
@@ -83,6 +94,11 @@ class _CesiumBase(_CesiumObject):
 
         self.terrainExaggeration = terrainExaggeration
 
+        if precision is not None and precision < 0:
+            msg = 'precision must be a non-negative integer: {x}'
+            raise ValueError(msg.format(x=precision))
+        self.precision = precision
+
         from cesiumpy.camera import Camera
         self._camera = Camera(self)
 
@@ -90,8 +106,9 @@ class _CesiumBase(_CesiumObject):
         self._scene = Scene(self)
 
         from cesiumpy.entities.entity import _CesiumEntity
-        self._entities = RistrictedList(self, allowed=_CesiumEntity,
-                                        propertyname='entities')
+        from cesiumpy.entities.collection import _EntityCollection
+        self._entities = EntityList(self, allowed=(_CesiumEntity, _EntityCollection),
+                                    propertyname='entities')
         from cesiumpy.datasource import DataSource
         self._dataSources = RistrictedList(self, allowed=DataSource,
                                            propertyname='dataSources')
@@ -113,16 +130,59 @@ class _CesiumBase(_CesiumObject):
     def _repr_html_(self):
         return self.to_html()
 
-    def to_html(self):
+    def to_html(self, bbox=None):
+        """
+        Render HTML
+
+        Parameters
+        ----------
+
+        bbox : tuple, optional
+            (minx, miny, maxx, maxy) in degrees. If specified, only entities
+            which intersect with it are rendered.
+            Entity collections are clipped to the entities which intersect.
+        """
+        return os.linesep.join(self._iter_html(bbox=bbox))
+
+    def write_html(self, path_or_buf, bbox=None):
+        """
+        Write HTML to the file. Each script is written as soon as it is
+        generated, rather than building whole HTML on memory like to_html.
+
+        Parameters
+        ----------
+
+        path_or_buf : str or file-like object
+            File path or object which has write method
+        bbox : tuple, optional
+            (minx, miny, maxx, maxy) in degrees. If specified, only entities
+            which intersect with it are written.
+            Entity collections are clipped to the entities which intersect.
+        """
+        html._write_html(self._iter_html(bbox=bbox), path_or_buf)
+
+    def _iter_html(self, bbox=None):
         headers = self._load_scripts
         container = self.container
-        script = html._wrap_script(self.script)
-
-        results = html._build_html(headers, container, script)
-        return results
+        if bbox is not None:
+            # query before starting to write
+            entities = self._entities.query(bbox=bbox, clip=True)
+        else:
+            entities = None
+        script = html._iter_wrap_script(self._iter_script(entities=entities))
+        return html._iter_html(headers, container, script)
 
     @property
     def script(self):
+        return list(self._iter_script())
+
+    def _iter_script(self, entities=None):
+        if self.precision is None:
+            return self._iter_widget_script(entities=entities)
+        return _iter_with_options(self._iter_widget_script(entities=entities),
+                                  precision=self.precision)
+
+    def _iter_widget_script(self, entities=None):
         props = com.to_jsobject(self._property_dict)
         props = ''.join(props)
         if props != '':
@@ -133,13 +193,17 @@ class _CesiumBase(_CesiumObject):
             script = """var {varname} = new {klass}("{divid}");"""
             script = script.format(varname=self._varname, klass=self._klass,
                                    divid=self.div.divid)
-        return ([script] +
-                self._entities.script +
-                self._dataSources.script +
-                [self._camera_script] +
-                self._scene.script +
-                self.scripts._items
-                )
+        yield script
+
+        for script in self._entities._iter_script(items=entities):
+            yield script
+        for script in self._dataSources._iter_script():
+            yield script
+        yield self._camera_script
+        for script in self._scene._iter_script():
+            yield script
+        for script in self.scripts._items:
+            yield script
 
     @property
     def camera(self):
@@ -189,13 +253,14 @@ class RistrictedList(_CesiumObject):
         self._propertyname = propertyname
 
     def add(self, item, **kwargs):
-        if com.is_listlike(item):
+        if com.is_listlike(item) or com.is_iterator(item):
+            # iterator is consumed lazily, like the result of io.iter_geojson
             for i in item:
                 self.add(i, **kwargs)
         elif isinstance(item, self._allowed):
             for key, value in six.iteritems(kwargs):
                 setattr(item, key, value)
-            self._items.append(item)
+            self._append(item)
         else:
             msg = 'item must be {allowed} instance: {item}'
 
@@ -206,6 +271,9 @@ class RistrictedList(_CesiumObject):
 
             raise ValueError(msg.format(allowed=allowed, item=item))
 
+    def _append(self, item):
+        self._items.append(item)
+
     def clear(self):
         self._items = []
 
@@ -221,11 +289,99 @@ class RistrictedList(_CesiumObject):
         return list of scripts built from entities
         each script may be a list of comamnds also
         """
-        results = []
-        for item in self._items:
-            script = """{varname}.{propertyname}.add({item});"""
+        return list(self._iter_script())
+
+    def _iter_script(self, items=None):
+        if items is None:
+            items = self._items
+        for item in items:
+            if getattr(item, '_is_collection', False):
+                # collection is a function which adds all of its entities
+                script = """({item})({varname}.{propertyname});"""
+            else:
+                script = """{varname}.{propertyname}.add({item});"""
             script = script.format(varname=self.widget._varname,
                                    propertyname=self._propertyname,
                                    item=item.script)
-            results.append(script)
+            yield script
+
+
+class EntityList(RistrictedList):
+    """
+    RistrictedList of entities, which can be queried by region and name.
+
+    The spatial index is built on the first query and updated when entities
+    are added. Note that changing positions of added entities is not
+    reflected to the index.
+    """
+
+    def __init__(self, widget, allowed, propertyname, cell_size=1.):
+        super(EntityList, self).__init__(widget, allowed, propertyname)
+        self._cell_size = cell_size
+        self._index = None
+        self._names = None
+
+    def _append(self, item):
+        super(EntityList, self)._append(item)
+        if self._index is not None:
+            self._insert(len(self._items) - 1, item)
+
+    def clear(self):
+        super(EntityList, self).clear()
+        self._index = None
+        self._names = None
+
+    def _insert(self, key, item):
+        bounds = spatialindex.get_bounds(item)
+        if bounds is not None:
+            self._index.insert(key, bounds)
+        name = getattr(item, 'name', None)
+        if isinstance(name, six.string_types):
+            self._names.setdefault(name, []).append(key)
+
+    def _build_index(self):
+        if self._index is None:
+            self._index = spatialindex.GridIndex(cell_size=self._cell_size)
+            self._names = {}
+            for key, item in enumerate(self._items):
+                self._insert(key, item)
+
+    def query(self, bbox=None, name=None, clip=False):
+        """
+        Return list of entities which match all of the conditions, in the
+        order they are added.
+
+        Parameters
+        ----------
+
+        bbox : tuple, optional
+            (minx, miny, maxx, maxy) in degrees. Entities whose bounds
+            intersect with it are returned. Entities which don't have
+            positions in degrees never match. minx larger than maxx
+            means the bbox crosses the antimeridian.
+        name : str, optional
+            Name of entities.
+        clip : bool, default False
+            Whether to return copies of entity collections which only have
+            entities intersect with bbox, rather than the whole collections.
+        """
+        if bbox is None and name is None:
+            return list(self._items)
+
+        bboxes = None if bbox is None else spatialindex.validate_bbox(bbox)
+        self._build_index()
+
+        keys = None
+        if bboxes is not None:
+            keys = set()
+            for b in bboxes:
+                keys.update(self._index.query(b))
+        if name is not None:
+            named = set(self._names.get(name, ()))
+            keys = named if keys is None else keys & named
+        results = [self._items[key] for key in sorted(keys)]
+        if clip and bboxes is not None:
+            results = [item._clip(bboxes) if getattr(item, '_is_collection', False)
+                       else item for item in results]
+            results = [item for item in results if item is not None]
         return results
@@ -3,23 +3,71 @@
 
 from __future__ import unicode_literals
 
+import collections
 import os
 import json
+import threading
+
+import cesiumpy.util.common as com
 
 current_dir = os.path.dirname(__file__)
 data_path = os.path.join(current_dir, 'countries')
 
+# file names of the prebuilt index, see CountryLoader.build_index
+_INDEX_FILE = 'rings_index.npz'
+_COORDINATES_FILE = 'rings.npy'
+
+
+def _user_cache_dir():
+    """ Directory to write the index of the bundled data """
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME')
+        if not base:
+            base = os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'cesiumpy', 'countries')
+
 
 class CountryLoader(object):
+    """
+    Load country polygons from the bundled GeoJSON data
+
+    Parsed exterior rings are memoized per country as read-only arrays.
+    If the prebuilt index exists (see ``build_index``), rings are read
+    from the memory-mapped index instead of parsing GeoJSON.
+
+    Parameters
+    ----------
 
-    def __init__(self):
+    path : str, optional
+        Directory which contains ``countries.json`` and ``data/*.geo.json``.
+        Default is the bundled countries data.
+    maxsize : int, default 256
+        Maximum number of countries whose rings are memoized.
+    index_path : str, optional
+        Directory of the prebuilt index. Default is ``path`` if specified,
+        otherwise the user cache directory (``~/.cache/cesiumpy/countries``),
+        not to write into the installed package.
+    """
+
+    def __init__(self, path=None, maxsize=256, index_path=None):
+        self._path = data_path if path is None else path
+        if index_path is None:
+            index_path = _user_cache_dir() if path is None else path
+        self._index_path = index_path
+        self._maxsize = maxsize
         self._countries = None
+        self._memo = collections.OrderedDict()
+        self._lock = threading.RLock()
+        # None: not loaded yet, False: index doesn't exist
+        self._index = None
 
     @property
     def countries(self):
         if self._countries is None:
             countries = {}
-            path = os.path.join(data_path, 'countries.json')
+            path = os.path.join(self._path, 'countries.json')
 
             with open(path) as f:
                 data = json.load(f)
@@ -31,20 +79,204 @@ class CountryLoader(object):
             self._countries = countries
         return self._countries
 
-    def get(self, name):
+    def _geojson_path(self, code):
+        return os.path.join(self._path, 'data', '{0}.geo.json'.format(code))
+
+    def get(self, name, simplify=None):
+        """
+        Load country polygons by its code or official name
+
+        Parameters
+        ----------
+
+        name : str
+            Country code ("cca2" or "cca3") or official name.
+        simplify : float, optional
+            Tolerance in degrees to simplify polygons. Memoized rings are
+            kept as they are.
+        """
         fname = name.lower()
-        fname = self.countries.get(fname, fname)
-        path = os.path.join(data_path, 'data', '{0}.geo.json'.format(fname))
-        if os.path.exists(path):
-            from cesiumpy.extension.io import read_geojson
-            return read_geojson(path)
-        else:
+        try:
+            fname = self.countries.get(fname, fname)
+        except IOError:
+            # countries.json doesn't exist, let below raise
+            pass
+
+        rings = self._get_rings(fname)
+        if rings is None:
             msg = "Unable to load country data, file not found: '{name}'"
             raise ValueError(msg.format(name=name))
 
+        from cesiumpy.entities.entity import Polygon
+        return [Polygon(hierarchy=ring, simplify=simplify) for ring in rings]
+
+    def _get_rings(self, code):
+        """
+        Return list of exterior rings as (N, 2) shaped arrays, or None if
+        the country doesn't exist
+        """
+        with self._lock:
+            try:
+                rings = self._memo.pop(code)
+            except KeyError:
+                rings = self._load_rings(code)
+                if rings is None:
+                    return None
+            self._memo[code] = rings
+            while len(self._memo) > self._maxsize:
+                self._memo.popitem(last=False)
+            return rings
+
+    def _load_rings(self, code):
+        index = self._load_index()
+        if index and code in index:
+            return index[code]
+
+        path = self._geojson_path(code)
+        if not os.path.exists(path):
+            return None
+        return _read_rings(path)
+
+    def _load_index(self):
+        if self._index is None:
+            index_path = os.path.join(self._index_path, _INDEX_FILE)
+            coordinates_path = os.path.join(self._index_path, _COORDINATES_FILE)
+            if os.path.exists(index_path) and os.path.exists(coordinates_path):
+                self._index = _RingIndex(index_path, coordinates_path)
+            else:
+                self._index = False
+        return self._index
+
+    def build_index(self, path=None):
+        """
+        Build the binary index of all country rings in the data directory.
+
+        Coordinates of all rings are concatenated into a single float64
+        array (``rings.npy``) and the offsets are written to
+        ``rings_index.npz``. The index is memory-mapped when countries
+        are loaded, thus it should be rebuilt after the data is updated.
+
+        Parameters
+        ----------
+
+        path : str, optional
+            Directory to write the index, created if it doesn't exist.
+            Default is ``index_path`` of the loader. The loader reads the
+            index from the directory afterwards.
+        """
+        np = com._check_package('numpy')
+
+        if path is None:
+            path = self._index_path
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        directory = os.path.join(self._path, 'data')
+        codes = []
+        ring_counts = []
+        rings = []
+        for fname in sorted(os.listdir(directory)):
+            if not fname.endswith('.geo.json'):
+                continue
+            country = _read_rings(os.path.join(directory, fname))
+            codes.append(fname[:-len('.geo.json')])
+            ring_counts.append(len(country))
+            rings.extend(country)
+
+        # country i consists of rings[country_offsets[i]:country_offsets[i + 1]],
+        # ring j consists of coordinates[ring_offsets[j]:ring_offsets[j + 1]]
+        country_offsets = np.concatenate([[0], np.cumsum(ring_counts)])
+        ring_offsets = np.concatenate([[0], np.cumsum([len(r) for r in rings])])
+        if len(rings) > 0:
+            coordinates = np.concatenate(rings)
+        else:
+            coordinates = np.empty((0, 2), dtype=np.float64)
+
+        np.save(os.path.join(path, _COORDINATES_FILE), coordinates)
+        np.savez(os.path.join(path, _INDEX_FILE),
+                 codes=np.array(codes, dtype='U'),
+                 country_offsets=country_offsets.astype(np.int64),
+                 ring_offsets=ring_offsets.astype(np.int64))
+
+        with self._lock:
+            self._index_path = path
+            self._index = None
+            self._memo.clear()
+
+    def clear_cache(self):
+        """ Clear memoized rings """
+        with self._lock:
+            self._memo.clear()
+
     def __getattr__(self, name):
+        if name.startswith('_'):
+            # avoid recursion while the instance isn't initialized
+            raise AttributeError(name)
         try:
             return self.get(name)
         except ValueError:
             msg = "Unable to load country data, file not found: '{name}'"
             raise AttributeError(msg.format(name=name))
+
+
+class _RingIndex(object):
+    """ Memory-mapped rings built by CountryLoader.build_index """
+
+    def __init__(self, index_path, coordinates_path):
+        np = com._check_package('numpy')
+        with np.load(index_path) as index:
+            codes = [str(c) for c in index['codes']]
+            country_offsets = index['country_offsets']
+            self._ring_offsets = index['ring_offsets']
+        self._positions = dict((c, (country_offsets[i], country_offsets[i + 1]))
+                               for i, c in enumerate(codes))
+        self._coordinates = np.load(coordinates_path, mmap_mode='r')
+
+    def __contains__(self, code):
+        return code in self._positions
+
+    def __getitem__(self, code):
+        np = com._check_package('numpy')
+        start, stop = self._positions[code]
+        offsets = self._ring_offsets[start:stop + 1]
+        # contiguous read-only views of the memory-mapped array, no copy
+        return [_readonly(np.ascontiguousarray(self._coordinates[s:e]))
+                for s, e in zip(offsets[:-1], offsets[1:])]
+
+
+def _readonly(x):
+    """ Mark memoized array as read-only, entities share it without copy """
+    x.flags.writeable = False
+    return x
+
+
+def _read_rings(path):
+    """
+    Read exterior rings of (Multi)Polygon features in GeoJSON file as
+    list of (N, 2) shaped float64 arrays
+    """
+    np = com._check_package('numpy')
+
+    with open(path) as f:
+        data = json.load(f)
+
+    if data.get('type') == 'FeatureCollection':
+        geometries = [feature['geometry'] for feature in data['features']]
+    elif data.get('type') == 'Feature':
+        geometries = [data['geometry']]
+    else:
+        geometries = [data]
+
+    rings = []
+    for geometry in geometries:
+        if geometry['type'] == 'Polygon':
+            polygons = [geometry['coordinates']]
+        elif geometry['type'] == 'MultiPolygon':
+            polygons = geometry['coordinates']
+        else:
+            msg = 'Unsupported geometry type for countries: {t}'
+            raise ValueError(msg.format(t=geometry['type']))
+        for polygon in polygons:
+            ring = np.array(polygon[0], dtype=np.float64)
+            rings.append(_readonly(np.ascontiguousarray(ring[:, :2])))
+    return rings
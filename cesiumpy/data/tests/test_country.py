@@ -4,8 +4,13 @@
 import nose
 import unittest
 
+import os
+import shutil
+import tempfile
+
 import cesiumpy
-from cesiumpy.testing import _skip_if_no_shapely
+from cesiumpy.data.country import CountryLoader
+from cesiumpy.testing import _skip_if_no_numpy, _skip_if_no_shapely
 
 
 class TestCountry(unittest.TestCase):
@@ -69,6 +74,136 @@ class TestCountry(unittest.TestCase):
         self.assertEqual(res, exp)
 
 
+class TestCountryLoader(unittest.TestCase):
+
+    def setUp(self):
+        _skip_if_no_numpy()
+
+        data = os.path.join(os.path.dirname(cesiumpy.__file__),
+                            'extension', 'tests', 'data')
+        self.path = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.path, 'data'))
+        shutil.copy(os.path.join(data, 'countries.json'), self.path)
+        shutil.copy(os.path.join(data, 'jpn.geo.json'),
+                    os.path.join(self.path, 'data'))
+
+        self.exp = """{polygon : {hierarchy : Cesium.Cartesian3.fromDegreesArray([153.958588, 24.295, 153.953308, 24.292774, 153.946625, 24.293331, 153.942749, 24.296944, 153.939697, 24.300831, 153.938873, 24.306942, 153.940247, 24.312496, 153.947754, 24.319443, 153.952759, 24.321384, 153.960236, 24.321663, 153.96579, 24.31361, 153.96579, 24.309441, 153.963013, 24.29833, 153.958588, 24.295])}}"""
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_get(self):
+        loader = CountryLoader(path=self.path)
+        jpn = loader.get('JP')
+        self.assertIsInstance(jpn, list)
+        self.assertEqual(len(jpn), 67)
+        self.assertTrue(all([isinstance(e, cesiumpy.Polygon) for e in jpn]))
+        self.assertEqual(jpn[0].script, self.exp)
+        self.assertEqual(loader.japan[0].script, self.exp)
+
+        msg = "Unable to load country data, file not found: 'X'"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            loader.get('X')
+        with nose.tools.assert_raises_regexp(AttributeError, msg):
+            loader.X
+
+    def test_get_same_as_read_geojson(self):
+        _skip_if_no_shapely()
+        loader = CountryLoader(path=self.path)
+        path = os.path.join(self.path, 'data', 'jpn.geo.json')
+        try:
+            exp = cesiumpy.io.read_geojson(path)
+        except TypeError:
+            # MultiPolygon is not iterable in shapely 2
+            raise nose.SkipTest('read_geojson is not supported')
+        res = loader.get('jpn')
+        self.assertEqual([e.script for e in res], [e.script for e in exp])
+
+    def test_memo(self):
+        loader = CountryLoader(path=self.path, maxsize=1)
+        jpn = loader.get('jpn')
+        self.assertEqual(list(loader._memo.keys()), ['jpn'])
+
+        # memoized rings are used even if the file is removed
+        os.remove(os.path.join(self.path, 'data', 'jpn.geo.json'))
+        res = loader.get('jpn')
+        self.assertEqual([e.script for e in res], [e.script for e in jpn])
+
+        loader.clear_cache()
+        self.assertEqual(len(loader._memo), 0)
+        with nose.tools.assert_raises(ValueError):
+            loader.get('jpn')
+
+    def test_simplify(self):
+        loader = CountryLoader(path=self.path)
+        jpn = loader.get('jpn')
+        res = loader.get('jpn', simplify=0.05)
+        self.assertEqual(len(res), len(jpn))
+        removed = sum([e.removed_vertices for e in res])
+        self.assertTrue(removed > 0)
+        self.assertEqual(sum([len(e.hierarchy.x) // 2 for e in res]),
+                         sum([len(e.hierarchy.x) // 2 for e in jpn]) - removed)
+
+        # memoized rings are not simplified
+        self.assertEqual([e.script for e in loader.get('jpn')],
+                         [e.script for e in jpn])
+
+    def test_build_index(self):
+        import numpy as np
+
+        loader = CountryLoader(path=self.path)
+        exp = [e.script for e in loader.get('jpn')]
+        loader.build_index()
+        self.assertTrue(os.path.exists(os.path.join(self.path, 'rings.npy')))
+        self.assertTrue(os.path.exists(os.path.join(self.path, 'rings_index.npz')))
+
+        # the index is used instead of GeoJSON
+        os.remove(os.path.join(self.path, 'data', 'jpn.geo.json'))
+        loader = CountryLoader(path=self.path)
+        res = loader.get('jpn')
+        self.assertEqual([e.script for e in res], exp)
+        self.assertIsInstance(loader._index._coordinates, np.memmap)
+
+        msg = "Unable to load country data, file not found: 'X'"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            loader.get('X')
+
+    def test_build_index_path(self):
+        index_path = os.path.join(self.path, 'index')
+        loader = CountryLoader(path=self.path, index_path=index_path)
+        exp = [e.script for e in loader.get('jpn')]
+        loader.build_index()
+        self.assertEqual(sorted(os.listdir(index_path)), ['rings.npy', 'rings_index.npz'])
+        self.assertFalse(os.path.exists(os.path.join(self.path, 'rings.npy')))
+
+        # the loader reads the index from the output directory
+        other = os.path.join(self.path, 'other')
+        loader = CountryLoader(path=self.path)
+        loader.build_index(path=other)
+        self.assertTrue(os.path.exists(os.path.join(other, 'rings.npy')))
+        os.remove(os.path.join(self.path, 'data', 'jpn.geo.json'))
+        self.assertEqual([e.script for e in loader.get('jpn')], exp)
+
+        # the bundled data is indexed into the user cache directory
+        from cesiumpy.data.country import data_path
+        loader = CountryLoader()
+        self.assertFalse(loader._index_path.startswith(data_path))
+
+    def test_memo_readonly(self):
+        loader = CountryLoader(path=self.path)
+        jpn = loader.get('jpn')
+        exp = [e.script for e in jpn]
+        with nose.tools.assert_raises(ValueError):
+            jpn[0].hierarchy.x[0] = 0.
+
+        loader.build_index()
+        loader = CountryLoader(path=self.path)
+        jpn = loader.get('jpn')
+        with nose.tools.assert_raises(ValueError):
+            jpn[0].hierarchy.x[0] = 0.
+        self.assertEqual([e.script for e in loader.get('jpn')], exp)
+
+
 if __name__ == '__main__':
     nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
                    exit=False)
@@ -3,13 +3,21 @@
 
 from __future__ import unicode_literals
 
+import json
+import six
 import traitlets
 
 from cesiumpy.base import _CesiumObject
 import cesiumpy.entities.color
+from cesiumpy.options import options
 import cesiumpy.util.common as com
 from cesiumpy.util.trait import MaybeTrait, URITrait
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class DataSource(_CesiumObject):
 
@@ -20,17 +28,21 @@ class DataSource(_CesiumObject):
     def __init__(self, sourceUri):
         self.sourceUri = sourceUri
 
+    @property
+    def _source(self):
+        return '"{0}"'.format(self.sourceUri)
+
     @property
     def script(self):
         props = com.to_jsobject(self._property_dict)
         props = ''.join(props)
         if props != '':
-            script = """{klass}.load("{source}", {props})"""
+            script = """{klass}.load({source}, {props})"""
             script = script.format(klass=self._klass,
-                                   source=self.sourceUri, props=''.join(props))
+                                   source=self._source, props=''.join(props))
         else:
-            script = """{klass}.load("{source}")"""
-            script = script.format(klass=self._klass, source=self.sourceUri)
+            script = """{klass}.load({source})"""
+            script = script.format(klass=self._klass, source=self._source)
         return script
 
     @classmethod
@@ -56,8 +68,11 @@ class GeoJsonDataSource(DataSource):
     Parameters
     ----------
 
-    sourceUri : str
-        Overrides the url to use for resolving relative links.
+    sourceUri : str, dict, file-like or object which has __geo_interface__
+        The url of GeoJSON to load. Otherwise, GeoJSON data is embedded
+        into the script as compact JSON. It can be a dict, an opened
+        file or an object which has ``__geo_interface__``, such as
+        ``geopandas.GeoDataFrame`` and shapely geometries.
     describe : GeoJsonDataSource~describe, default GeoJsonDataSource.defaultDescribeProperty
         A function which returns a Property object (or just a string), which converts the properties into an html description.
     markerSize : int, default GeoJsonDataSource.markerSize
@@ -72,6 +87,10 @@ class GeoJsonDataSource(DataSource):
         The default width of polylines and polygon outlines.
     fill : Color, default GeoJsonDataSource.fill
         The default color for polygon interiors.
+    precision : int, default None
+        Number of decimals of coordinates in embedded GeoJSON, 6 decimals
+        is about 0.1 m. If None, the precision of the Viewer or
+        cesiumpy.options.precision is used when the script is generated.
     """
 
     _props = ['describe', 'markerSize', 'markerSymbol', 'markerColor',
@@ -84,10 +103,23 @@ class GeoJsonDataSource(DataSource):
     strokeWidth = traitlets.Float(allow_none=True)
     fill = MaybeTrait(klass=cesiumpy.color.Color, allow_none=True)
 
+    # embedded GeoJSON, serialized when the script is generated
+    data = traitlets.Dict(allow_none=True)
+    precision = traitlets.Int(allow_none=True)
+
     def __init__(self, sourceUri, describe=None, markerSize=None,
                  markerSymbol=None, markerColor=None, stroke=None,
-                 strokeWidth=None, fill=None):
-        super(GeoJsonDataSource, self).__init__(sourceUri=sourceUri)
+                 strokeWidth=None, fill=None, precision=None):
+        if isinstance(sourceUri, six.string_types):
+            super(GeoJsonDataSource, self).__init__(sourceUri=sourceUri)
+            self.data = None
+        else:
+            self.data = _load_geojson(sourceUri)
+
+        if precision is not None and precision < 0:
+            msg = 'precision must be a non-negative integer: {x}'
+            raise ValueError(msg.format(x=precision))
+        self.precision = precision
 
         self.describe = com.notimplemented(describe)
 
@@ -98,6 +130,81 @@ class GeoJsonDataSource(DataSource):
         self.strokeWidth = strokeWidth
         self.fill = fill
 
+    @property
+    def _source(self):
+        if self.data is None:
+            return super(GeoJsonDataSource, self)._source
+        precision = self.precision
+        if precision is None:
+            # the Viewer precision is applied to options during the script generation
+            precision = options.precision
+        return _to_geojson_text(self.data, precision=precision)
+
+
+def _load_geojson(data):
+    """ Convert GeoJSON-like data to dict """
+    if hasattr(data, '__geo_interface__'):
+        data = data.__geo_interface__
+    elif hasattr(data, 'read'):
+        data = json.load(data)
+
+    if not isinstance(data, dict):
+        msg = 'sourceUri must be str, dict, file-like or object which has __geo_interface__: {x}'
+        raise ValueError(msg.format(x=type(data).__name__))
+    return data
+
+
+def _to_geojson_text(data, precision=None):
+    """
+    Convert GeoJSON-like dict to compact JSON text which can be embedded
+    in the script
+    """
+    if precision is not None:
+        data = _round_geojson(data, precision)
+
+    text = json.dumps(data, separators=(',', ':'), default=_json_default)
+    # avoid closing <script> tag within the embedded text
+    return text.replace('</', '<\\/')
+
+
+def _round_geojson(x, precision):
+    """ round coordinates in GeoJSON-like mapping, properties are kept """
+    if isinstance(x, dict):
+        results = {}
+        for key, value in six.iteritems(x):
+            if key in ('coordinates', 'bbox'):
+                value = _round_coordinates(value, precision)
+            elif key != 'properties':
+                value = _round_geojson(value, precision)
+            results[key] = value
+        return results
+    elif isinstance(x, (list, tuple)):
+        return [_round_geojson(e, precision) for e in x]
+    return x
+
+
+def _round_coordinates(x, precision):
+    if isinstance(x, float):
+        return round(x, precision)
+    elif isinstance(x, (list, tuple)) or hasattr(x, '__array__'):
+        if np is not None:
+            try:
+                # round all positions at once
+                return np.round(np.asarray(x, dtype=np.float64), precision).tolist()
+            except ValueError:
+                # ragged, such as polygon with holes
+                pass
+        return [_round_coordinates(e, precision) for e in x]
+    return x
+
+
+def _json_default(x):
+    # numpy scalar and array
+    if hasattr(x, 'tolist'):
+        return x.tolist()
+    msg = 'Unable to convert to JSON: {x}'
+    raise TypeError(msg.format(x=x))
+
 
 class KmlDataSource(DataSource):
     """
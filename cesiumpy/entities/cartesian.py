@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 import traitlets
 
 from cesiumpy.base import _CesiumObject
+from cesiumpy.options import options
 import cesiumpy.extension.geocode as geocode
 import cesiumpy.extension.shapefile as shapefile
 import cesiumpy.util.common as com
@@ -76,10 +77,10 @@ class Cartesian2(_Cartesian):
     def __repr__(self):
         if self._is_degrees:
             rep = """Cartesian2.fromDegrees({x}, {y})"""
-            return rep.format(x=self.x, y=self.y)
+            return rep.format(x=com.to_jsscalar(self.x), y=com.to_jsscalar(self.y))
         else:
             rep = """Cartesian2({x}, {y})"""
-            return rep.format(x=self.x, y=self.y)
+            return rep.format(x=com.to_jsscalar(self.x), y=com.to_jsscalar(self.y))
 
     @classmethod
     def maybe(cls, x, degrees=False):
@@ -115,7 +116,12 @@ class Cartesian3(_Cartesian):
         return Cartesian3(x, y, z, degrees=True)
 
     @classmethod
-    def fromDegreesArray(cls, x):
+    def fromDegreesArray(cls, x, copy=True):
+        if hasattr(x, 'dtype') and x.dtype.kind in 'iuf':
+            # numeric array, use it without converting to list
+            heights = x.ndim == 2 and x.shape[1] == 3
+            return Cartesian3Array(x, heights=heights, copy=copy)
+
         # convert shaply.Polygon to coordinateslist
         x = shapefile._maybe_shapely_polygon(x)
         x = shapefile._maybe_shapely_line(x)
@@ -124,17 +130,26 @@ class Cartesian3(_Cartesian):
         if com.is_listlike_2elem(x):
             x = com._flatten_list_of_listlike(x)
         elif com.is_listlike_3elem(x):
-            raise NotImplementedError
+            x = com._flatten_list_of_listlike(x)
+            return Cartesian3Array(x, heights=True)
 
         return Cartesian3Array(x)
 
+    @classmethod
+    def fromDegreesArrayHeights(cls, x, copy=True):
+        if com.is_listlike_3elem(x):
+            x = com._flatten_list_of_listlike(x)
+        return Cartesian3Array(x, heights=True, copy=copy)
+
     def __repr__(self):
         if self._is_degrees:
             rep = """Cartesian3.fromDegrees({x}, {y}, {z})"""
-            return rep.format(x=self.x, y=self.y, z=self.z)
+            return rep.format(x=com.to_jsscalar(self.x), y=com.to_jsscalar(self.y),
+                              z=com.to_jsscalar(self.z))
         else:
             rep = """Cartesian3({x}, {y}, {z})"""
-            return rep.format(x=self.x, y=self.y, z=self.z)
+            return rep.format(x=com.to_jsscalar(self.x), y=com.to_jsscalar(self.y),
+                              z=com.to_jsscalar(self.z))
 
     @classmethod
     def maybe(cls, x, degrees=False):
@@ -157,23 +172,93 @@ class Cartesian3(_Cartesian):
 
 
 class Cartesian3Array(_Cartesian):
+    """
+    Array of Cartesian3 in degrees. Numeric array input is held as
+    read-only contiguous float64 array, (N, 2) or (N, 3) shaped array is
+    regarded as the list of coordinates.
+
+    The input array is copied unless it is read-only, because the script
+    is cached and modifying the input in place doesn't invalidate it.
+    ``copy=False`` holds a view of the input if it already is contiguous
+    float64, then the input must not be modified afterwards.
+    """
 
     _is_array = True
+    # whether the array consists from longitude, latitude and height
+    _heights = traitlets.Bool()
 
-    def __init__(self, x):
+    def __init__(self, x, heights=False, copy=True):
         if isinstance(x, Cartesian3Array):
+            heights = x._heights
             x = x.x
 
-        self.x = com.validate_listlike_lonlat(x, 'x')
+        if hasattr(x, '__array__'):
+            x = _as_coordinates_array(x, heights, key='x', copy=copy)
+
+        if heights:
+            self.x = com.validate_listlike_lonlatheight(x, 'x')
+        else:
+            self.x = com.validate_listlike_lonlat(x, 'x')
+        self._heights = heights
         # currently, array always be degrees
         self._is_degrees = True
 
     def __len__(self):
         return len(self.x)
 
+    @property
+    def _method(self):
+        return 'fromDegreesArrayHeights' if self._heights else 'fromDegreesArray'
+
     def __repr__(self):
-        rep = """Cartesian3.fromDegreesArray({x})"""
-        return rep.format(x=self.x)
+        rep = """Cartesian3.{method}({x})"""
+        return rep.format(method=self._method, x=com.to_jsscalar(self.x))
+
+    @property
+    def script(self):
+        if options.array_encoding == 'text':
+            return super(Cartesian3Array, self).script
+        rep = """Cesium.Cartesian3.{method}({x})"""
+        return rep.format(method=self._method,
+                          x=com.to_jsbinary(self.x, options.array_encoding))
+
+
+def _as_coordinates_array(x, heights, key, copy=True):
+    """ convert array to 1-dimensional read-only float64 array """
+    np = com._check_package('numpy')
+    values = np.asarray(x)
+    if values.dtype.kind not in 'iuf':
+        # let validation raise
+        return x
+
+    if values.ndim == 2:
+        width = 3 if heights else 2
+        if values.shape[1] != width:
+            msg = '{key} must be an array which has {width} columns: {x}'
+            raise ValueError(msg.format(key=key, width=width, x=values))
+        # view if the array is C-contiguous
+        values = values.ravel()
+    # view if the input is already contiguous float64
+    result = np.ascontiguousarray(values, dtype=np.float64)
+    if np.may_share_memory(result, x):
+        # modifying the input must not change the cached script
+        if copy and not _is_readonly(result):
+            result = result.copy()
+        else:
+            # not to change flags of the input
+            result = result.view()
+    result.setflags(write=False)
+    return result
+
+
+def _is_readonly(x):
+    """ whether the array and all of its bases are read-only """
+    np = com._check_package('numpy')
+    while isinstance(x, np.ndarray):
+        if x.flags.writeable:
+            return False
+        x = x.base
+    return True
 
 
 class Cartesian4(_Cartesian):
@@ -203,10 +288,12 @@ class Cartesian4(_Cartesian):
     def __repr__(self):
         if self._is_degrees:
             rep = """Cartesian4.fromDegrees({x}, {y}, {z}, {w})"""
-            return rep.format(x=self.x, y=self.y, z=self.z, w=self.w)
+            return rep.format(x=com.to_jsscalar(self.x), y=com.to_jsscalar(self.y),
+                              z=com.to_jsscalar(self.z), w=com.to_jsscalar(self.w))
         else:
             rep = """Cartesian4({x}, {y}, {z}, {w})"""
-            return rep.format(x=self.x, y=self.y, z=self.z, w=self.w)
+            return rep.format(x=com.to_jsscalar(self.x), y=com.to_jsscalar(self.y),
+                              z=com.to_jsscalar(self.z), w=com.to_jsscalar(self.w))
 
     @classmethod
     def maybe(cls, x, degrees=False):
@@ -250,7 +337,8 @@ class Rectangle(_Cartesian):
     @property
     def _inner_repr(self):
         rep = "west={west}, south={south}, east={east}, north={north}"
-        return rep.format(west=self.west, south=self.south, east=self.east, north=self.north)
+        return rep.format(west=com.to_jsscalar(self.west), south=com.to_jsscalar(self.south),
+                          east=com.to_jsscalar(self.east), north=com.to_jsscalar(self.north))
 
     def __repr__(self):
         # show more detailed repr, as arg order is not easy to remember
@@ -264,10 +352,12 @@ class Rectangle(_Cartesian):
         # we can't use repr as it is like other Cartesian
         if self._is_degrees:
             rep = """Cesium.Rectangle.fromDegrees({west}, {south}, {east}, {north})"""
-            return rep.format(west=self.west, south=self.south, east=self.east, north=self.north)
+            return rep.format(west=com.to_jsscalar(self.west), south=com.to_jsscalar(self.south),
+                              east=com.to_jsscalar(self.east), north=com.to_jsscalar(self.north))
         else:
             rep = """new Cesium.Rectangle({west}, {south}, {east}, {north})"""
-            return rep.format(west=self.west, south=self.south, east=self.east, north=self.north)
+            return rep.format(west=com.to_jsscalar(self.west), south=com.to_jsscalar(self.south),
+                              east=com.to_jsscalar(self.east), north=com.to_jsscalar(self.north))
 
     @classmethod
     def maybe(cls, x):
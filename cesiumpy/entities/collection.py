@@ -0,0 +1,877 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+from __future__ import unicode_literals
+
+import collections
+import copy
+import json
+import six
+
+import cesiumpy
+from cesiumpy.base import _CesiumObject
+import cesiumpy.util.common as com
+
+
+# --------------------------------------------------
+# Columns
+# --------------------------------------------------
+
+
+class _Column(object):
+    """
+    Column of an entity collection. Holds either a scalar which is shared by
+    all entities, or an array which has a value per entity.
+    """
+
+    def __init__(self, values, length, key):
+        self.key = key
+        self.values = None
+        self.is_array = False
+
+    def _validate_length(self, values, length):
+        if len(values) != length:
+            msg = "{key} length must be {length}: {x}"
+            raise ValueError(msg.format(key=self.key, length=length, x=values))
+        return values
+
+    def expression(self, data, palettes):
+        """
+        Return JavaScript expression to refer the value of i-th entity.
+        Array values are registered to data (and palettes) to be emitted once.
+        """
+        raise NotImplementedError
+
+    def take(self, indices):
+        """ Return column which has values of the specified entities """
+        column = copy.copy(self)
+        if self.is_array:
+            column.values = self._take_values(indices)
+        return column
+
+    def _take_values(self, indices):
+        raise NotImplementedError
+
+
+class _NumericColumn(_Column):
+
+    def __init__(self, values, length, key):
+        super(_NumericColumn, self).__init__(values, length, key)
+        np = com._check_package('numpy')
+
+        if com.is_listlike(values):
+            values = np.asarray(values, dtype=np.float64).ravel()
+            self.values = self._validate_length(values, length)
+            self.is_array = True
+        else:
+            if isinstance(values, np.generic):
+                values = values.item()
+            self.values = com.validate_numeric_or_none(values, key=key)
+
+    def expression(self, data, palettes):
+        if self.is_array:
+            data[self.key] = self.values
+            return 'd.{key}[i]'.format(key=self.key)
+        elif self.values is not None:
+            return com.to_jsscalar(float(self.values))
+        return None
+
+    def _take_values(self, indices):
+        return self.values[indices]
+
+
+class _TextColumn(_Column):
+
+    def __init__(self, values, length, key):
+        super(_TextColumn, self).__init__(values, length, key)
+
+        if com.is_listlike(values):
+            values = [v if v is None else six.text_type(v) for v in values]
+            self.values = self._validate_length(values, length)
+            self.is_array = True
+            if all(v is None for v in values):
+                self.values = None
+                self.is_array = False
+        elif values is not None:
+            self.values = six.text_type(values)
+
+    def expression(self, data, palettes):
+        if self.is_array:
+            data[self.key] = self.values
+            return 'd.{key}[i]'.format(key=self.key)
+        elif self.values is not None:
+            return json.dumps(self.values)
+        return None
+
+    def _take_values(self, indices):
+        return [self.values[i] for i in indices]
+
+
+class _ColorColumn(_Column):
+    """
+    Colors are stored as a palette of unique colors and integer codes
+    which refer the palette.
+    """
+
+    def __init__(self, values, length, key):
+        super(_ColorColumn, self).__init__(values, length, key)
+        np = com._check_package('numpy')
+
+        if values is None:
+            return
+
+        if isinstance(values, np.ndarray) and values.ndim == 2:
+            # RGB(A) array which has a row per entity
+            if values.shape[1] not in (3, 4):
+                msg = '{key} must be an array which has 3 or 4 columns: {x}'
+                raise ValueError(msg.format(key=key, x=values))
+            values = self._validate_length(values, length)
+            uniques, codes = np.unique(values, axis=0, return_inverse=True)
+            palette = [cesiumpy.color.Color(*row).script
+                       for row in uniques.tolist()]
+            codes = codes.ravel()
+        elif com.is_listlike(values) and not all(com.is_numeric(v) for v in values):
+            values = self._validate_length(values, length)
+            indexer = collections.OrderedDict()
+            codes = np.empty(length, dtype=np.int64)
+            for i, c in enumerate(values):
+                script = cesiumpy.color.Color.maybe(c).script
+                codes[i] = indexer.setdefault(script, len(indexer))
+            palette = list(indexer)
+        else:
+            # single color, includes a tuple like (1., 0., 0.)
+            self.values = cesiumpy.color.Color.maybe(values)
+            return
+
+        self._set_palette(codes, palette)
+
+    def _set_palette(self, codes, palette):
+        if len(palette) == 1:
+            # all entities have the same color
+            self.values = palette[0]
+        else:
+            self.values = (codes, palette)
+            self.is_array = True
+
+    @classmethod
+    def from_codes(cls, codes, colors, length, key):
+        """
+        Create column from integer codes which refer the list of colors,
+        without finding unique colors of all entities
+        """
+        column = cls(None, length, key)
+        codes = column._validate_length(codes, length)
+        palette = [cesiumpy.color.Color.maybe(c).script for c in colors]
+        column._set_palette(codes, palette)
+        return column
+
+    def expression(self, data, palettes):
+        if self.is_array:
+            codes, palette = self.values
+            data[self.key] = codes
+            palettes[self.key] = palette
+            return 'p.{key}[d.{key}[i]]'.format(key=self.key)
+        elif self.values is not None:
+            return getattr(self.values, 'script', self.values)
+        return None
+
+    def _take_values(self, indices):
+        codes, palette = self.values
+        return codes[indices], palette
+
+
+# --------------------------------------------------
+# Collections
+# --------------------------------------------------
+
+
+def _to_jsliteral(x):
+    """ convert dict of JavaScript expressions to JavaScript Object """
+    items = ['{0} : {1}'.format(k, v) for k, v in six.iteritems(x)
+             if v is not None]
+    return '{{{0}}}'.format(', '.join(items))
+
+
+def _to_jsdata(values):
+    if hasattr(values, 'dtype'):
+        # numeric array, use the serializer to apply precision
+        return com.to_jsscalar(values)
+    return json.dumps(values)
+
+
+def _validate_lonlat(x, y):
+    """ validate longitudes and latitudes, return them as float arrays """
+    np = com._check_package('numpy')
+
+    # do not use validate_listlike, which converts an array to list
+    for key, values in [('x', x), ('y', y)]:
+        if not com.is_listlike(values):
+            msg = '{key} must be list-likes: {x}'
+            raise ValueError(msg.format(key=key, x=values))
+    x = np.asarray(x, dtype=np.float64).ravel()
+    y = np.asarray(y, dtype=np.float64).ravel()
+    if len(x) != len(y):
+        msg = "y length must be {length}: {x}"
+        raise ValueError(msg.format(length=len(x), x=y))
+
+    if len(x) > 0:
+        if x.min() < -180 or x.max() > 180:
+            raise ValueError('x must be longitude, between -180 to 180')
+        if y.min() < -90 or y.max() > 90:
+            raise ValueError('y must be latitude, between -90 to 90')
+    return x, y
+
+
+def _array_bounds(coordinates):
+    if len(coordinates) == 0:
+        return None
+    return (coordinates[:, 0].min(), coordinates[:, 1].min(),
+            coordinates[:, 0].max(), coordinates[:, 1].max())
+
+
+class _EntityCollection(_CesiumObject):
+    """
+    Base class for columnar entity collections. Values are stored as arrays,
+    and the script is a single JavaScript function which adds all entities
+    to the passed EntityCollection.
+    """
+
+    # class property, used by RistrictedList
+    _is_collection = True
+
+    _props = []
+    # JavaScript statements to be evaluated before the loop
+    _variables = []
+    # JavaScript statements to convert d.position and loop over entities
+    _positions_script = None
+    _loop_script = None
+
+    def _set_column(self, key, values, column):
+        self._columns[key] = column(values, len(self), key=key)
+
+    @property
+    def bounds(self):
+        raise NotImplementedError
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def __repr__(self):
+        rep = """{klass}(length={length})"""
+        return rep.format(klass=self.__class__.__name__, length=len(self))
+
+    def _graphics(self, data, palettes):
+        graphics = collections.OrderedDict()
+        for key in self._props:
+            graphics[key] = self._columns[key].expression(data, palettes)
+        return graphics
+
+    def _entity(self, data, palettes):
+        """ Store arrays to data and return the entity to be added """
+        raise NotImplementedError
+
+    def _row_bounds(self):
+        """ Return arrays of minx, miny, maxx and maxy of each entity """
+        raise NotImplementedError
+
+    def _take(self, indices):
+        """ Return copy which has only the specified entities """
+        result = copy.copy(self)
+        result._columns = collections.OrderedDict((key, column.take(indices))
+                                                  for key, column in six.iteritems(self._columns))
+        return result
+
+    def _clip(self, bboxes):
+        """
+        Return copy which has only entities intersect with any of bboxes,
+        or None if no entity intersects
+        """
+        np = com._check_package('numpy')
+
+        minx, miny, maxx, maxy = self._row_bounds()
+        mask = np.zeros(len(self), dtype=bool)
+        for west, south, east, north in bboxes:
+            inside = (minx <= east) & (west <= maxx)
+            inside &= (miny <= north) & (south <= maxy)
+            mask |= inside
+        if mask.all():
+            return self
+        indices = np.flatnonzero(mask)
+        if len(indices) == 0:
+            return None
+        return self._take(indices)
+
+    @property
+    def script(self):
+        data = collections.OrderedDict()
+        palettes = collections.OrderedDict()
+        entity = self._entity(data, palettes)
+
+        d = collections.OrderedDict((k, _to_jsdata(v)) for k, v in six.iteritems(data))
+
+        results = ['function (entities) {']
+        results.append('var d = {0};'.format(_to_jsliteral(d)))
+        if len(palettes) > 0:
+            p = collections.OrderedDict((k, '[{0}]'.format(', '.join(v)))
+                                        for k, v in six.iteritems(palettes))
+            results.append('var p = {0};'.format(_to_jsliteral(p)))
+        results.extend(self._variables)
+        results.append(self._positions_script)
+        results.append(self._loop_script)
+        results.append('entities.add({0});'.format(_to_jsliteral(entity)))
+        results.append('}')
+        results.append('}')
+        return ' '.join(results)
+
+
+class _PointCollection(_EntityCollection):
+    """
+    Base class for collections of entities which have a single position
+    """
+
+    _positions_script = 'var pos = Cesium.Cartesian3.fromDegreesArrayHeights(d.position);'
+    _loop_script = 'for (var i = 0; i < pos.length; i++) {'
+
+    def __init__(self, x, y, z=None, name=None):
+        np = com._check_package('numpy')
+
+        x, y = _validate_lonlat(x, y)
+
+        positions = np.empty((len(x), 3), dtype=np.float64)
+        positions[:, 0] = x
+        positions[:, 1] = y
+        if z is None:
+            z = 0.
+        positions[:, 2] = _NumericColumn(z, len(x), key='z').values
+        self._positions = positions
+
+        self._columns = collections.OrderedDict()
+        self._set_column('name', name, _TextColumn)
+
+    @property
+    def position(self):
+        """ (N, 3) array of longitude, latitude and height """
+        return self._positions
+
+    @property
+    def bounds(self):
+        """ (minx, miny, maxx, maxy) of positions in degrees, None if empty """
+        return _array_bounds(self._positions)
+
+    def __len__(self):
+        return len(self._positions)
+
+    def _row_bounds(self):
+        x, y = self._positions[:, 0], self._positions[:, 1]
+        return x, y, x, y
+
+    def _take(self, indices):
+        result = super(_PointCollection, self)._take(indices)
+        result._positions = self._positions[indices]
+        return result
+
+    def _entity(self, data, palettes):
+        data['position'] = self._positions.ravel()
+
+        entity = collections.OrderedDict()
+        entity['name'] = self._columns['name'].expression(data, palettes)
+        entity['position'] = 'pos[i]'
+        entity[self._klass] = _to_jsliteral(self._graphics(data, palettes))
+        return entity
+
+
+class PointCollection(_PointCollection):
+    """
+    Columnar collection of PointGraphics. Values are kept as arrays and
+    converted to a single JavaScript loop on output, which is much lighter
+    than creating a Point instance per location.
+
+    Parameters
+    ----------
+
+    x : list
+        List of longitudes
+    y : list
+        List of latitudes
+    z : list or float, default 0.
+        Heights
+    pixelSize : list or float, default 10
+        Pixel size
+    color : list, array of RGB(A) values or Color, default WHITE
+        Point color
+    outlineColor : list, array of RGB(A) values or Color
+        Outline color
+    outlineWidth : list or float
+        Outline width in pixels
+    name : list or str
+        Entity name
+    """
+
+    _klass = 'point'
+    _props = ['pixelSize', 'color', 'outlineColor', 'outlineWidth']
+
+    def __init__(self, x, y, z=None, pixelSize=10, color=None,
+                 outlineColor=None, outlineWidth=None, name=None):
+        super(PointCollection, self).__init__(x, y, z=z, name=name)
+
+        if pixelSize is None:
+            pixelSize = 10
+        if color is None:
+            # Add default color explicitly, as same as Point
+            color = cesiumpy.color.WHITE
+
+        self._set_column('pixelSize', pixelSize, _NumericColumn)
+        self._set_column('color', color, _ColorColumn)
+        self._set_column('outlineColor', outlineColor, _ColorColumn)
+        self._set_column('outlineWidth', outlineWidth, _NumericColumn)
+
+
+class ClusterCollection(PointCollection):
+    """
+    PointCollection which aggregates points into grid cells. Each cell which
+    contains points is drawn as a single point at the mean location, whose
+    size and color are scaled by the number of points.
+
+    Parameters
+    ----------
+
+    x : list
+        List of longitudes
+    y : list
+        List of latitudes
+    z : list or float, default 0.
+        Heights, averaged per cell
+    radius : float, default 1.
+        Half width of a grid cell in degrees
+    pixelSize : tuple of (min, max) or float, default (5, 30)
+        Pixel size of the cell which has the fewest and the most points
+    color : ColorMap or Color, default YELLOW to RED
+        Colormap to map the number of points, or a single color
+    outlineColor : Color
+        Outline color
+    outlineWidth : float
+        Outline width in pixels
+    name : list or str
+        Entity name
+
+    Attributes
+    ----------
+
+    statistics : OrderedDict
+        Arrays which have a value per cell, "count" is the number of points,
+        "x", "y" and "z" are means, "minx", "miny", "maxx" and "maxy" are
+        bounds of the points.
+    """
+
+    def __init__(self, x, y, z=None, radius=1., pixelSize=(5, 30), color=None,
+                 outlineColor=None, outlineWidth=None, name=None):
+        np = com._check_package('numpy')
+
+        stats = grid_cluster(x, y, z=z, radius=radius)
+        self.statistics = stats
+
+        count = stats['count']
+        # normalized log count, 0 for the smallest and 1 for the largest cell
+        scale = np.log(count)
+        if len(scale) > 0 and scale.max() > 0:
+            scale /= scale.max()
+
+        if pixelSize is None:
+            pixelSize = (5, 30)
+        if com.is_listlike(pixelSize):
+            if len(pixelSize) != 2:
+                msg = 'pixelSize must be a tuple of (min, max) or float: {x}'
+                raise ValueError(msg.format(x=pixelSize))
+            low, high = pixelSize
+            pixelSize = low + (high - low) * scale
+
+        colormap = color is None or isinstance(color, cesiumpy.entities.color.ColorMap)
+        super(ClusterCollection, self).__init__(stats['x'], stats['y'],
+                                                z=stats['z'], pixelSize=pixelSize,
+                                                color=None if colormap else color,
+                                                outlineColor=outlineColor,
+                                                outlineWidth=outlineWidth, name=name)
+
+        if colormap:
+            # quantize to limit the number of colors in the palette
+            levels = np.round(scale * (_CLUSTER_COLORS - 1)) / (_CLUSTER_COLORS - 1)
+            levels, codes = np.unique(levels, return_inverse=True)
+            if color is None:
+                # YELLOW to RED
+                colors = [(1., 1. - level, 0.) for level in levels.tolist()]
+            else:
+                colors = color.cm(levels).tolist()
+            self._columns['color'] = _ColorColumn.from_codes(codes.ravel(), colors,
+                                                             len(self), key='color')
+
+    @property
+    def count(self):
+        """ number of points per cell """
+        return self.statistics['count']
+
+    def _take(self, indices):
+        result = super(ClusterCollection, self)._take(indices)
+        result.statistics = collections.OrderedDict((key, values[indices])
+                                                    for key, values in six.iteritems(self.statistics))
+        return result
+
+
+# number of colors to map the number of points in ClusterCollection
+_CLUSTER_COLORS = 16
+
+# grid cells are counted by a dense array if the grid is smaller than this
+_DENSE_CELLS = 1 << 22
+
+
+def grid_cluster(x, y, z=None, radius=1.):
+    """
+    Aggregate points into grid cells whose width is 2 * radius degrees
+
+    Parameters
+    ----------
+
+    x : list
+        List of longitudes
+    y : list
+        List of latitudes
+    z : list or float, default 0.
+        Heights
+    radius : float, default 1.
+        Half width of a grid cell in degrees
+
+    Returns
+    -------
+
+    statistics : OrderedDict
+        Arrays which have a value per non-empty cell, ordered by cell.
+        See ClusterCollection.
+    """
+    np = com._check_package('numpy')
+
+    x, y = _validate_lonlat(x, y)
+    z = _NumericColumn(0. if z is None else z, len(x), key='z').values
+
+    radius = com.validate_numeric(radius, key='radius')
+    if radius <= 0:
+        msg = 'radius must be positive: {x}'
+        raise ValueError(msg.format(x=radius))
+
+    size = 2. * radius
+    ncols = int(np.ceil(360. / size)) + 1
+    nrows = int(np.ceil(180. / size)) + 1
+    rows = np.floor((y + 90.) / size).astype(np.int64)
+    cells = rows * ncols + np.floor((x + 180.) / size).astype(np.int64)
+
+    if nrows * ncols <= _DENSE_CELLS:
+        count = np.bincount(cells, minlength=nrows * ncols)
+        occupied = np.flatnonzero(count)
+        # map cell number to the position in the result
+        codes = np.empty(nrows * ncols, dtype=np.int64)
+        codes[occupied] = np.arange(len(occupied))
+        codes = codes[cells]
+        count = count[occupied]
+    else:
+        occupied, codes, count = np.unique(cells, return_inverse=True,
+                                           return_counts=True)
+        codes = codes.ravel()
+
+    n = len(occupied)
+    stats = collections.OrderedDict()
+    stats['count'] = count.astype(np.int64)
+    for key, values in [('x', x), ('y', y)]:
+        stats[key] = np.bincount(codes, weights=values, minlength=n) / count
+    if com.is_listlike(z):
+        stats['z'] = np.bincount(codes, weights=z, minlength=n) / count
+    else:
+        stats['z'] = np.full(n, z, dtype=np.float64)
+
+    for func, initial, prefix in [(np.minimum, np.inf, 'min'),
+                                  (np.maximum, -np.inf, 'max')]:
+        for key, values in [('x', x), ('y', y)]:
+            result = np.full(n, initial)
+            func.at(result, codes, values)
+            stats[prefix + key] = result
+    return stats
+
+
+class LabelCollection(_PointCollection):
+    """
+    Columnar collection of LabelGraphics.
+
+    Parameters
+    ----------
+
+    x : list
+        List of longitudes
+    y : list
+        List of latitudes
+    z : list or float, default 0.
+        Heights
+    text : list or str
+        Label text
+    fillColor : list, array of RGB(A) values or Color
+        Text color
+    scale : list or float
+        Scale to apply to the text
+    name : list or str
+        Entity name
+    """
+
+    _klass = 'label'
+    _props = ['text', 'fillColor', 'scale']
+
+    def __init__(self, x, y, z=None, text=None, fillColor=None, scale=None,
+                 name=None):
+        super(LabelCollection, self).__init__(x, y, z=z, name=name)
+
+        self._set_column('text', text, _TextColumn)
+        self._set_column('fillColor', fillColor, _ColorColumn)
+        self._set_column('scale', scale, _NumericColumn)
+
+
+class PinCollection(_PointCollection):
+    """
+    Columnar collection of BillboardGraphics which image is Pin.
+
+    Parameters
+    ----------
+
+    x : list
+        List of longitudes
+    y : list
+        List of latitudes
+    z : list or float, default 0.
+        Heights
+    text : list or str
+        Text of the pin
+    size : list or float, default 48
+        Size of the pin
+    color : list, array of RGB(A) values or Color, default ROYALBLUE
+        Color of the pin
+    name : list or str
+        Entity name
+    """
+
+    _klass = 'billboard'
+    _props = ['text', 'size', 'color']
+    _variables = ['var pb = new Cesium.PinBuilder();']
+
+    def __init__(self, x, y, z=None, text=None, size=48, color=None,
+                 name=None):
+        super(PinCollection, self).__init__(x, y, z=z, name=name)
+
+        if size is None:
+            size = 48
+        if color is None:
+            # default color, as same as Pin
+            color = cesiumpy.color.ROYALBLUE
+
+        self._set_column('text', text, _TextColumn)
+        self._set_column('size', size, _NumericColumn)
+        self._set_column('color', color, _ColorColumn)
+
+    def _graphics(self, data, palettes):
+        text = self._columns['text'].expression(data, palettes)
+        size = self._columns['size'].expression(data, palettes)
+        color = self._columns['color'].expression(data, palettes)
+
+        # PinBuilder caches created images internally
+        fromColor = """pb.fromColor({color}, {size})"""
+        fromColor = fromColor.format(color=color, size=size)
+        fromText = """pb.fromText({text}, {color}, {size})"""
+        fromText = fromText.format(text=text, color=color, size=size)
+
+        if text is None:
+            image = fromColor
+        elif self._columns['text'].is_array:
+            # text may contain null
+            image = """{text} === null ? {fromColor} : {fromText}"""
+            image = image.format(text=text, fromColor=fromColor,
+                                 fromText=fromText)
+        else:
+            image = fromText
+
+        graphics = collections.OrderedDict()
+        graphics['image'] = image
+        return graphics
+
+
+class CylinderCollection(_PointCollection):
+    """
+    Columnar collection of CylinderGraphics.
+
+    Parameters
+    ----------
+
+    x : list
+        List of longitudes
+    y : list
+        List of latitudes
+    z : list or float, default 0.
+        Heights of the cylinder center
+    length : list or float
+        Length of the cylinder
+    topRadius : list or float
+        Radius of the top of the cylinder
+    bottomRadius : list or float
+        Radius of the bottom of the cylinder
+    material : list, array of RGB(A) values or Color
+        Color of the cylinder
+    name : list or str
+        Entity name
+    """
+
+    _klass = 'cylinder'
+    _props = ['length', 'topRadius', 'bottomRadius', 'material']
+
+    def __init__(self, x, y, z=None, length=None, topRadius=None,
+                 bottomRadius=None, material=None, name=None):
+        super(CylinderCollection, self).__init__(x, y, z=z, name=name)
+
+        self._set_column('length', length, _NumericColumn)
+        self._set_column('topRadius', topRadius, _NumericColumn)
+        self._set_column('bottomRadius', bottomRadius, _NumericColumn)
+        self._set_column('material', material, _ColorColumn)
+
+
+class PolygonCollection(_EntityCollection):
+    """
+    Columnar collection of PolygonGraphics. Coordinates of all polygons are
+    stored as a single array, and sliced per polygon in JavaScript.
+
+    Parameters
+    ----------
+
+    coordinates : list of (N, 2) arrays, or (N, 2) array with offsets
+        Longitudes and latitudes of each polygon
+    offsets : list of int, optional
+        Start of each polygon in coordinates, followed by the end of the
+        last polygon. If specified, coordinates must be a (N, 2) array
+        which contains all polygons.
+    height : list or float
+        Height of the polygon
+    extrudedHeight : list or float
+        Extruded height of the polygon
+    material : list, array of RGB(A) values or Color
+        Color of the polygon
+    name : list or str
+        Entity name
+    """
+
+    _klass = 'polygon'
+    _props = ['height', 'extrudedHeight', 'material']
+    _positions_script = 'var pos = Cesium.Cartesian3.fromDegreesArray(d.position);'
+    _loop_script = 'for (var i = 0; i < d.offsets.length - 1; i++) {'
+
+    def __init__(self, coordinates, offsets=None, height=None,
+                 extrudedHeight=None, material=None, name=None):
+        np = com._check_package('numpy')
+
+        if offsets is None:
+            if not com.is_listlike(coordinates):
+                msg = 'coordinates must be list of (N, 2) shaped arrays: {x}'
+                raise ValueError(msg.format(x=coordinates))
+            rings = [_validate_ring(c) for c in coordinates]
+            offsets = np.cumsum([0] + [len(r) for r in rings])
+            if len(rings) > 0:
+                coordinates = np.concatenate(rings)
+            else:
+                coordinates = np.empty((0, 2), dtype=np.float64)
+        else:
+            coordinates = _validate_ring(coordinates)
+            offsets = np.asarray(offsets, dtype=np.int64).ravel()
+            valid = len(offsets) > 0 and offsets[0] == 0 and offsets[-1] == len(coordinates)
+            if not valid or (np.diff(offsets) < 0).any():
+                msg = 'offsets must be increasing from 0 to the length of coordinates: {x}'
+                raise ValueError(msg.format(x=offsets))
+
+        x, y = _validate_lonlat(coordinates[:, 0], coordinates[:, 1])
+        self._coordinates = np.column_stack([x, y])
+        self._offsets = np.asarray(offsets, dtype=np.int64)
+
+        self._columns = collections.OrderedDict()
+        self._set_column('name', name, _TextColumn)
+        self._set_column('height', height, _NumericColumn)
+        self._set_column('extrudedHeight', extrudedHeight, _NumericColumn)
+        self._set_column('material', material, _ColorColumn)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    @property
+    def coordinates(self):
+        """ (N, 2) array of longitude and latitude of all polygons """
+        return self._coordinates
+
+    @property
+    def offsets(self):
+        """ start of each polygon in coordinates, and the end of the last one """
+        return self._offsets
+
+    @property
+    def bounds(self):
+        """ (minx, miny, maxx, maxy) of coordinates in degrees, None if empty """
+        return _array_bounds(self._coordinates)
+
+    def __getitem__(self, i):
+        """ coordinates of i-th polygon """
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self._coordinates[self._offsets[i]:self._offsets[i + 1]]
+
+    def _row_bounds(self):
+        np = com._check_package('numpy')
+
+        # empty polygons have NaN bounds, which never intersect
+        bounds = [np.full(len(self), np.nan) for _ in range(4)]
+        starts = self._offsets[:-1]
+        filled = np.flatnonzero(np.diff(self._offsets) > 0)
+        if len(filled) > 0:
+            # segments of reduceat are polygons, as empty ones are skipped
+            starts = starts[filled]
+            for i, (func, column) in enumerate([(np.minimum, 0), (np.minimum, 1),
+                                                (np.maximum, 0), (np.maximum, 1)]):
+                bounds[i][filled] = func.reduceat(self._coordinates[:, column], starts)
+        return bounds
+
+    def _take(self, indices):
+        np = com._check_package('numpy')
+
+        result = super(PolygonCollection, self)._take(indices)
+        starts = self._offsets[:-1][indices]
+        lengths = self._offsets[1:][indices] - starts
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        # position of each coordinate in the original array
+        positions = np.arange(offsets[-1]) + np.repeat(starts - offsets[:-1], lengths)
+        result._coordinates = self._coordinates[positions]
+        result._offsets = offsets
+        return result
+
+    def _entity(self, data, palettes):
+        data['position'] = self._coordinates.ravel()
+        data['offsets'] = self._offsets
+
+        graphics = collections.OrderedDict()
+        graphics['hierarchy'] = 'pos.slice(d.offsets[i], d.offsets[i + 1])'
+        graphics.update(self._graphics(data, palettes))
+
+        entity = collections.OrderedDict()
+        entity['name'] = self._columns['name'].expression(data, palettes)
+        entity[self._klass] = _to_jsliteral(graphics)
+        return entity
+
+
+def _validate_ring(coordinates):
+    """ return coordinates as (N, 2) shaped float array """
+    np = com._check_package('numpy')
+
+    ring = np.asarray(coordinates, dtype=np.float64)
+    if ring.ndim == 1 and len(ring) % 2 == 0:
+        # flat list like Polygon hierarchy
+        ring = ring.reshape(-1, 2)
+    if ring.ndim != 2 or ring.shape[1] != 2:
+        msg = 'coordinates must be list of (N, 2) shaped arrays: {x}'
+        raise ValueError(msg.format(x=coordinates))
+    return ring
@@ -97,11 +97,15 @@ class Color(Material):
     def __repr__(self):
         if self.alpha is None:
             rep = """Color({red}, {green}, {blue})"""
-            return rep.format(red=self.red, green=self.green, blue=self.blue)
+            return rep.format(red=com.to_jsscalar(self.red),
+                              green=com.to_jsscalar(self.green),
+                              blue=com.to_jsscalar(self.blue))
         else:
             rep = """Color({red}, {green}, {blue}, {alpha})"""
-            return rep.format(red=self.red, green=self.green,
-                              blue=self.blue, alpha=self.alpha)
+            return rep.format(red=com.to_jsscalar(self.red),
+                              green=com.to_jsscalar(self.green),
+                              blue=com.to_jsscalar(self.blue),
+                              alpha=com.to_jsscalar(self.alpha))
 
     @property
     def script(self):
@@ -147,7 +151,7 @@ class CssColor(Color):
             return rep.format(name=self.name)
         else:
             rep = """Color.fromCssColorString("{name}").withAlpha({alpha})"""
-            return rep.format(name=self.name, alpha=self.alpha)
+            return rep.format(name=self.name, alpha=com.to_jsscalar(self.alpha))
 
     @property
     def script(self):
@@ -166,7 +170,7 @@ class ColorConstant(CssColor):
             return rep.format(name=self.name)
         else:
             rep = """Color.{name}.withAlpha({alpha})"""
-            return rep.format(name=self.name, alpha=self.alpha)
+            return rep.format(name=self.name, alpha=com.to_jsscalar(self.alpha))
 
 
 class ColorMap(_CesiumObject):
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+from __future__ import unicode_literals
+
+import traitlets
+
+from cesiumpy.base import _CesiumObject
+import cesiumpy.util.common as com
+
+
+class DistanceDisplayCondition(_CesiumObject):
+    """
+    DistanceDisplayCondition
+
+    Parameters
+    ----------
+
+    near : float, default 0.
+        The smallest distance in the interval where the object is visible.
+    far : float, default None
+        The largest distance in the interval where the object is visible.
+        None means no upper limit.
+    """
+
+    near = traitlets.Float()
+    far = traitlets.Float(allow_none=True)
+
+    def __init__(self, near=0., far=None):
+        self.near = near
+        self.far = far
+
+        if self.near < 0:
+            msg = 'near must be greater than or equal to 0: {x}'
+            raise ValueError(msg.format(x=near))
+        if self.far is not None and self.far <= self.near:
+            msg = 'far must be greater than near: {x}'
+            raise ValueError(msg.format(x=far))
+
+    @classmethod
+    def maybe(cls, x):
+        """ Convert list or tuple of (near, far) to DistanceDisplayCondition """
+        if isinstance(x, DistanceDisplayCondition):
+            return x
+        if com.is_listlike(x) and len(x) == 2:
+            return DistanceDisplayCondition(*x)
+        msg = 'Unable to convert to DistanceDisplayCondition: {x}'
+        raise ValueError(msg.format(x=x))
+
+    def __repr__(self):
+        rep = """DistanceDisplayCondition({near}, {far})"""
+        return rep.format(near=com.to_jsscalar(self.near),
+                          far=com.to_jsscalar(self.far))
+
+    @property
+    def script(self):
+        far = 'Number.MAX_VALUE' if self.far is None else com.to_jsscalar(self.far)
+        rep = """new Cesium.DistanceDisplayCondition({near}, {far})"""
+        return rep.format(near=com.to_jsscalar(self.near), far=far)
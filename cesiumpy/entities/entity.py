@@ -11,7 +11,9 @@ import cesiumpy
 from cesiumpy.base import _CesiumObject
 from cesiumpy.entities.pinbuilder import Pin
 import cesiumpy.entities.cartesian as cartesian
+from cesiumpy.entities.condition import DistanceDisplayCondition
 import cesiumpy.constants as constants
+import cesiumpy.extension.simplify as simplification
 import cesiumpy.util.common as com
 from cesiumpy.util.trait import MaybeTrait
 
@@ -25,7 +27,8 @@ class _CesiumEntity(_CesiumObject):
                      'numberOfVerticalLines', 'rotation', 'stRotation',
                      'granularity', 'scaleByDistance', 'translucencyByDistance',
                      'scale', 'horizontalOrigin', 'verticalOrigin',
-                     'eyeOffset', 'pixelOffset', 'pixelOffsetScaleByDistance']
+                     'eyeOffset', 'pixelOffset', 'pixelOffsetScaleByDistance',
+                     'distanceDisplayCondition']
 
     width = traitlets.Float(allow_none=True)
     height = traitlets.Float(allow_none=True)
@@ -53,6 +56,8 @@ class _CesiumEntity(_CesiumObject):
 
     position = traitlets.Instance(klass=cartesian.Cartesian3, allow_none=True)
 
+    distanceDisplayCondition = MaybeTrait(klass=DistanceDisplayCondition, allow_none=True)
+
     def __init__(self, width=None, height=None, extrudedHeight=None,
                  show=None, fill=None, material=None, color=None,
                  outline=None, outlineColor=None, outlineWidth=None,
@@ -60,7 +65,7 @@ class _CesiumEntity(_CesiumObject):
                  granularity=None, scaleByDistance=None, translucencyByDistance=None,
                  scale=None, verticalOrigin=None, horizontalOrigin=None,
                  eyeOffset=None, pixelOffset=None, pixelOffsetScaleByDistance=None,
-                 position=None, name=None):
+                 position=None, name=None, distanceDisplayCondition=None):
 
         self.width = width
         self.height = height
@@ -95,6 +100,7 @@ class _CesiumEntity(_CesiumObject):
         self.pixelOffset = pixelOffset
 
         self.pixelOffsetScaleByDistance = com.notimplemented(pixelOffsetScaleByDistance)
+        self.distanceDisplayCondition = distanceDisplayCondition
 
         if position is not None:
             position = cartesian.Cartesian3.maybe(position, degrees=True)
@@ -108,7 +114,11 @@ class _CesiumEntity(_CesiumObject):
             val = getattr(self, key)
             if val is not None:
                 kwds[key] = val
-        return self.__class__(**kwds)
+        # not all entities accept it in __init__
+        condition = kwds.pop('distanceDisplayCondition', None)
+        entity = self.__class__(**kwds)
+        entity.distanceDisplayCondition = condition
+        return entity
 
     @property
     def _property_dict(self):
@@ -524,6 +534,11 @@ class Polyline(_CesiumEntity):
         A Property specifying the material used to draw the polyline.
     granularity : float, default cesiumpy.math.RADIANS_PER_DEGREE
         A numeric Property specifying the angular distance between each latitude and longitude if followSurface is true.
+    distanceDisplayCondition : DistanceDisplayCondition or tuple, optional
+        (near, far) distance in meters from the camera where the polyline is visible.
+    simplify : float, optional
+        Tolerance in degrees to simplify positions by Douglas-Peucker algorithm.
+        The number of removed vertices is stored in ``removed_vertices``.
     """
 
     _klass = 'polyline'
@@ -532,14 +547,23 @@ class Polyline(_CesiumEntity):
     positions = traitlets.Instance(klass=cartesian.Cartesian3Array)
     followSurface = traitlets.Bool(allow_none=True)
 
+    # number of vertices removed by simplification
+    removed_vertices = 0
+
     def __init__(self, positions, followSurface=None, width=None,
-                 show=None, material=None, granularity=None, name=None):
+                 show=None, material=None, granularity=None, name=None,
+                 distanceDisplayCondition=None, simplify=None):
         # polyline uses "posisions", not "position"
 
         super(Polyline, self).__init__(width=width, show=show, material=material,
-                                       granularity=granularity, name=name)
-
-        self.positions = cartesian.Cartesian3.fromDegreesArray(positions)
+                                       granularity=granularity, name=name,
+                                       distanceDisplayCondition=distanceDisplayCondition)
+
+        positions = cartesian.Cartesian3.fromDegreesArray(positions)
+        if simplify is not None:
+            positions, self.removed_vertices = _simplify_positions(positions, simplify,
+                                                                   closed=False)
+        self.positions = positions
         self.followSurface = followSurface
 
 
@@ -693,9 +717,8 @@ class Wall(_CesiumEntity):
                                    outlineWidth=outlineWidth, granularity=granularity,
                                    name=name)
 
-        # ToDo: Support fromDegreesArrayHeights
         self.positions = cartesian.Cartesian3.fromDegreesArray(positions)
-        pos_len = len(self.positions) // 2
+        pos_len = len(self.positions) // (3 if self.positions._heights else 2)
 
         def _init_heights(x, key):
             if not isinstance(x, list):
@@ -848,6 +871,11 @@ class Polygon(_CesiumEntity):
         A numeric Property specifying the angular distance between each latitude and longitude point.
     perPositionHeight : bool, default False
         A boolean specifying whether or not the the height of each position is used.
+    distanceDisplayCondition : DistanceDisplayCondition or tuple, optional
+        (near, far) distance in meters from the camera where the polygon is visible.
+    simplify : float, optional
+        Tolerance in degrees to simplify hierarchy by Douglas-Peucker algorithm.
+        The number of removed vertices is stored in ``removed_vertices``.
     """
 
     _klass = 'polygon'
@@ -855,21 +883,46 @@ class Polygon(_CesiumEntity):
 
     perPositionHeight = traitlets.Bool(allow_none=True)
 
+    # number of vertices removed by simplification
+    removed_vertices = 0
+
     def __init__(self, hierarchy, height=None, extrudedHeight=None, show=None,
                  fill=None, material=None, outline=None, outlineColor=None,
                  outlineWidth=None, stRotation=None, granularity=None,
-                 perPositionHeight=None, name=None):
+                 perPositionHeight=None, name=None, distanceDisplayCondition=None,
+                 simplify=None):
 
         super(Polygon, self).__init__(height=height, extrudedHeight=extrudedHeight,
                                       show=show, fill=fill, material=material,
                                       outline=outline, outlineColor=outlineColor,
                                       outlineWidth=outlineWidth, stRotation=stRotation,
-                                      granularity=granularity, name=name)
-
-        self.hierarchy = cartesian.Cartesian3.fromDegreesArray(hierarchy)
+                                      granularity=granularity, name=name,
+                                      distanceDisplayCondition=distanceDisplayCondition)
+
+        hierarchy = cartesian.Cartesian3.fromDegreesArray(hierarchy)
+        if simplify is not None:
+            hierarchy, self.removed_vertices = _simplify_positions(hierarchy, simplify,
+                                                                   closed=True)
+        self.hierarchy = hierarchy
         self.perPositionHeight = perPositionHeight
 
     @property
     def positions(self):
         # for compat
         return self.hierarchy
+
+
+def _simplify_positions(positions, tolerance, closed):
+    """
+    Simplify Cartesian3Array, return simplified Cartesian3Array and
+    the number of removed vertices
+    """
+    np = com._check_package('numpy')
+
+    width = 3 if positions._heights else 2
+    coordinates = np.asarray(positions.x, dtype=np.float64).reshape(-1, width)
+    coordinates, removed = simplification.simplify(coordinates, tolerance,
+                                                   closed=closed)
+    if removed == 0:
+        return positions, 0
+    return cartesian.Cartesian3Array(coordinates, heights=positions._heights), removed
@@ -40,16 +40,20 @@ class ImageMaterialProperty(Material):
         A Property specifying the Image, URL, Canvas, or Video.
     repeat : Cartesian2, default new Cartesian2(1.0, 1.0)
         A Cartesian2 Property specifying the number of times
+    transparent : bool, default False
+        Set to true when the image has transparency
     """
 
-    _props = ['image', 'repeat']
+    _props = ['image', 'repeat', 'transparent']
     image = URITrait()
+    transparent = traitlets.Bool(allow_none=True)
 
-    def __init__(self, image, repeat=None):
+    def __init__(self, image, repeat=None, transparent=None):
         if isinstance(image, TemporaryImage):
             image = image.script
         self.image = image
         self.repeat = com.notimplemented(repeat)
+        self.transparent = transparent
 
     def __repr__(self):
         rep = """ImageMaterialProperty({image})"""
@@ -6,6 +6,7 @@ import nose
 
 import cesiumpy
 import cesiumpy.entities.cartesian as cartesian
+from cesiumpy.testing import _skip_if_no_numpy
 
 
 class TestCartesian(unittest.TestCase):
@@ -109,6 +110,107 @@ class TestCartesian(unittest.TestCase):
         with nose.tools.assert_raises_regexp(ValueError, msg):
             cesiumpy.Cartesian3.fromDegreesArray([10, 20, 20, 91])
 
+    def test_cartesian3_array_heights(self):
+        c = cesiumpy.Cartesian3.fromDegreesArrayHeights([1, 2, 3, 4, 5, 6])
+        exp = "Cesium.Cartesian3.fromDegreesArrayHeights([1, 2, 3, 4, 5, 6])"
+        self.assertEqual(c.script, exp)
+
+        c = cesiumpy.Cartesian3.fromDegreesArray([(1, 2, 3), (4, 5, 6)])
+        self.assertEqual(c.script, exp)
+
+        msg = "x length must be a multiple of 3: \\[1, 2\\]"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.Cartesian3.fromDegreesArrayHeights([1, 2])
+
+        msg = "x must be a list consists from longitude, latitude and height"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.Cartesian3.fromDegreesArrayHeights([1, 100, 3])
+
+    def test_cartesian3_array_numpy(self):
+        _skip_if_no_numpy()
+        import numpy as np
+
+        x = np.array([1., 2., 3., 4.])
+        c = cesiumpy.Cartesian3.fromDegreesArray(x)
+        # writable array is copied, held array is read-only
+        self.assertFalse(np.shares_memory(c.x, x))
+        self.assertFalse(c.x.flags.writeable)
+        exp = "Cesium.Cartesian3.fromDegreesArray([1.0, 2.0, 3.0, 4.0])"
+        self.assertEqual(c.script, exp)
+
+        x = np.array([[1., 2.], [3., 4.]])
+        c = cesiumpy.Cartesian3.fromDegreesArray(x, copy=False)
+        self.assertTrue(np.shares_memory(c.x, x))
+        self.assertTrue(x.flags.writeable)
+        self.assertEqual(c.x.shape, (4, ))
+        self.assertEqual(c.script, exp)
+
+        # read-only array is held without copy
+        x = np.array([1., 2., 3., 4.])
+        x.flags.writeable = False
+        c = cesiumpy.Cartesian3.fromDegreesArray(x)
+        self.assertTrue(np.shares_memory(c.x, x))
+
+        c = cesiumpy.Cartesian3.fromDegreesArray(np.array([1, 2, 3, 4]))
+        self.assertEqual(c.x.dtype, np.float64)
+        self.assertEqual(c.script, exp)
+
+        x = np.array([[1., 2., 3.], [4., 5., 6.]])
+        c = cesiumpy.Cartesian3.fromDegreesArray(x)
+        exp = "Cesium.Cartesian3.fromDegreesArrayHeights([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])"
+        self.assertEqual(c.script, exp)
+
+        with cesiumpy.option_context(array_encoding='float64'):
+            exp = 'atob("AAAAAAAA8D8AAAAAAAAAQAAAAAAAAAhAAAAAAAAAEEAAAAAAAAAUQAAAAAAAABhA")'
+            self.assertTrue(exp in c.script)
+
+        msg = "x must be an array which has 3 columns"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.Cartesian3.fromDegreesArrayHeights(np.array([[1., 2.]]))
+
+        msg = "x must be a list consists from longitude and latitude"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.Cartesian3.fromDegreesArray(np.array([[1., 2.], [200., 3.]]))
+
+    def test_cartesian3_array_numpy_modified(self):
+        _skip_if_no_numpy()
+        import numpy as np
+
+        a = np.array([[130., 30.], [140., 40.]])
+        p = cesiumpy.Polyline(positions=a)
+        exp = p.script
+        self.assertTrue('130.0' in exp)
+
+        # modifying the input doesn't affect the entity
+        a[0, 0] = 100.
+        self.assertEqual(p.script, exp)
+        self.assertTrue('130.0' in p.positions.script)
+        with nose.tools.assert_raises(ValueError):
+            p.positions.x[0] = 100.
+
+    def test_cartesian3_array_encoding(self):
+        c = cesiumpy.Cartesian3.fromDegreesArray([130.5, 30.25, 131, 31])
+
+        with cesiumpy.option_context(array_encoding='float64'):
+            exp = ("""Cesium.Cartesian3.fromDegreesArray((function (s) { var b = new Uint8Array(s.length); """
+                   """for (var i = 0; i < s.length; i++) { b[i] = s.charCodeAt(i); } """
+                   """return new Float64Array(b.buffer); })(atob("AAAAAABQYEAAAAAAAEA+QAAAAAAAYGBAAAAAAAAAP0A=")))""")
+            self.assertEqual(c.script, exp)
+
+        with cesiumpy.option_context(array_encoding='float32'):
+            exp = ("""return new Float64Array(new Float32Array(b.buffer)); })(atob("AIACQwAA8kEAAANDAAD4QQ==")))""")
+            self.assertTrue(c.script.endswith(exp))
+
+        exp = "Cesium.Cartesian3.fromDegreesArray([130.5, 30.25, 131, 31])"
+        self.assertEqual(c.script, exp)
+
+        # cached script of entities must be updated
+        p = cesiumpy.Polyline(positions=c)
+        self.assertTrue(exp in p.script)
+        with cesiumpy.option_context(array_encoding='float64'):
+            self.assertTrue('atob(' in p.script)
+        self.assertTrue(exp in p.script)
+
     def test_cartesian4(self):
         c = cesiumpy.Cartesian4(5, 10, 20, 30)
         exp = "new Cesium.Cartesian4(5.0, 10.0, 20.0, 30.0)"
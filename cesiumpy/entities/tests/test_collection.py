@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+import nose
+import unittest
+
+import cesiumpy
+from cesiumpy.testing import _skip_if_no_numpy
+
+
+class TestPointCollection(unittest.TestCase):
+
+    def setUp(self):
+        _skip_if_no_numpy()
+
+    def test_point_collection(self):
+        p = cesiumpy.PointCollection([130, 140, 150], [30, 40, 50])
+        self.assertEqual(len(p), 3)
+        self.assertEqual(repr(p), 'PointCollection(length=3)')
+        self.assertEqual(p.position.shape, (3, 3))
+
+        exp = ("""function (entities) { var d = {position : [130.0, 30.0, 0.0, 140.0, 40.0, 0.0, 150.0, 50.0, 0.0]}; """
+               """var pos = Cesium.Cartesian3.fromDegreesArrayHeights(d.position); """
+               """for (var i = 0; i < pos.length; i++) { entities.add({position : pos[i], point : {pixelSize : 10.0, color : Cesium.Color.WHITE}}); } }""")
+        self.assertEqual(p.script, exp)
+
+    def test_point_collection_columns(self):
+        p = cesiumpy.PointCollection([130, 140, 150], [30, 40, 50], z=[1, 2, 3],
+                                     pixelSize=[5, 10, 15], name='x',
+                                     color=[cesiumpy.color.RED, 'blue', cesiumpy.color.RED])
+        exp = ("""function (entities) { var d = {position : [130.0, 30.0, 1.0, 140.0, 40.0, 2.0, 150.0, 50.0, 3.0], """
+               """pixelSize : [5.0, 10.0, 15.0], color : [0, 1, 0]}; """
+               """var p = {color : [Cesium.Color.RED, Cesium.Color.BLUE]}; """
+               """var pos = Cesium.Cartesian3.fromDegreesArrayHeights(d.position); """
+               """for (var i = 0; i < pos.length; i++) { entities.add({name : "x", position : pos[i], """
+               """point : {pixelSize : d.pixelSize[i], color : p.color[d.color[i]]}}); } }""")
+        self.assertEqual(p.script, exp)
+
+    def test_point_collection_numpy(self):
+        import numpy as np
+        x = np.array([130., 140., 150.])
+        y = np.array([30., 40., 50.])
+        colors = np.array([[1., 0., 0.], [1., 0., 0.], [1., 0., 0.]])
+        p = cesiumpy.PointCollection(x, y, color=colors, outlineWidth=np.float64(2))
+        exp = ("""entities.add({position : pos[i], point : {pixelSize : 10.0, """
+               """color : new Cesium.Color(1.0, 0.0, 0.0), outlineWidth : 2.0}});""")
+        self.assertTrue(exp in p.script)
+
+        p = cesiumpy.PointCollection(x, y, color=(0., 1., 0.))
+        self.assertTrue('color : new Cesium.Color(0.0, 1.0, 0.0)}' in p.script)
+
+    def test_point_collection_validation(self):
+        msg = "x must be list-likes: 1"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.PointCollection(1, [30])
+
+        msg = "y length must be 2"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.PointCollection([130, 140], [30])
+
+        msg = "pixelSize length must be 2"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.PointCollection([130, 140], [30, 40], pixelSize=[1, 2, 3])
+
+        msg = "x must be longitude, between -180 to 180"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.PointCollection([130, 200], [30, 40])
+
+        msg = "y must be latitude, between -90 to 90"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.PointCollection([130, 140], [30, 100])
+
+    def test_viewer(self):
+        v = cesiumpy.Viewer(divid='viewertest')
+        v.entities.add(cesiumpy.PointCollection([130, 140], [30, 40]))
+        self.assertEqual(len(v.entities), 1)
+
+        result = v.to_html()
+        exp = """  (function (entities) { var d = {position : [130.0, 30.0, 0.0, 140.0, 40.0, 0.0]};"""
+        self.assertTrue(exp in result)
+        exp = """for (var i = 0; i < pos.length; i++) { entities.add({position : pos[i], point : {pixelSize : 10.0, color : Cesium.Color.WHITE}}); } })(widget.entities);
+  widget.zoomTo(widget.entities);
+</script>"""
+        self.assertTrue(result.endswith(exp))
+
+
+class TestCollections(unittest.TestCase):
+
+    def setUp(self):
+        _skip_if_no_numpy()
+
+    def test_label_collection(self):
+        p = cesiumpy.LabelCollection([130, 140], [30, 40], text=['A', 'B'],
+                                     fillColor=cesiumpy.color.RED)
+        exp = ("""entities.add({position : pos[i], label : {text : d.text[i], fillColor : Cesium.Color.RED}});""")
+        self.assertTrue(exp in p.script)
+
+        msg = "text length must be 2"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.LabelCollection([130, 140], [30, 40], text=['A'])
+
+    def test_pin_collection(self):
+        p = cesiumpy.PinCollection([130, 140], [30, 40], text='!',
+                                   color=['red', 'blue'])
+        exp = ("""var p = {color : [Cesium.Color.RED, Cesium.Color.BLUE]}; var pb = new Cesium.PinBuilder(); """)
+        self.assertTrue(exp in p.script)
+        exp = ("""billboard : {image : pb.fromText("!", p.color[d.color[i]], 48.0)}""")
+        self.assertTrue(exp in p.script)
+
+    def test_cylinder_collection(self):
+        p = cesiumpy.CylinderCollection([130, 140], [30, 40], z=[5, 10], length=[10, 20],
+                                        topRadius=5, bottomRadius=5)
+        exp = ("""var d = {position : [130.0, 30.0, 5.0, 140.0, 40.0, 10.0], length : [10.0, 20.0]};""")
+        self.assertTrue(exp in p.script)
+        exp = ("""cylinder : {length : d.length[i], topRadius : 5.0, bottomRadius : 5.0}""")
+        self.assertTrue(exp in p.script)
+
+
+class TestPolygonCollection(unittest.TestCase):
+
+    def setUp(self):
+        _skip_if_no_numpy()
+
+    def test_polygon_collection(self):
+        p = cesiumpy.PolygonCollection([[130, 30, 131, 30, 131, 31],
+                                        [[140, 40], [141, 40], [141, 41], [140, 41]]],
+                                       material=['red', 'blue'], name='x')
+        self.assertEqual(len(p), 2)
+        self.assertEqual(repr(p), 'PolygonCollection(length=2)')
+        self.assertEqual(p.offsets.tolist(), [0, 3, 7])
+        self.assertEqual(p[1].tolist(), [[140, 40], [141, 40], [141, 41], [140, 41]])
+        self.assertEqual(p[-2].tolist(), [[130, 30], [131, 30], [131, 31]])
+        self.assertEqual(p.bounds, (130, 30, 141, 41))
+        # polygons don't have a single position
+        self.assertFalse(hasattr(p, 'position'))
+
+        exp = ("""function (entities) { var d = {position : [130.0, 30.0, 131.0, 30.0, 131.0, 31.0, 140.0, 40.0, 141.0, 40.0, 141.0, 41.0, 140.0, 41.0], """
+               """offsets : [0, 3, 7], material : [0, 1]}; """
+               """var p = {material : [Cesium.Color.RED, Cesium.Color.BLUE]}; """
+               """var pos = Cesium.Cartesian3.fromDegreesArray(d.position); """
+               """for (var i = 0; i < d.offsets.length - 1; i++) { entities.add({name : "x", """
+               """polygon : {hierarchy : pos.slice(d.offsets[i], d.offsets[i + 1]), material : p.material[d.material[i]]}}); } }""")
+        self.assertEqual(p.script, exp)
+
+    def test_polygon_collection_offsets(self):
+        import numpy as np
+
+        coordinates = np.array([[130, 30], [131, 30], [131, 31],
+                                [140, 40], [141, 40], [141, 41]])
+        p = cesiumpy.PolygonCollection(coordinates, offsets=[0, 3, 6],
+                                       height=[0, 100], extrudedHeight=1000)
+        self.assertEqual(len(p), 2)
+        exp = """polygon : {hierarchy : pos.slice(d.offsets[i], d.offsets[i + 1]), height : d.height[i], extrudedHeight : 1000.0}"""
+        self.assertTrue(exp in p.script)
+
+        msg = 'offsets must be increasing from 0 to the length of coordinates'
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.PolygonCollection(coordinates, offsets=[0, 3, 5])
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.PolygonCollection(coordinates, offsets=[0, 4, 3, 6])
+        msg = 'coordinates must be list of \\(N, 2\\) shaped arrays'
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.PolygonCollection([[[130, 30, 0], [131, 30, 0], [131, 31, 0]]])
+        msg = 'x must be longitude'
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.PolygonCollection([[190, 30, 131, 30, 131, 31]])
+
+        p = cesiumpy.PolygonCollection([])
+        self.assertEqual(len(p), 0)
+        self.assertIsNone(p.bounds)
+
+
+class TestClusterCollection(unittest.TestCase):
+
+    def setUp(self):
+        _skip_if_no_numpy()
+
+    def test_grid_cluster(self):
+        import numpy as np
+        from cesiumpy.entities.collection import grid_cluster
+
+        stats = grid_cluster([130, 130.5, 131.5, 140], [30, 30.5, 31.5, 40],
+                             z=[0, 10, 20, 5], radius=1)
+        self.assertEqual(list(stats), ['count', 'x', 'y', 'z',
+                                       'minx', 'miny', 'maxx', 'maxy'])
+        self.assertEqual(stats['count'].tolist(), [3, 1])
+        np.testing.assert_allclose(stats['x'], [392. / 3, 140])
+        np.testing.assert_allclose(stats['y'], [92. / 3, 40])
+        np.testing.assert_allclose(stats['z'], [10, 5])
+        np.testing.assert_allclose(stats['minx'], [130, 140])
+        np.testing.assert_allclose(stats['maxy'], [31.5, 40])
+
+        # edges
+        stats = grid_cluster([-180, 180, 0], [-90, 90, 0], radius=0.5)
+        self.assertEqual(stats['count'].tolist(), [1, 1, 1])
+
+        msg = 'radius must be positive'
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            grid_cluster([130], [30], radius=0)
+        msg = 'x must be longitude'
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            grid_cluster([190], [30])
+
+    def test_grid_cluster_sparse(self):
+        import numpy as np
+        import cesiumpy.entities.collection as collection
+        from cesiumpy.entities.collection import grid_cluster
+
+        x = np.random.uniform(120, 150, 1000)
+        y = np.random.uniform(20, 50, 1000)
+        exp = grid_cluster(x, y, radius=0.5)
+
+        original = collection._DENSE_CELLS
+        collection._DENSE_CELLS = 0
+        try:
+            result = grid_cluster(x, y, radius=0.5)
+        finally:
+            collection._DENSE_CELLS = original
+
+        self.assertEqual(list(result), list(exp))
+        for key in exp:
+            np.testing.assert_allclose(result[key], exp[key])
+        self.assertEqual(result['count'].sum(), 1000)
+
+    def test_cluster_collection(self):
+        p = cesiumpy.ClusterCollection([130, 130.5, 131.5, 140], [30, 30.5, 31.5, 40],
+                                       radius=1)
+        self.assertEqual(len(p), 2)
+        self.assertEqual(p.count.tolist(), [3, 1])
+        exp = ("""var d = {position : [130.66666666666666, 30.666666666666668, 0.0, 140.0, 40.0, 0.0], """
+               """pixelSize : [30.0, 5.0], color : [1, 0]}; """
+               """var p = {color : [new Cesium.Color(1.0, 1.0, 0.0), new Cesium.Color(1.0, 0.0, 0.0)]};""")
+        self.assertTrue(exp in p.script)
+
+        p = cesiumpy.ClusterCollection([130, 130.5, 140], [30, 30.5, 40], pixelSize=8,
+                                       color=cesiumpy.color.RED)
+        exp = """point : {pixelSize : 8.0, color : Cesium.Color.RED}"""
+        self.assertTrue(exp in p.script)
+
+        msg = 'pixelSize must be a tuple of'
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.ClusterCollection([130], [30], pixelSize=(1, 2, 3))
+
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+import nose
+import unittest
+
+import cesiumpy
+
+
+class TestDistanceDisplayCondition(unittest.TestCase):
+
+    def test_condition(self):
+        c = cesiumpy.DistanceDisplayCondition(10, 1000)
+        self.assertEqual(repr(c), 'DistanceDisplayCondition(10.0, 1000.0)')
+        self.assertEqual(c.script, 'new Cesium.DistanceDisplayCondition(10.0, 1000.0)')
+
+        c = cesiumpy.DistanceDisplayCondition(10)
+        self.assertEqual(c.script, 'new Cesium.DistanceDisplayCondition(10.0, Number.MAX_VALUE)')
+
+        msg = 'near must be greater than or equal to 0: -1'
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.DistanceDisplayCondition(-1, 10)
+
+        msg = 'far must be greater than near: 10'
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.DistanceDisplayCondition(10, 10)
+
+    def test_maybe(self):
+        c = cesiumpy.DistanceDisplayCondition.maybe((0, 100))
+        self.assertEqual(c.script, 'new Cesium.DistanceDisplayCondition(0.0, 100.0)')
+        self.assertIs(cesiumpy.DistanceDisplayCondition.maybe(c), c)
+
+        msg = 'Unable to convert to DistanceDisplayCondition: 1'
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.DistanceDisplayCondition.maybe(1)
+
+    def test_entity(self):
+        e = cesiumpy.Polygon([1, 1, 2, 2, 3, 1], distanceDisplayCondition=(0, 1e6))
+        exp = "{polygon : {hierarchy : Cesium.Cartesian3.fromDegreesArray([1, 1, 2, 2, 3, 1]), distanceDisplayCondition : new Cesium.DistanceDisplayCondition(0.0, 1000000.0)}}"
+        self.assertEqual(e.script, exp)
+        self.assertEqual(e.copy().script, exp)
+
+        e = cesiumpy.Polyline([1, 1, 2, 2], distanceDisplayCondition=cesiumpy.DistanceDisplayCondition(1e6))
+        exp = "{polyline : {positions : Cesium.Cartesian3.fromDegreesArray([1, 1, 2, 2]), distanceDisplayCondition : new Cesium.DistanceDisplayCondition(1000000.0, Number.MAX_VALUE)}}"
+        self.assertEqual(e.script, exp)
+
+        v = cesiumpy.Viewer()
+        v.entities.add(cesiumpy.Point(position=[1, 1, 0]), distanceDisplayCondition=(0, 10))
+        exp = "{position : Cesium.Cartesian3.fromDegrees(1.0, 1.0, 0.0), point : {pixelSize : 10.0, color : Cesium.Color.WHITE, distanceDisplayCondition : new Cesium.DistanceDisplayCondition(0.0, 10.0)}}"
+        self.assertEqual(v.entities[0].script, exp)
+        self.assertEqual(v.entities[0].copy().script, exp)
+
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
@@ -6,6 +6,7 @@ import unittest
 import traitlets
 
 import cesiumpy
+from cesiumpy.testing import _skip_if_no_numpy
 
 
 class TestEntity(unittest.TestCase):
@@ -412,6 +413,31 @@ class TestEntity(unittest.TestCase):
         e = e.copy()
         self.assertEqual(e.script, exp)
 
+    def test_polygon_simplify(self):
+        _skip_if_no_numpy()
+
+        e = cesiumpy.Polygon([0, 0, 1, 0.001, 2, 0, 2, 2, 0, 2, 0, 0], simplify=0.01,
+                             material=cesiumpy.color.AQUA)
+        exp = "{polygon : {hierarchy : Cesium.Cartesian3.fromDegreesArray([0.0, 0.0, 2.0, 0.0, 2.0, 2.0, 0.0, 2.0, 0.0, 0.0]), material : Cesium.Color.AQUA}}"
+        self.assertEqual(e.script, exp)
+        self.assertEqual(e.removed_vertices, 1)
+
+        e = cesiumpy.Polygon([0, 0, 1, 0.001, 2, 0, 2, 2, 0, 2, 0, 0], simplify=0.0001)
+        exp = "{polygon : {hierarchy : Cesium.Cartesian3.fromDegreesArray([0, 0, 1, 0.001, 2, 0, 2, 2, 0, 2, 0, 0])}}"
+        self.assertEqual(e.script, exp)
+        self.assertEqual(e.removed_vertices, 0)
+
+        e = cesiumpy.Polyline([(0, 0), (1, 0.001), (2, 0)], simplify=0.01)
+        exp = "{polyline : {positions : Cesium.Cartesian3.fromDegreesArray([0.0, 0.0, 2.0, 0.0])}}"
+        self.assertEqual(e.script, exp)
+        self.assertEqual(e.removed_vertices, 1)
+        self.assertEqual(cesiumpy.Polyline([0, 0, 1, 1]).removed_vertices, 0)
+
+        # heights are kept
+        e = cesiumpy.Polyline([(0, 0, 10), (1, 0.001, 20), (2, 0, 30)], simplify=0.01)
+        exp = "{polyline : {positions : Cesium.Cartesian3.fromDegreesArrayHeights([0.0, 0.0, 10.0, 2.0, 0.0, 30.0])}}"
+        self.assertEqual(e.script, exp)
+
     def test_entities_repr(self):
         e = cesiumpy.Point(position=[-110, 40, 0])
         exp = "Point(-110.0, 40.0, 0.0)"
@@ -17,6 +17,10 @@ class TestImageMaterial(unittest.TestCase):
         self.assertEqual(repr(m), 'ImageMaterialProperty(xxx.png)')
         self.assertEqual(m.script, """new Cesium.ImageMaterialProperty({image : "xxx.png"})""")
 
+        m = cesiumpy.entities.material.ImageMaterialProperty('data:image/png;base64,YWJj',
+                                                             transparent=True)
+        self.assertEqual(m.script, """new Cesium.ImageMaterialProperty({image : "data:image/png;base64,YWJj", transparent : true})""")
+
 
 class TestTempImageMaterial(unittest.TestCase):
 
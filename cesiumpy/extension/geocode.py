@@ -3,13 +3,494 @@
 
 from __future__ import unicode_literals
 
+import bisect
+import collections
+import csv
+import difflib
+import io
+import json
+import os
+import re
 import six
-from geopy.geocoders import GoogleV3
+import threading
+import time
 
 import cesiumpy.util.common as com
 
-# ToDo: want different geocoders?
-_GEOCODER = GoogleV3()
+# geocoder is created on the first use, not to import geopy (and create
+# geocoder) on importing cesiumpy
+_GEOCODER = None
+
+
+CacheInfo = collections.namedtuple('CacheInfo', ['memory_hits', 'disk_hits',
+                                                 'misses', 'maxsize', 'currsize'])
+
+
+class GeocodeCache(object):
+    """
+    Cache of geocoded results, consists from in-memory LRU and optional
+    SQLite database on disk. Queries which cannot be geocoded are also
+    cached not to query them repeatedly.
+
+    Parameters
+    ----------
+
+    path : str, optional
+        Path to SQLite database file. If None, results are cached only in memory.
+    maxsize : int, default 1024
+        Maximum number of results cached in memory.
+    ttl : float, optional
+        Seconds until the cached result expires. If None, never expires.
+    negative_ttl : float, optional
+        Seconds until the cached miss (query which cannot be geocoded)
+        expires. If None, ``ttl`` is used.
+    """
+
+    def __init__(self, path=None, maxsize=1024, ttl=None, negative_ttl=None):
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+
+        self._memory = collections.OrderedDict()
+        # cache can be accessed from multiple threads
+        self._lock = threading.RLock()
+        self._conn = None
+        if path is not None:
+            # on-disk cache is optional, not to import sqlite3 on importing cesiumpy
+            import sqlite3
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute('CREATE TABLE IF NOT EXISTS geocode '
+                               '(query TEXT PRIMARY KEY, longitude REAL, '
+                               'latitude REAL, created REAL)')
+            self._conn.commit()
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    def _is_expired(self, value, created):
+        ttl = self.ttl if value is not None else self.negative_ttl
+        return ttl is not None and time.time() - created > ttl
+
+    def get(self, query):
+        """
+        Return a tuple of (found, value). value is (longitude, latitude),
+        or None if the query is cached as unable to be geocoded.
+        """
+        with self._lock:
+            if query in self._memory:
+                value, created = self._memory.pop(query)
+                if not self._is_expired(value, created):
+                    # move to the last as recently used
+                    self._memory[query] = (value, created)
+                    self._memory_hits += 1
+                    return True, value
+
+            if self._conn is not None:
+                row = self._conn.execute('SELECT longitude, latitude, created FROM geocode '
+                                         'WHERE query = ?', (query, )).fetchone()
+                if row is not None:
+                    lon, lat, created = row
+                    value = None if lon is None else (lon, lat)
+                    if not self._is_expired(value, created):
+                        self._set_memory(query, value, created)
+                        self._disk_hits += 1
+                        return True, value
+
+            self._misses += 1
+            return False, None
+
+    def set(self, query, value):
+        """
+        Cache value of the query, value is (longitude, latitude) or None
+        """
+        created = time.time()
+        with self._lock:
+            self._set_memory(query, value, created)
+            if self._conn is not None:
+                lon, lat = (None, None) if value is None else value
+                self._conn.execute('INSERT OR REPLACE INTO geocode VALUES (?, ?, ?, ?)',
+                                   (query, lon, lat, created))
+                self._conn.commit()
+
+    def _set_memory(self, query, value, created):
+        self._memory.pop(query, None)
+        self._memory[query] = (value, created)
+        while len(self._memory) > self.maxsize:
+            # remove least recently used
+            self._memory.popitem(last=False)
+
+    def clear(self):
+        """
+        Clear cached results and statistics
+        """
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute('DELETE FROM geocode')
+                self._conn.commit()
+            self._memory_hits = 0
+            self._disk_hits = 0
+            self._misses = 0
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def cache_info(self):
+        """
+        Return statistics of the cache
+        """
+        with self._lock:
+            return CacheInfo(self._memory_hits, self._disk_hits, self._misses,
+                             self.maxsize, len(self._memory))
+
+
+_CACHE = GeocodeCache()
+
+
+def set_cache(path=None, maxsize=1024, ttl=None, negative_ttl=None):
+    """
+    Set the cache of geocoded results, see GeocodeCache for parameters.
+    The default cache only uses memory.
+
+    >>> cesiumpy.geocode.set_cache('geocode.sqlite', ttl=30 * 24 * 3600)
+    """
+    global _CACHE
+    _CACHE.close()
+    _CACHE = GeocodeCache(path=path, maxsize=maxsize, ttl=ttl,
+                          negative_ttl=negative_ttl)
+    return _CACHE
+
+
+def get_cache():
+    """
+    Return the cache of geocoded results
+    """
+    return _CACHE
+
+
+def set_geocoder(geocoder):
+    """
+    Set the geocoder used to convert str to coordinates
+
+    Parameters
+    ----------
+
+    geocoder : object or None
+        Object which has ``geocode(query)`` method, like geopy geocoders.
+        The method must return an object which has ``longitude`` and
+        ``latitude`` attributes, or None if the query cannot be geocoded.
+        If None, geopy's GoogleV3 is used (default).
+
+    Results are cached regardless of the geocoder, call
+    ``get_cache().clear()`` to discard results of the previous geocoder.
+    """
+    if geocoder is not None and not callable(getattr(geocoder, 'geocode', None)):
+        msg = 'geocoder must have geocode method: {x}'
+        raise ValueError(msg.format(x=geocoder))
+
+    global _GEOCODER
+    _GEOCODER = geocoder
+
+
+def get_geocoder():
+    """
+    Return the geocoder used to convert str to coordinates
+    """
+    global _GEOCODER
+    if _GEOCODER is None:
+        geocoders = com._check_package('geopy.geocoders')
+        _GEOCODER = geocoders.GoogleV3()
+    return _GEOCODER
+
+
+def _geocode(query):
+    """
+    Return (longitude, latitude) of the query, or None if it cannot be geocoded
+    """
+    found, value = _CACHE.get(query)
+    if found:
+        return value
+
+    loc = get_geocoder().geocode(query)
+    if loc is not None:
+        value = (loc.longitude, loc.latitude)
+    else:
+        value = None
+    _CACHE.set(query, value)
+    return value
+
+
+GazetteerLocation = collections.namedtuple('GazetteerLocation',
+                                           ['address', 'longitude', 'latitude'])
+
+
+class GazetteerGeocoder(object):
+    """
+    Offline geocoder which looks up names from bundled country data and
+    user-supplied gazetteer. Names are matched case-insensitively, then
+    by unique prefix, then fuzzily.
+
+    Parameters
+    ----------
+
+    path : str, optional
+        Path to gazetteer CSV file which has "name", "longitude" and
+        "latitude" columns.
+    countries : bool or str, default True
+        Whether to include countries (common, official and alternative
+        names and ISO 3166-1 alpha-2 / alpha-3 codes) from bundled data.
+        Path to JSON file which has the same format as the bundled
+        countries.json is also accepted.
+    fuzzy : bool, default True
+        Whether to match similar names when no name is matched. Names
+        which have the different first character are not matched.
+    cutoff : float, default 0.8
+        Minimum similarity (0 to 1) of the fuzzy match.
+
+    >>> cesiumpy.geocode.set_geocoder(cesiumpy.geocode.GazetteerGeocoder())
+    """
+
+    def __init__(self, path=None, countries=True, fuzzy=True, cutoff=0.8):
+        self.fuzzy = fuzzy
+        self.cutoff = cutoff
+
+        # hash index, normalized name -> location
+        self._index = {}
+        if countries is True:
+            from cesiumpy.data.country import data_path
+            countries = os.path.join(data_path, 'countries.json')
+        if countries:
+            self._load_countries(countries)
+        if path is not None:
+            self._load_csv(path)
+        # sorted names for prefix search
+        self._names = sorted(self._index)
+        # names grouped by the first character for fuzzy search
+        self._initials = collections.defaultdict(list)
+        for name in self._names:
+            self._initials[name[0]].append(name)
+
+    def _add(self, name, location):
+        key = _normalize_name(name)
+        # prior entry has priority
+        if key != '' and key not in self._index:
+            self._index[key] = location
+
+    def _load_countries(self, path):
+        if not os.path.exists(path):
+            msg = "Unable to load country data, file not found: '{path}'"
+            raise ValueError(msg.format(path=path))
+
+        with io.open(path, encoding='utf-8') as f:
+            data = json.load(f)
+
+        # codes and official names have priority over alternative names
+        for entry in data:
+            lat, lon = entry['latlng']
+            loc = GazetteerLocation(entry['name']['common'], float(lon), float(lat))
+            for name in (entry['cca3'], entry['cca2'], entry['name']['common'],
+                         entry['name']['official']):
+                self._add(name, loc)
+        for entry in data:
+            lat, lon = entry['latlng']
+            loc = GazetteerLocation(entry['name']['common'], float(lon), float(lat))
+            for name in entry.get('altSpellings', []):
+                self._add(name, loc)
+
+    def _load_csv(self, path):
+        with io.open(path, encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = [h.strip().lower() for h in next(reader)]
+            try:
+                iname, ilon, ilat = [header.index(c) for c in ('name', 'longitude', 'latitude')]
+            except ValueError:
+                msg = 'gazetteer must have name, longitude and latitude columns: {x}'
+                raise ValueError(msg.format(x=header))
+            for row in reader:
+                if len(row) == 0:
+                    continue
+                loc = GazetteerLocation(row[iname], float(row[ilon]), float(row[ilat]))
+                self._add(row[iname], loc)
+
+    def __len__(self):
+        return len(self._index)
+
+    def geocode(self, query):
+        """
+        Return GazetteerLocation which has address, longitude and latitude,
+        or None if the query is not found.
+        """
+        key = _normalize_name(query)
+        if key == '':
+            return None
+
+        loc = self._index.get(key)
+        if loc is not None:
+            return loc
+
+        matched, loc = self._prefix_match(key)
+        if matched:
+            # None if ambiguous
+            return loc
+
+        if self.fuzzy:
+            # compare with names which have the same first character,
+            # comparing with all names is too slow
+            matched = difflib.get_close_matches(key, self._initials.get(key[0], []),
+                                                n=1, cutoff=self.cutoff)
+            if len(matched) > 0:
+                return self._index[matched[0]]
+        return None
+
+    def _prefix_match(self, key):
+        """
+        Return a tuple of (matched, location). location is None if names
+        starting with key refer different locations.
+        """
+        start = bisect.bisect_left(self._names, key)
+        loc = None
+        for i in range(start, len(self._names)):
+            name = self._names[i]
+            if not name.startswith(key):
+                break
+            if loc is None:
+                loc = self._index[name]
+            elif self._index[name] != loc:
+                return True, None
+        return loc is not None, loc
+
+
+def _normalize_name(name):
+    return re.sub(r'\s+', ' ', name.strip().lower())
+
+
+class _TokenBucket(object):
+    """
+    Token bucket to limit the number of requests per second
+
+    Parameters
+    ----------
+
+    rate : float
+        Number of tokens added per second
+    capacity : float, optional
+        Maximum number of tokens, allows bursts up to it. Default is
+        the same as rate (at least 1).
+    """
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError('rate must be positive: {x}'.format(x=rate))
+        self.rate = float(rate)
+        self.capacity = max(float(rate), 1.) if capacity is None else float(capacity)
+        self._tokens = self.capacity
+        self._updated = time.time()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """ block until a token is available """
+        while True:
+            with self._lock:
+                now = time.time()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _transient_errors():
+    """
+    Return tuple of geopy errors which may succeed on retry
+    """
+    try:
+        import geopy.exc
+    except ImportError:
+        # custom geocoder may be used without geopy
+        return ()
+    return (geopy.exc.GeocoderTimedOut, geopy.exc.GeocoderUnavailable)
+
+
+def geocode_many(names, max_workers=4, rate=None, retries=3, backoff=0.5):
+    """
+    Geocode names concurrently
+
+    Parameters
+    ----------
+
+    names : list of str
+        Location names to be geocoded
+    max_workers : int, default 4
+        Number of threads to request the geocoder
+    rate : float, optional
+        Maximum number of requests per second. If None, not limited.
+    retries : int, default 3
+        Number of retries when the geocoder times out or the service is
+        unavailable. The error is raised if all retries fail. Other errors
+        are raised immediately.
+    backoff : float, default 0.5
+        Seconds to wait before the first retry, doubled on every retry.
+
+    Returns
+    -------
+    list of tuple
+        (longitude, latitude) of each name, None if it cannot be geocoded.
+    """
+    results = {}
+    queries = []
+    for name in names:
+        if name in results:
+            continue
+        # cached results don't consume the rate
+        found, value = _CACHE.get(name)
+        if found:
+            results[name] = value
+        else:
+            results[name] = None
+            queries.append(name)
+
+    if len(queries) > 0:
+        geocoder = get_geocoder()
+        bucket = None if rate is None else _TokenBucket(rate)
+        transient = _transient_errors()
+
+        def _request(query):
+            for i in range(retries + 1):
+                if bucket is not None:
+                    bucket.acquire()
+                try:
+                    loc = geocoder.geocode(query)
+                    break
+                except transient:
+                    if i == retries:
+                        raise
+                    time.sleep(backoff * 2 ** i)
+            value = None if loc is None else (loc.longitude, loc.latitude)
+            _CACHE.set(query, value)
+            return value
+
+        if len(queries) == 1 or max_workers <= 1:
+            values = [_request(q) for q in queries]
+        else:
+            # not to import multiprocessing on importing cesiumpy
+            from multiprocessing.pool import ThreadPool
+            pool = ThreadPool(min(max_workers, len(queries)))
+            try:
+                values = pool.map(_request, queries)
+            finally:
+                pool.close()
+                pool.join()
+        results.update(zip(queries, values))
+
+    return [results[name] for name in names]
 
 
 def _maybe_geocode(x, height=None):
@@ -18,14 +499,29 @@ def _maybe_geocode(x, height=None):
     height can be used to create base data for Cartesian3
     """
     if isinstance(x, six.string_types):
-        loc = _GEOCODER.geocode(x)
+        loc = _geocode(x)
         if loc is not None:
             if height is None:
                 # return x, y order
-                return loc.longitude, loc.latitude
+                return loc
             else:
-                return loc.longitude, loc.latitude, height
+                return loc + (height, )
+    elif hasattr(x, 'dtype') and x.dtype.kind in 'iuf':
+        # numeric array never contains location names
+        return x
     elif com.is_listlike(x):
-        return [_maybe_geocode(e) for e in x]
+        # geocode str elements at once
+        names = [e for e in x if isinstance(e, six.string_types)]
+        locs = dict(zip(names, geocode_many(names))) if len(names) > 0 else {}
+
+        results = []
+        for e in x:
+            if isinstance(e, six.string_types):
+                loc = locs[e]
+                # height is not used for list elements
+                results.append(e if loc is None else loc)
+            else:
+                results.append(_maybe_geocode(e))
+        return results
 
     return x
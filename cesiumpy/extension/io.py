@@ -3,42 +3,358 @@
 
 from __future__ import unicode_literals
 
+import codecs
+import collections
+import itertools
 import json
+import multiprocessing
+import re
+import six
 
 from cesiumpy.extension.shapefile import to_entity
 import cesiumpy.util.common as com
 
 
-def read_geojson(path):
+def _to_entities(sp, geometry, simplify=None):
+    """ convert GeoJSON geometry mapping to list of entities """
+    shape = sp.shape(geometry)
+    result = to_entity(shape, simplify=simplify)
+    if isinstance(result, list):
+        return result
+    return [result]
 
+
+def read_geojson(path, n_jobs=None, simplify=None):
+    """
+    Read GeoJSON file as a list of entities.
+
+    Parameters
+    ----------
+
+    path : str
+        Path to GeoJSON file.
+    n_jobs : int, optional
+        Number of processes to convert geometries. -1 uses all CPUs.
+        Default converts in the current process.
+    simplify : float, optional
+        Tolerance in degrees to simplify lines and polygons. The number of
+        removed vertices is stored in ``removed_vertices`` of each entity.
+    """
     sp = com._check_package('shapely.geometry')
 
     with open(path) as f:
         geos = json.load(f)
 
     # shapely can't parse featurecollection directly
-    results = []
-    for feature in geos['features']:
-        shape = sp.shape(feature['geometry'])
-        result = to_entity(shape)
-        if isinstance(result, list):
-            results.extend(result)
+    geometries = (feature['geometry'] for feature in geos['features'])
+    return _convert_geometries(sp, geometries, n_jobs=n_jobs, simplify=simplify)
+
+
+def iter_geojson(path, chunksize=1 << 20, simplify=None):
+    """
+    Iterate over entities in GeoJSON file, feature by feature.
+
+    The file is parsed incrementally, thus only a single feature is held
+    in memory at once regardless of the file size. The result can be
+    passed to ``viewer.entities.add`` directly.
+
+    Parameters
+    ----------
+
+    path : str
+        Path to GeoJSON file.
+    chunksize : int, default 1048576
+        Number of characters to read from the file at once.
+    simplify : float, optional
+        Tolerance in degrees to simplify lines and polygons.
+    """
+    sp = com._check_package('shapely.geometry')
+
+    with codecs.open(path, encoding='utf-8') as f:
+        for feature in _iter_geojson_features(f, chunksize):
+            geometry = feature.get('geometry')
+            if geometry is None:
+                continue
+            for entity in _to_entities(sp, geometry, simplify=simplify):
+                yield entity
+
+
+def _iter_geojson_features(f, chunksize):
+    """
+    Iterate over features in GeoJSON file. Single Feature or geometry
+    is regarded as a FeatureCollection which has one feature.
+    """
+    reader = _JSONStreamReader(f, chunksize)
+    others = {}
+    has_features = False
+
+    reader.expect('{')
+    for _ in reader.iter_items('}'):
+        key = reader.decode()
+        reader.expect(':')
+        if key == 'features':
+            has_features = True
+            reader.expect('[')
+            for _ in reader.iter_items(']'):
+                yield reader.decode()
         else:
-            results.append(result)
-    return results
+            others[key] = reader.decode()
+
+    if reader.peek() != '':
+        raise ValueError('Extra data after GeoJSON object')
+
+    if not has_features:
+        if others.get('type') == 'Feature':
+            yield others
+        elif 'type' in others:
+            yield {'type': 'Feature', 'geometry': others}
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class _JSONStreamReader(object):
+    """ Decode JSON values one by one, reading the file chunk by chunk """
+
+    def __init__(self, f, chunksize):
+        self._f = f
+        self._chunksize = chunksize
+        self._decoder = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def _read(self, size):
+        chunk = self._f.read(size)
+        if not chunk:
+            self._eof = True
+        # drop the consumed part to keep the buffer small
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+
+    def peek(self):
+        """ skip whitespaces and return the next character, '' at the end """
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if self._eof:
+                return ''
+            self._read(self._chunksize)
+
+    def expect(self, chars):
+        """ consume one of chars and return it """
+        c = self.peek()
+        if c == '' or c not in chars:
+            msg = 'Expecting {chars} at position {pos}: {c!r}'
+            raise ValueError(msg.format(chars=' or '.join(chars),
+                                        pos=self._pos, c=c))
+        self._pos += 1
+        return c
+
+    def iter_items(self, close):
+        """
+        Iterate over elements of array or object whose opening bracket is
+        already consumed. The caller must consume an element per iteration.
+        """
+        if self.peek() == close:
+            self._pos += 1
+            return
+        while True:
+            yield
+            if self.expect(',' + close) == close:
+                return
+
+    def decode(self):
+        """ decode the next JSON value """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except ValueError:
+                if self._eof:
+                    raise
+                value, end = None, len(self._buf)
+
+            # incomplete value, or number which may continue in the next chunk
+            if end == len(self._buf) and not self._eof:
+                # read at least the current length to avoid quadratic re-parsing
+                self._read(max(self._chunksize, len(self._buf) - self._pos))
+                continue
+            self._pos = end
+            return value
+
 
+def read_shape(path, n_jobs=None, bbox=None, where=None, limit=None,
+               simplify=None):
+    """
+    Read Shapefile as a list of entities.
 
-def read_shape(path):
+    Records are filtered before geometries are converted, thus unused
+    records don't have conversion cost.
+
+    Parameters
+    ----------
+
+    path : str
+        Path to Shapefile.
+    n_jobs : int, optional
+        Number of processes to convert geometries. -1 uses all CPUs.
+        Default converts in the current process.
+    bbox : tuple, optional
+        (minx, miny, maxx, maxy) to read records which intersect with it.
+        Passed to fiona's spatial filter.
+    where : callable or str, optional
+        Callable which receives properties of each record and returns
+        whether to read it. str is passed to fiona as SQL WHERE clause.
+    limit : int, optional
+        Maximum number of records to read.
+    simplify : float, optional
+        Tolerance in degrees to simplify lines and polygons. The number of
+        removed vertices is stored in ``removed_vertices`` of each entity.
+    """
     sp = com._check_package('shapely.geometry')
     fiona = com._check_package('fiona')
 
-    results = []
+    filters = {}
+    if bbox is not None:
+        if not com.is_listlike(bbox) or len(bbox) != 4:
+            msg = 'bbox must be a list-like of (minx, miny, maxx, maxy): {x}'
+            raise ValueError(msg.format(x=bbox))
+        filters['bbox'] = tuple(bbox)
+    if isinstance(where, six.string_types):
+        filters['where'] = where
+        where = None
+    elif where is not None and not callable(where):
+        msg = 'where must be callable or str: {x}'
+        raise ValueError(msg.format(x=where))
+
     with fiona.open(path) as f:
-        for shape in f:
-            shape = sp.shape(shape['geometry'])
-            result = to_entity(shape)
-            if isinstance(result, list):
-                results.extend(result)
+        records = f.filter(**filters) if filters else iter(f)
+        if where is not None:
+            records = (r for r in records if where(r['properties']))
+        if limit is not None:
+            records = itertools.islice(records, limit)
+        geometries = (r['geometry'] for r in records)
+        return _convert_geometries(sp, geometries, n_jobs=n_jobs,
+                                   simplify=simplify)
+
+
+# --------------------------------------------------
+# Parallel conversion
+# --------------------------------------------------
+
+# number of geometries passed to a worker at once
+_CHUNKSIZE = 1000
+
+
+def _convert_geometries(sp, geometries, n_jobs=None, simplify=None):
+    """
+    Convert iterable of GeoJSON-like geometries to list of entities,
+    preserving the order. With n_jobs, ProcessPoolExecutor workers convert
+    chunks of geometries to coordinates arrays, and entities are created
+    from them. Chunks are submitted as results are consumed, not to hold
+    all geometries on memory.
+
+    Workers only import this module, thus it works with the spawn start
+    method (default on Windows and macOS), where the calling script must
+    be guarded by ``if __name__ == '__main__':``.
+    """
+    if n_jobs is None or n_jobs == 1:
+        results = []
+        for geometry in geometries:
+            results.extend(_to_entities(sp, geometry, simplify=simplify))
+        return results
+
+    if n_jobs < 0:
+        n_jobs = max(multiprocessing.cpu_count() + 1 + n_jobs, 1)
+    elif n_jobs == 0:
+        raise ValueError('n_jobs must not be 0')
+
+    # fiona's Geometry is converted to mapping to be pickled
+    geometries = (getattr(g, '__geo_interface__', g) for g in geometries)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    results = []
+    pending = collections.deque()
+
+    def _consume():
+        chunk = pending.popleft().result()
+        results.extend(_coordinates_to_entity(*values) for values in chunk)
+
+    with ProcessPoolExecutor(n_jobs) as executor:
+        try:
+            for chunk in _iter_chunks(geometries, _CHUNKSIZE):
+                pending.append(executor.submit(_geometries_to_coordinates,
+                                               (chunk, simplify)))
+                # keep workers busy while limiting chunks in flight
+                if len(pending) >= 2 * n_jobs:
+                    _consume()
+            while len(pending) > 0:
+                _consume()
+        finally:
+            for future in pending:
+                future.cancel()
+    return results
+
+
+def _iter_chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+def _geometries_to_coordinates(task):
+    """
+    Convert list of geometries to list of (kind, coordinates, removed)
+    tuples, run in worker processes. Multi geometries are splitted to its
+    parts. removed is the number of vertices removed by simplification.
+    """
+    from cesiumpy.extension.simplify import simplify as simplify_coordinates
+
+    np = com._check_package('numpy')
+    sp = com._check_package('shapely.geometry')
+
+    geometries, simplify = task
+    results = []
+    for geometry in geometries:
+        shape = sp.shape(geometry)
+        parts = getattr(shape, 'geoms', [shape])
+        for part in parts:
+            if isinstance(part, sp.Point):
+                results.append(('point', np.asarray(part.coords[0]), 0))
+                continue
+            elif isinstance(part, (sp.LineString, sp.LinearRing)):
+                kind, coordinates = 'line', part.coords
+            elif isinstance(part, sp.Polygon):
+                kind, coordinates = 'polygon', part.exterior.coords
             else:
-                results.append(result)
+                msg = 'Unable to convert to cesiumpy entity: {shape}'
+                raise ValueError(msg.format(shape=shape))
+
+            # (N, 2) or (N, 3) array, heights are passed to entities
+            width = 3 if part.has_z else 2
+            coordinates = np.asarray(coordinates, dtype=np.float64).reshape(-1, width)
+            removed = 0
+            if simplify is not None:
+                coordinates, removed = simplify_coordinates(coordinates, simplify,
+                                                            closed=kind == 'polygon')
+            results.append((kind, coordinates, removed))
     return results
+
+
+def _coordinates_to_entity(kind, coordinates, removed):
+    from cesiumpy.entities.entity import Point, Polyline, Polygon
+    if kind == 'point':
+        return Point(position=coordinates.tolist())
+    elif kind == 'line':
+        entity = Polyline(positions=coordinates)
+    else:
+        entity = Polygon(hierarchy=coordinates)
+    if removed > 0:
+        entity.removed_vertices = removed
+    return entity
@@ -3,8 +3,6 @@
 
 from __future__ import unicode_literals
 
-import itertools
-
 import cesiumpy
 
 # --------------------------------------------------
@@ -40,28 +38,30 @@ except ImportError:
 # Convert shaply instances to Entity
 # --------------------------------------------------
 
-def to_entity(shape):
+def to_entity(shape, simplify=None):
     """
     Convert shapely.geometry to corresponding entities.
     Result may be a list if geometry is consists from multiple instances.
+
+    simplify is the tolerance in degrees to simplify lines and polygons.
     """
     if isinstance(shape, ShapelyMultiPoint):
-        return [cesiumpy.Point(position=e) for e in shape]
+        return [cesiumpy.Point(position=e) for e in shape.geoms]
 
     elif isinstance(shape, ShapelyPoint):
         return cesiumpy.Point(position=shape)
 
     elif isinstance(shape, ShapelyMultiLineString):
-        return [cesiumpy.Polyline(positions=e) for e in shape]
+        return [cesiumpy.Polyline(positions=e, simplify=simplify) for e in shape.geoms]
 
     elif isinstance(shape, (ShapelyLineString, ShapelyLinearRing)):
-        return cesiumpy.Polyline(positions=shape)
+        return cesiumpy.Polyline(positions=shape, simplify=simplify)
 
     elif isinstance(shape, ShapelyMultiPolygon):
-        return [cesiumpy.Polygon(hierarchy=e) for e in shape]
+        return [cesiumpy.Polygon(hierarchy=e, simplify=simplify) for e in shape.geoms]
 
     elif isinstance(shape, ShapelyPolygon):
-        return cesiumpy.Polygon(hierarchy=shape)
+        return cesiumpy.Polygon(hierarchy=shape, simplify=simplify)
 
     msg = 'Unable to convert to cesiumpy entity: {shape}'.format(shape=shape)
     raise ValueError(msg)
@@ -84,7 +84,8 @@ def _maybe_shapely_line(x):
     if isinstance(x, ShapelyMultiLineString):
         raise NotImplementedError(x)
     elif isinstance(x, (ShapelyLineString, ShapelyLinearRing)):
-        return list(itertools.chain(*x.coords[:]))
+        # list of coordinates tuples, which may have heights
+        return list(x.coords)
     return x
 
 
@@ -98,5 +99,5 @@ def _maybe_shapely_polygon(x):
 
     results = []
     for p in polygons:
-        results.extend(list(itertools.chain(*p.exterior.coords)))
+        results.extend(p.exterior.coords)
     return results
@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+from __future__ import unicode_literals
+
+import cesiumpy.util.common as com
+
+
+def simplify(coordinates, tolerance, method='douglas-peucker', closed=False):
+    """
+    Simplify coordinates of line or polygon ring
+
+    Parameters
+    ----------
+
+    coordinates : array-like
+        (N, 2) or (N, 3) shaped coordinates. Only longitude and latitude
+        are used to simplify.
+    tolerance : float
+        For 'douglas-peucker', maximum distance between the original and
+        simplified line in degrees. For 'visvalingam', minimum triangle
+        area of kept vertices in square degrees.
+    method : {'douglas-peucker', 'visvalingam'}, default 'douglas-peucker'
+        Simplification algorithm.
+    closed : bool, default False
+        Whether the coordinates are a polygon ring. Rings keep at least
+        3 vertices (plus closing vertex if exists), lines keep both ends.
+
+    Returns
+    -------
+
+    simplified : numpy.ndarray
+        Kept coordinates, with the same number of columns as the input.
+    removed : int
+        Number of removed vertices.
+    """
+    np = com._check_package('numpy')
+
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    if coordinates.ndim != 2 or coordinates.shape[1] not in (2, 3):
+        msg = 'coordinates must be (N, 2) or (N, 3) shaped array: {x}'
+        raise ValueError(msg.format(x=coordinates.shape))
+
+    if method == 'douglas-peucker':
+        mask = douglas_peucker(coordinates, tolerance, closed=closed)
+    elif method == 'visvalingam':
+        mask = visvalingam(coordinates, tolerance, closed=closed)
+    else:
+        msg = "method must be 'douglas-peucker' or 'visvalingam': {x}"
+        raise ValueError(msg.format(x=method))
+
+    if mask.all():
+        return coordinates, 0
+    return coordinates[mask], int(len(mask) - mask.sum())
+
+
+def _min_vertices(closed):
+    # ring needs 3 vertices and the closing vertex
+    return 4 if closed else 2
+
+
+def douglas_peucker(coordinates, tolerance, closed=False):
+    """
+    Return boolean mask of vertices kept by Douglas-Peucker algorithm.
+    Distances from each segment are computed for all of its vertices at once.
+    """
+    np = com._check_package('numpy')
+
+    xy = np.asarray(coordinates, dtype=np.float64)[:, :2]
+    n = len(xy)
+    mask = np.ones(n, dtype=bool)
+    if n <= _min_vertices(closed):
+        return mask
+
+    keep = [0, n - 1]
+    if closed:
+        # start and end are the same vertex in a closed ring, thus keep the
+        # farthest vertex and the farthest one from that diagonal
+        first = int(_segment_distance(xy, xy[0], xy[0]).argmax())
+        second = int(_segment_distance(xy, xy[0], xy[first]).argmax())
+        keep = sorted(set(keep + [first, second]))
+
+    mask[:] = False
+    mask[keep] = True
+    stack = list(zip(keep[:-1], keep[1:]))
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        distance = _segment_distance(xy[start + 1:end], xy[start], xy[end])
+        i = int(distance.argmax())
+        if distance[i] > tolerance:
+            i += start + 1
+            mask[i] = True
+            stack.append((start, i))
+            stack.append((i, end))
+    return mask
+
+
+def _segment_distance(points, start, end):
+    """ distances from points to the segment between start and end """
+    np = com._check_package('numpy')
+
+    direction = end - start
+    length = direction.dot(direction)
+    if length == 0:
+        projected = start
+    else:
+        t = ((points - start).dot(direction) / length).clip(0, 1)
+        projected = start + t[:, np.newaxis] * direction
+    diff = points - projected
+    return np.sqrt((diff ** 2).sum(axis=1))
+
+
+def visvalingam(coordinates, tolerance, closed=False):
+    """
+    Return boolean mask of vertices kept by Visvalingam-Whyatt algorithm.
+
+    Rather than removing vertices one by one, vertices whose effective area
+    is a local minimum and smaller than tolerance are removed at once, then
+    areas of the remaining vertices are recomputed.
+    """
+    np = com._check_package('numpy')
+
+    xy = np.asarray(coordinates, dtype=np.float64)[:, :2]
+    n = len(xy)
+    min_vertices = _min_vertices(closed)
+    index = np.arange(n)
+
+    while len(index) > min_vertices:
+        p = xy[index]
+        a = p[1:-1] - p[:-2]
+        b = p[2:] - p[:-2]
+        area = np.abs(a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]) / 2.
+
+        # adjacent vertices can't be local minimums at the same time
+        left = np.concatenate([[np.inf], area[:-1]])
+        right = np.concatenate([area[1:], [np.inf]])
+        remove = (area < tolerance) & (area < left) & (area <= right)
+        if not remove.any():
+            break
+
+        excess = len(index) - min_vertices
+        if remove.sum() > excess:
+            candidates = np.flatnonzero(remove)
+            candidates = candidates[area[candidates].argsort()[:excess]]
+            remove[:] = False
+            remove[candidates] = True
+
+        keep = np.ones(len(index), dtype=bool)
+        keep[1:-1][remove] = False
+        index = index[keep]
+
+    mask = np.zeros(n, dtype=bool)
+    mask[index] = True
+    return mask
+
+
+def level_of_detail(entities, levels):
+    """
+    Create multiple resolutions of Polygon or Polyline, each of them is
+    visible only in its distance range from the camera.
+
+    Parameters
+    ----------
+
+    entities : Polygon, Polyline or list of them
+        Entities to create resolutions.
+    levels : list of (distance, tolerance) tuples
+        Each resolution is visible from its distance in meters until the
+        distance of the next level. Distances must be increasing. Tolerance
+        in degrees is used to simplify by Douglas-Peucker algorithm, None
+        uses the original positions.
+
+    Returns
+    -------
+
+    entities : list
+        Entities with distanceDisplayCondition. When a level has the same
+        vertices as the previous level, the previous range is extended
+        rather than adding a duplicate.
+
+    Examples
+    --------
+
+    >>> levels = [(0, None), (1e5, 0.001), (1e6, 0.01), (5e6, 0.1)]
+    >>> viewer.entities.add(level_of_detail(polygons, levels))
+    """
+    from cesiumpy.entities.condition import DistanceDisplayCondition
+    from cesiumpy.entities.entity import Polygon, Polyline, _simplify_positions
+
+    if not com.is_listlike(levels) or len(levels) == 0:
+        msg = 'levels must be a list of (distance, tolerance): {x}'
+        raise ValueError(msg.format(x=levels))
+    distances = [distance for distance, _ in levels]
+    if any(left >= right for left, right in zip(distances[:-1], distances[1:])):
+        msg = 'distances of levels must be increasing: {x}'
+        raise ValueError(msg.format(x=distances))
+    fars = distances[1:] + [None]
+
+    if not com.is_listlike(entities):
+        entities = [entities]
+
+    results = []
+    for entity in entities:
+        if isinstance(entity, Polygon):
+            key, closed = 'hierarchy', True
+        elif isinstance(entity, Polyline):
+            key, closed = 'positions', False
+        else:
+            msg = 'entities must be Polygon or Polyline: {x}'
+            raise ValueError(msg.format(x=entity))
+
+        original = getattr(entity, key)
+        previous = None
+        for (near, tolerance), far in zip(levels, fars):
+            if tolerance is None:
+                positions, removed = original, 0
+            else:
+                positions, removed = _simplify_positions(original, tolerance,
+                                                         closed=closed)
+
+            if previous is not None and previous.removed_vertices == removed:
+                # the same resolution as the previous level
+                condition = previous.distanceDisplayCondition
+                previous.distanceDisplayCondition = DistanceDisplayCondition(condition.near, far)
+                continue
+
+            result = entity.copy()
+            setattr(result, key, positions)
+            result.removed_vertices = removed
+            result.distanceDisplayCondition = DistanceDisplayCondition(near, far)
+            results.append(result)
+            previous = result
+    return results
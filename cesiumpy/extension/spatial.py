@@ -4,7 +4,9 @@
 from __future__ import unicode_literals
 
 import collections
+import itertools
 
+from cesiumpy.entities.collection import PolygonCollection
 from cesiumpy.entities.entity import Polygon, Polyline
 import cesiumpy.util.common as com
 
@@ -50,28 +52,125 @@ class Voronoi(_Spatial):
         coordinates = self._get_coordinates()
         polygons = []
         for c in coordinates:
+            if c is None:
+                polygons.append(None)
+                continue
             try:
                 polygons.append(Polygon(hierarchy=c))
             except TypeError:
                 polygons.append(None)
         return polygons
 
+    def _get_bounds(self):
+        """ return center, radius and bounds to clip regions """
+        # calculate the center of the area
+        center = self.vor.points.mean(axis=0)
+        span = self._np.ptp(self.vor.points, axis=0)
+        radius = span.max()
+        span = span / 1.5
+        bounds = (center[0] - span[0], center[1] - span[1],
+                  center[0] + span[0], center[1] + span[1])
+        return center, radius, bounds
+
     def _get_coordinates(self):
+        """
+        Return list of closed region coordinates as (N, 2) shaped arrays,
+        which are clipped by the bounds. None if the region is out of bounds.
+
+        Infinite ridges are closed at once using ridge arrays, then all
+        regions are clipped by vectorized shapely functions.
+        """
+        shapely = com._check_package('shapely')
+        if not hasattr(shapely, 'intersection'):
+            # shapely < 2 doesn't have vectorized functions
+            return self._get_coordinates_loop()
+
+        np = self._np
+        center, radius, bounds = self._get_bounds()
+
+        points = self.vor.points
+        vertices = self.vor.vertices
+        ridge_points = np.asarray(self.vor.ridge_points, dtype=np.int64)
+        ridge_vertices = np.asarray(self.vor.ridge_vertices, dtype=np.int64)
+
+        # compute the missing endpoint of each infinite ridge, which is shared
+        # by regions of both points
+        infinite = np.flatnonzero((ridge_vertices < 0).any(axis=1))
+        p1, p2 = ridge_points[infinite].T
+        t = points[p2] - points[p1]                                 # tangent
+        t /= np.linalg.norm(t, axis=1)[:, np.newaxis]
+        n = np.column_stack([-t[:, 1], t[:, 0]])                    # normal
+        midpoint = (points[p1] + points[p2]) / 2.
+        direction = np.sign(((midpoint - center) * n).sum(axis=1))[:, np.newaxis] * n
+        far_points = vertices[ridge_vertices[infinite].max(axis=1)] + direction * radius
+
+        all_vertices = np.concatenate([vertices, far_points])
+        ridge_vertices = ridge_vertices.copy()
+        ridge_vertices[infinite, ridge_vertices[infinite].argmin(axis=1)] = \
+            len(vertices) + np.arange(len(infinite))
+
+        # a region consists of vertices of ridges around its point, finite
+        # vertices appear twice as they are shared by 2 ridges. sort and
+        # drop adjacent duplicates, which is faster than np.unique
+        owner = np.repeat(ridge_points, 2, axis=1).ravel()
+        vertex = np.tile(ridge_vertices, (1, 2)).ravel()
+        key = np.sort(owner * len(all_vertices) + vertex)
+        key = key[np.concatenate([[True], key[1:] != key[:-1]])]
+        owner, vertex = np.divmod(key, len(all_vertices))
+
+        # sort vertices of each region counterclockwise
+        coordinates = all_vertices[vertex]
+        counts = np.bincount(owner, minlength=len(points))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cx = np.bincount(owner, weights=coordinates[:, 0], minlength=len(points)) / counts
+            cy = np.bincount(owner, weights=coordinates[:, 1], minlength=len(points)) / counts
+        angles = np.arctan2(coordinates[:, 1] - cy[owner], coordinates[:, 0] - cx[owner])
+        # owner is already sorted, add the angle scaled to [0, 1) as fraction
+        order = np.argsort(owner + (angles + np.pi) / (2 * np.pi + 1e-6), kind='stable')
+        owner, coordinates = owner[order], coordinates[order]
+
+        # regions which have less than 3 vertices can't be polygons
+        valid = counts >= 3
+        minx, miny, maxx, maxy = bounds
+        x, y = coordinates[:, 0], coordinates[:, 1]
+        outside = (x < minx) | (x > maxx) | (y < miny) | (y > maxy)
+        clip = valid & (np.bincount(owner, weights=outside, minlength=len(points)) > 0)
+
+        results = [None] * len(points)
+
+        # regions inside of the bounds only need to be closed
+        inside = valid & ~clip
+        mask = inside[owner]
+        c = coordinates[mask]
+        ends = np.cumsum(counts[inside])
+        c = np.insert(c, ends, c[ends - counts[inside]], axis=0)
+        _set_slices(results, np.flatnonzero(inside), c, ends + np.arange(1, len(ends) + 1))
+
+        # clip regions crossing the bounds at once
+        mask = clip[owner]
+        indices = (np.cumsum(clip) - 1)[owner[mask]]
+        rings = shapely.linearrings(coordinates[mask], indices=indices)
+        regions = shapely.intersection(shapely.polygons(rings), shapely.box(*bounds))
+        # clipped convex regions are polygons, otherwise out of bounds
+        polygon = (shapely.get_type_id(regions) == 3) & ~shapely.is_empty(regions)
+        c, index = shapely.get_coordinates(regions[polygon], return_index=True)
+        ends = np.cumsum(np.bincount(index, minlength=polygon.sum()))
+        _set_slices(results, np.flatnonzero(clip)[polygon], c, ends)
+        return results
+
+    def _get_coordinates_loop(self):
+        """
+        Return list of clipped regions as shapely Polygons, which are built
+        one by one
+        """
 
         # based on:
         # http://stackoverflow.com/questions/20515554/colorize-voronoi-diagram
         # http://stackoverflow.com/questions/28665491/getting-a-bounded-polygon-coordinates-from-voronoi-cells
 
-        # calculate the center of the area
-        center = self.vor.points.mean(axis=0)
-        span = self.vor.points.ptp(axis=0)
-        radius = span.max()
-        span = span / 1.5
-
-        bbox = [[center[0] - span[0], center[1] - span[1]],
-                [center[0] + span[0], center[1] - span[1]],
-                [center[0] + span[0], center[1] + span[1]],
-                [center[0] - span[0], center[1] + span[1]]]
+        center, radius, bounds = self._get_bounds()
+        minx, miny, maxx, maxy = bounds
+        bbox = [[minx, miny], [maxx, miny], [maxx, maxy], [minx, maxy]]
         bbox = self._geometry.Polygon(bbox)
 
         # Construct a map containing all ridges for a given point
@@ -130,6 +229,101 @@ class Voronoi(_Spatial):
         return polygons
 
 
+class SphericalVoronoi(_Spatial):
+    """
+    Wrapper for scipy.spatial.SphericalVoronoi
+
+    Regions are computed on the sphere, thus they are correct near the
+    poles and across the antimeridian. Latitudes are regarded as geocentric.
+
+    Parameters
+    ----------
+
+    sv : SphericalVoronoi or list of (longitude, latitude) points
+    """
+
+    def __init__(self, sv):
+
+        if isinstance(sv, self._spatial.SphericalVoronoi):
+            pass
+        else:
+            points = self._np.asarray(sv, dtype=self._np.float64)
+            if points.ndim != 2 or points.shape[1] != 2:
+                msg = "input must be (longitude, latitude) points or SphericalVoronoi instance"
+                raise ValueError(msg)
+            sv = self._spatial.SphericalVoronoi(to_cartesian(points[:, 0], points[:, 1]))
+
+        self.sv = sv
+
+    def get_polygons(self):
+        coordinates, offsets = self._get_coordinates()
+        return [Polygon(hierarchy=coordinates[start:end])
+                for start, end in zip(offsets[:-1], offsets[1:])]
+
+    def get_polygon_collection(self, **kwargs):
+        """
+        Return all regions as a single PolygonCollection. Keyword arguments
+        are passed to PolygonCollection.
+        """
+        coordinates, offsets = self._get_coordinates()
+        return PolygonCollection(coordinates, offsets=offsets, **kwargs)
+
+    def _get_coordinates(self):
+        """
+        Return (N, 2) array of longitude and latitude of all region vertices,
+        and offsets of each region in the array
+        """
+        np = self._np
+
+        # sort vertices of each region counterclockwise
+        self.sv.sort_vertices_of_regions()
+        regions = self.sv.regions
+        counts = np.fromiter((len(r) for r in regions), dtype=np.int64,
+                             count=len(regions))
+        indices = np.fromiter(itertools.chain.from_iterable(regions),
+                              dtype=np.int64, count=counts.sum())
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+
+        vertices = to_lonlat(self.sv.vertices - self.sv.center)
+        return vertices[indices], offsets
+
+
+def to_cartesian(lon, lat):
+    """
+    Convert longitudes and latitudes in degrees to (N, 3) shaped Cartesian
+    coordinates on the unit sphere, whose axes are the same as ECEF
+    """
+    np = com._check_package('numpy')
+
+    lon = np.radians(np.asarray(lon, dtype=np.float64))
+    lat = np.radians(np.asarray(lat, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon),
+                            np.sin(lat)])
+
+
+def to_lonlat(xyz):
+    """
+    Convert (N, 3) shaped Cartesian coordinates to (N, 2) shaped longitudes
+    and latitudes in degrees, the inverse of to_cartesian
+    """
+    np = com._check_package('numpy')
+
+    xyz = np.asarray(xyz, dtype=np.float64)
+    x, y, z = xyz[:, 0], xyz[:, 1], xyz[:, 2]
+    lon = np.degrees(np.arctan2(y, x))
+    lat = np.degrees(np.arctan2(z, np.hypot(x, y)))
+    return np.column_stack([lon, lat])
+
+
+def _set_slices(results, positions, values, ends):
+    """ set values[ends[i - 1]:ends[i]] to results[positions[i]] """
+    start = 0
+    for position, end in zip(positions.tolist(), ends.tolist()):
+        results[position] = values[start:end]
+        start = end
+
+
 class ConvexHull(_Spatial):
 
     """
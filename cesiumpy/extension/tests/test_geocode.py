@@ -1,14 +1,300 @@
 #!/usr/bin/env python
 # coding: utf-8
 
+import os
+import shutil
+import tempfile
+import threading
+import time
 import unittest
 import nose
 
 import geopy
+import geopy.exc
 
 import cesiumpy
 
 
+class _Location(object):
+
+    def __init__(self, longitude, latitude):
+        self.longitude = longitude
+        self.latitude = latitude
+
+
+class _DictGeocoder(object):
+
+    def __init__(self, locations):
+        self.locations = locations
+
+    def geocode(self, query):
+        loc = self.locations.get(query)
+        if loc is not None:
+            return _Location(*loc)
+        return None
+
+
+class TestSetGeocoder(unittest.TestCase):
+
+    def setUp(self):
+        cesiumpy.geocode.get_cache().clear()
+
+    def tearDown(self):
+        cesiumpy.geocode.set_geocoder(None)
+        cesiumpy.geocode.get_cache().clear()
+
+    def test_set_geocoder(self):
+        geocoder = _DictGeocoder({'A': (10., 20.), 'B': (30., 40.)})
+        cesiumpy.geocode.set_geocoder(geocoder)
+        self.assertTrue(cesiumpy.geocode.get_geocoder() is geocoder)
+
+        result = cesiumpy.geocode._maybe_geocode('A')
+        self.assertEqual(result, (10., 20.))
+        result = cesiumpy.geocode._maybe_geocode(['A', 'B', 'C', [1, 2]])
+        self.assertEqual(result, [(10., 20.), (30., 40.), 'C', [1, 2]])
+
+        e = cesiumpy.Point(position='B')
+        exp = """{position : Cesium.Cartesian3.fromDegrees(30.0, 40.0, 0.0), point : {pixelSize : 10.0, color : Cesium.Color.WHITE}}"""
+        self.assertEqual(e.script, exp)
+
+        msg = "geocoder must have geocode method"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.geocode.set_geocoder(1)
+
+    def test_default_geocoder(self):
+        cesiumpy.geocode.set_geocoder(None)
+        self.assertTrue(isinstance(cesiumpy.geocode.get_geocoder(),
+                                   geopy.geocoders.GoogleV3))
+
+
+class _CountingGeocoder(_DictGeocoder):
+
+    def __init__(self, locations):
+        super(_CountingGeocoder, self).__init__(locations)
+        self.count = 0
+
+    def geocode(self, query):
+        self.count += 1
+        return super(_CountingGeocoder, self).geocode(query)
+
+
+class TestGeocodeCache(unittest.TestCase):
+
+    def setUp(self):
+        self.geocoder = _CountingGeocoder({'A': (10., 20.), 'B': (30., 40.)})
+        cesiumpy.geocode.set_geocoder(self.geocoder)
+        self.dirname = tempfile.mkdtemp()
+        self.path = os.path.join(self.dirname, 'geocode.sqlite')
+
+    def tearDown(self):
+        cesiumpy.geocode.set_geocoder(None)
+        cesiumpy.geocode.set_cache()
+        shutil.rmtree(self.dirname)
+
+    def test_memory_cache(self):
+        cache = cesiumpy.geocode.set_cache(maxsize=2)
+        result = cesiumpy.geocode._maybe_geocode(['A', 'A', 'B', 'C', 'C'])
+        self.assertEqual(result, [(10., 20.), (10., 20.), (30., 40.), 'C', 'C'])
+        # duplicated names are geocoded once
+        self.assertEqual(self.geocoder.count, 3)
+        self.assertEqual(cache.cache_info(), (0, 0, 3, 2, 2))
+
+        # miss is also cached
+        self.assertEqual(cesiumpy.geocode._maybe_geocode('C'), 'C')
+        self.assertEqual(self.geocoder.count, 3)
+        self.assertEqual(cache.cache_info(), (1, 0, 3, 2, 2))
+
+        # "A" is removed as least recently used
+        self.assertEqual(cesiumpy.geocode._maybe_geocode('A'), (10., 20.))
+        self.assertEqual(self.geocoder.count, 4)
+
+        cache.clear()
+        self.assertEqual(cache.cache_info(), (0, 0, 0, 2, 0))
+
+    def test_disk_cache(self):
+        cache = cesiumpy.geocode.set_cache(self.path)
+        result = cesiumpy.geocode._maybe_geocode(['A', 'C'])
+        self.assertEqual(result, [(10., 20.), 'C'])
+        self.assertEqual(self.geocoder.count, 2)
+
+        # emulate another process
+        cache = cesiumpy.geocode.set_cache(self.path)
+        result = cesiumpy.geocode._maybe_geocode(['A', 'C', 'A'])
+        self.assertEqual(result, [(10., 20.), 'C', (10., 20.)])
+        self.assertEqual(self.geocoder.count, 2)
+        self.assertEqual(cache.cache_info(), (0, 2, 0, 1024, 2))
+
+    def test_ttl(self):
+        cache = cesiumpy.geocode.set_cache(self.path, ttl=3600, negative_ttl=0)
+        cesiumpy.geocode._maybe_geocode(['A', 'C'])
+        self.assertEqual(self.geocoder.count, 2)
+        time.sleep(0.01)
+        # only the miss is expired
+        cesiumpy.geocode._maybe_geocode(['A', 'C'])
+        self.assertEqual(self.geocoder.count, 3)
+        self.assertEqual(cache.cache_info().misses, 3)
+
+        cesiumpy.geocode.set_cache(self.path, ttl=0)
+        time.sleep(0.01)
+        cesiumpy.geocode._maybe_geocode('A')
+        self.assertEqual(self.geocoder.count, 4)
+
+
+class _FlakyGeocoder(_CountingGeocoder):
+
+    def __init__(self, locations, failures):
+        super(_FlakyGeocoder, self).__init__(locations)
+        self.failures = failures
+        self.lock = threading.Lock()
+
+    def geocode(self, query):
+        with self.lock:
+            if self.failures > 0:
+                self.failures -= 1
+                raise geopy.exc.GeocoderTimedOut('temporary failure')
+        return super(_FlakyGeocoder, self).geocode(query)
+
+
+class TestGeocodeMany(unittest.TestCase):
+
+    def setUp(self):
+        cesiumpy.geocode.set_cache()
+
+    def tearDown(self):
+        cesiumpy.geocode.set_geocoder(None)
+        cesiumpy.geocode.set_cache()
+
+    def test_geocode_many(self):
+        locations = dict(('N{0}'.format(i), (i / 10., i / 20.)) for i in range(100))
+        geocoder = _CountingGeocoder(locations)
+        cesiumpy.geocode.set_geocoder(geocoder)
+
+        names = ['N{0}'.format(i) for i in range(100)] + ['N1', 'X']
+        result = cesiumpy.geocode.geocode_many(names, max_workers=8)
+        exp = [(i / 10., i / 20.) for i in range(100)] + [(0.1, 0.05), None]
+        self.assertEqual(result, exp)
+        self.assertEqual(geocoder.count, 101)
+
+        # cached
+        result = cesiumpy.geocode.geocode_many(names, max_workers=8)
+        self.assertEqual(result, exp)
+        self.assertEqual(geocoder.count, 101)
+
+        self.assertEqual(cesiumpy.geocode.geocode_many([]), [])
+
+    def test_geocode_many_rate(self):
+        locations = dict(('N{0}'.format(i), (1., 2.)) for i in range(10))
+        cesiumpy.geocode.set_geocoder(_CountingGeocoder(locations))
+
+        start = time.time()
+        cesiumpy.geocode.geocode_many(list(locations), max_workers=4, rate=50)
+        # requests up to the rate are allowed as burst
+        self.assertTrue(time.time() - start < 1.)
+
+        bucket = cesiumpy.geocode._TokenBucket(rate=100, capacity=1)
+        start = time.time()
+        for i in range(11):
+            bucket.acquire()
+        self.assertTrue(time.time() - start >= 0.09)
+
+    def test_geocode_many_retry(self):
+        geocoder = _FlakyGeocoder({'A': (1., 2.)}, failures=2)
+        cesiumpy.geocode.set_geocoder(geocoder)
+        result = cesiumpy.geocode.geocode_many(['A'], retries=2, backoff=0.001)
+        self.assertEqual(result, [(1., 2.)])
+
+        cesiumpy.geocode.set_cache()
+        geocoder = _FlakyGeocoder({'A': (1., 2.)}, failures=3)
+        cesiumpy.geocode.set_geocoder(geocoder)
+        with nose.tools.assert_raises(geopy.exc.GeocoderTimedOut):
+            cesiumpy.geocode.geocode_many(['A'], retries=2, backoff=0.001)
+
+    def test_geocode_many_no_retry(self):
+        # non-transient error is raised without retry
+        class _BadGeocoder(_CountingGeocoder):
+            def geocode(self, query):
+                super(_BadGeocoder, self).geocode(query)
+                raise ValueError('bad query')
+
+        geocoder = _BadGeocoder({})
+        cesiumpy.geocode.set_geocoder(geocoder)
+        with nose.tools.assert_raises(ValueError):
+            cesiumpy.geocode.geocode_many(['A'], retries=2, backoff=0.001)
+        self.assertEqual(geocoder.count, 1)
+
+
+class TestGazetteerGeocoder(unittest.TestCase):
+
+    def setUp(self):
+        data_dir = os.path.join(os.path.dirname(__file__), 'data')
+        self.countries = os.path.join(data_dir, 'countries.json')
+        self.gazetteer = os.path.join(data_dir, 'gazetteer.csv')
+
+    def tearDown(self):
+        cesiumpy.geocode.set_geocoder(None)
+        cesiumpy.geocode.get_cache().clear()
+
+    def test_countries(self):
+        geocoder = cesiumpy.geocode.GazetteerGeocoder(countries=self.countries)
+        for name in ['Japan', 'JAPAN', 'jpn', 'JP', 'nippon', ' japan  ']:
+            self.assertEqual(geocoder.geocode(name), ('Japan', 138., 36.))
+
+        loc = geocoder.geocode('United States of America')
+        self.assertEqual((loc.longitude, loc.latitude), (-97., 38.))
+        self.assertEqual(geocoder.geocode(u'République Française'), ('France', 2., 46.))
+
+        # prefix
+        self.assertEqual(geocoder.geocode('Jap'), ('Japan', 138., 36.))
+        self.assertEqual(geocoder.geocode('United'), ('United States', -97., 38.))
+        # ambiguous prefix
+        self.assertEqual(geocoder.geocode('Ja'), None)
+
+        # fuzzy
+        self.assertEqual(geocoder.geocode('Jamaika'), ('Jamaica', -77.5, 18.25))
+        self.assertEqual(geocoder.geocode('Frence'), ('France', 2., 46.))
+        self.assertEqual(geocoder.geocode('xxx'), None)
+        self.assertEqual(geocoder.geocode(''), None)
+
+        geocoder = cesiumpy.geocode.GazetteerGeocoder(countries=self.countries, fuzzy=False)
+        self.assertEqual(geocoder.geocode('Jamaika'), None)
+
+    def test_gazetteer(self):
+        geocoder = cesiumpy.geocode.GazetteerGeocoder(self.gazetteer, countries=False)
+        self.assertEqual(len(geocoder), 4)
+        self.assertEqual(geocoder.geocode('los angeles'), ('Los Angeles', -118.2436849, 34.0522342))
+        self.assertEqual(geocoder.geocode(u'富士山'), (u'富士山', 138.7277777, 35.3605555))
+        self.assertEqual(geocoder.geocode('Las'), ('Las Vegas', -115.1398296, 36.1699412))
+        # prefix is ambiguous
+        self.assertEqual(geocoder.geocode('L'), None)
+        self.assertEqual(geocoder.geocode('Japan'), None)
+
+        geocoder = cesiumpy.geocode.GazetteerGeocoder(self.gazetteer, countries=self.countries)
+        self.assertEqual(len(geocoder), 4 + 17)
+        self.assertEqual(geocoder.geocode('Japan'), ('Japan', 138., 36.))
+
+    def test_gazetteer_entities(self):
+        geocoder = cesiumpy.geocode.GazetteerGeocoder(self.gazetteer, countries=self.countries)
+        cesiumpy.geocode.set_geocoder(geocoder)
+
+        e = cesiumpy.Point(position='Los Angeles')
+        exp = """{position : Cesium.Cartesian3.fromDegrees(-118.2436849, 34.0522342, 0.0), point : {pixelSize : 10.0, color : Cesium.Color.WHITE}}"""
+        self.assertEqual(e.script, exp)
+
+        v = cesiumpy.Viewer(divid='viewertest')
+        v.camera.flyTo('Japan')
+        exp = """widget.camera.flyTo({destination : Cesium.Cartesian3.fromDegrees(138.0, 36.0, 100000.0)});"""
+        self.assertTrue(exp in v.to_html())
+
+    def test_gazetteer_errors(self):
+        msg = "Unable to load country data, file not found"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.geocode.GazetteerGeocoder(countries='xxx.json')
+
+        msg = "gazetteer must have name, longitude and latitude columns"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.geocode.GazetteerGeocoder(self.countries, countries=False)
+
+
 class TestGeocode(unittest.TestCase):
 
     def test_geocode(self):
@@ -3,6 +3,8 @@
 
 import nose
 import os
+import shutil
+import tempfile
 import unittest
 
 import cesiumpy
@@ -25,6 +27,59 @@ class TestIO(unittest.TestCase):
         self.assertTrue(all([isinstance(e, cesiumpy.Polygon) for e in res]))
         self.assertEqual(res[0].script, exp)
 
+    def test_iter_geojson(self):
+        _skip_if_no_shapely()
+
+        path = os.path.join(current_dir, 'data', 'jpn.geo.json')
+        exp = [e.script for e in cesiumpy.io.read_geojson(path)]
+
+        res = cesiumpy.io.iter_geojson(path)
+        self.assertFalse(isinstance(res, list))
+        self.assertEqual([e.script for e in res], exp)
+
+        # feature spans multiple chunks
+        res = cesiumpy.io.iter_geojson(path, chunksize=7)
+        self.assertEqual([e.script for e in res], exp)
+
+        v = cesiumpy.Viewer()
+        v.entities.add(cesiumpy.io.iter_geojson(path), material='red')
+        self.assertEqual(len(v.entities), len(exp))
+        self.assertEqual(v.entities[0].material, cesiumpy.color.RED)
+
+    def test_iter_geojson_variants(self):
+        _skip_if_no_shapely()
+
+        tmpdir = tempfile.mkdtemp()
+        path = os.path.join(tmpdir, 'test.geo.json')
+
+        def _read(content):
+            with open(path, 'w') as f:
+                f.write(content)
+            return [e.script for e in cesiumpy.io.iter_geojson(path, chunksize=3)]
+
+        try:
+            exp = ['{position : Cesium.Cartesian3.fromDegrees(130.0, 30.0, 0.0), point : {pixelSize : 10.0, color : Cesium.Color.WHITE}}',
+                   '{position : Cesium.Cartesian3.fromDegrees(140.5, 40.0, 0.0), point : {pixelSize : 10.0, color : Cesium.Color.WHITE}}']
+            content = """{"features": [
+  {"type": "Feature", "properties": {"a": [1, 2]}, "geometry": {"type": "Point", "coordinates": [130, 30]}},
+  {"type": "Feature", "properties": null, "geometry": null},
+  {"type": "Feature", "properties": {}, "geometry": {"type": "Point", "coordinates": [140.5, 40]}}
+], "type": "FeatureCollection", "bbox": [130, 30, 140.5, 40]}"""
+            self.assertEqual(_read(content), exp)
+            self.assertEqual(_read('{"type": "FeatureCollection", "features": []}'), [])
+
+            # single feature or geometry
+            content = """{"type": "Feature", "geometry": {"type": "Point", "coordinates": [130, 30]}}"""
+            self.assertEqual(_read(content), exp[:1])
+            self.assertEqual(_read("""{"type": "Point", "coordinates": [130, 30]}"""), exp[:1])
+
+            with nose.tools.assert_raises(ValueError):
+                _read('{"type": "FeatureCollection", "features": [{"type": ')
+            with nose.tools.assert_raises(ValueError):
+                _read('{"type": "FeatureCollection" "features": []}')
+        finally:
+            shutil.rmtree(tmpdir)
+
     def test_shape(self):
         _skip_if_no_shapely()
 
@@ -36,6 +91,115 @@ class TestIO(unittest.TestCase):
         self.assertTrue(all([isinstance(e, cesiumpy.Polyline) for e in res]))
         self.assertEqual(res[0].script, exp)
 
+    def test_shape_filter(self):
+        _skip_if_no_shapely()
+
+        path = os.path.join(current_dir, 'data', 'coastl_jpn.shp')
+        exp = [e.script for e in cesiumpy.io.read_shape(path)]
+        self.assertEqual(len(exp), 1204)
+
+        res = [e.script for e in cesiumpy.io.read_shape(path, bbox=(139, 35, 140, 36))]
+        self.assertEqual(len(res), 35)
+        self.assertEqual(res, [e for e in exp if e in res])
+
+        res = cesiumpy.io.read_shape(path, where=lambda p: p['acc'] == 3)
+        self.assertEqual(len(res), 13)
+        res = cesiumpy.io.read_shape(path, where="acc = 3")
+        self.assertEqual(len(res), 13)
+
+        res = cesiumpy.io.read_shape(path, limit=5)
+        self.assertEqual([e.script for e in res], exp[:5])
+
+        res = cesiumpy.io.read_shape(path, bbox=[139, 35, 140, 36],
+                                     where=lambda p: p['acc'] == 1, limit=10)
+        self.assertEqual(len(res), 10)
+
+        msg = 'bbox must be a list-like of \\(minx, miny, maxx, maxy\\): \\[1, 2\\]'
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.io.read_shape(path, bbox=[1, 2])
+
+        msg = 'where must be callable or str: 1'
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.io.read_shape(path, where=1)
+
+    def test_simplify(self):
+        _skip_if_no_shapely()
+
+        path = os.path.join(current_dir, 'data', 'coastl_jpn.shp')
+        exp = cesiumpy.io.read_shape(path)
+        res = cesiumpy.io.read_shape(path, simplify=0.01)
+        self.assertEqual(len(res), len(exp))
+
+        total = sum([len(e.positions.x) // 2 for e in exp])
+        removed = sum([e.removed_vertices for e in res])
+        self.assertTrue(removed > total * 0.8)
+        self.assertEqual(sum([len(e.positions.x) // 2 for e in res]), total - removed)
+
+        # both ends are kept
+        self.assertEqual(list(res[0].positions.x[:2]), exp[0].positions.x[:2])
+        self.assertEqual(list(res[0].positions.x[-2:]), exp[0].positions.x[-2:])
+
+        parallel = cesiumpy.io.read_shape(path, simplify=0.01, n_jobs=2)
+        self.assertEqual([e.script for e in parallel], [e.script for e in res])
+        self.assertEqual([e.removed_vertices for e in parallel],
+                         [e.removed_vertices for e in res])
+
+        path = os.path.join(current_dir, 'data', 'jpn.geo.json')
+        res = cesiumpy.io.read_geojson(path, simplify=0.05)
+        self.assertTrue(all([isinstance(e, cesiumpy.Polygon) for e in res]))
+        self.assertTrue(sum([e.removed_vertices for e in res]) > 0)
+        streamed = cesiumpy.io.iter_geojson(path, simplify=0.05)
+        self.assertEqual([e.script for e in streamed], [e.script for e in res])
+
+    def test_n_jobs(self):
+        _skip_if_no_shapely()
+
+        path = os.path.join(current_dir, 'data', 'jpn.geo.json')
+        exp = [e.script for e in cesiumpy.io.read_geojson(path)]
+        res = cesiumpy.io.read_geojson(path, n_jobs=2)
+        self.assertTrue(all([isinstance(e, cesiumpy.Polygon) for e in res]))
+        self.assertEqual([e.script for e in res], exp)
+
+        path = os.path.join(current_dir, 'data', 'coastl_jpn.shp')
+        exp = [e.script for e in cesiumpy.io.read_shape(path)]
+        res = cesiumpy.io.read_shape(path, n_jobs=-1)
+        self.assertTrue(all([isinstance(e, cesiumpy.Polyline) for e in res]))
+        self.assertEqual([e.script for e in res], exp)
+
+        with nose.tools.assert_raises_regexp(ValueError, 'n_jobs must not be 0'):
+            cesiumpy.io.read_shape(path, n_jobs=0)
+
+    def test_n_jobs_points(self):
+        _skip_if_no_shapely()
+
+        from cesiumpy.extension.io import _convert_geometries
+        import shapely.geometry as sp
+        geometries = [{'type': 'MultiPoint', 'coordinates': [[130, 30], [140, 40.5]]},
+                      {'type': 'Point', 'coordinates': [150, 50, 10]}]
+        exp = [e.script for e in _convert_geometries(sp, geometries)]
+        res = [e.script for e in _convert_geometries(sp, geometries, n_jobs=2)]
+        self.assertEqual(len(res), 3)
+        self.assertEqual(res, exp)
+
+    def test_n_jobs_heights(self):
+        _skip_if_no_shapely()
+
+        from cesiumpy.extension.io import _convert_geometries
+        import shapely.geometry as sp
+        geometries = [{'type': 'LineString', 'coordinates': [[130, 30, 10], [131, 31, 20],
+                                                             [132, 30, 30]]},
+                      {'type': 'Polygon', 'coordinates': [[[130, 30, 5], [131, 30, 5],
+                                                           [131, 31, 5], [130, 30, 5]]]}]
+        exp = [e.script for e in _convert_geometries(sp, geometries)]
+        res = [e.script for e in _convert_geometries(sp, geometries, n_jobs=2)]
+        self.assertEqual(res, exp)
+        self.assertEqual(res[0], """{polyline : {positions : Cesium.Cartesian3.fromDegreesArrayHeights([130.0, 30.0, 10.0, 131.0, 31.0, 20.0, 132.0, 30.0, 30.0])}}""")
+
+        # heights are kept on simplification
+        res = _convert_geometries(sp, geometries, n_jobs=2, simplify=10.)
+        self.assertEqual(res[0].script, """{polyline : {positions : Cesium.Cartesian3.fromDegreesArrayHeights([130.0, 30.0, 10.0, 132.0, 30.0, 30.0])}}""")
+        self.assertEqual(res[0].removed_vertices, 1)
+
 
 if __name__ == '__main__':
     nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+import nose
+import unittest
+
+import cesiumpy
+from cesiumpy.extension.simplify import (douglas_peucker, level_of_detail,
+                                         simplify, visvalingam)
+from cesiumpy.testing import _skip_if_no_numpy
+
+
+class TestSimplify(unittest.TestCase):
+
+    def setUp(self):
+        _skip_if_no_numpy()
+
+    def test_douglas_peucker(self):
+        import numpy as np
+        line = np.array([[0, 0], [1, 0.1], [2, -0.1], [3, 5], [4, 6], [5, 7], [6, 8.1], [7, 9]])
+        res = douglas_peucker(line, 1.)
+        exp = np.array([True, False, True, True, False, False, False, True])
+        self.assert_numpy_array_equal(res, exp)
+
+        # collinear vertex is removed
+        res = douglas_peucker(line, 0.)
+        self.assert_numpy_array_equal(np.flatnonzero(res), np.array([0, 1, 2, 3, 5, 6, 7]))
+        res = douglas_peucker(line, 100.)
+        self.assert_numpy_array_equal(np.flatnonzero(res), np.array([0, 7]))
+
+    def test_douglas_peucker_ring(self):
+        import numpy as np
+        ring = np.array([[0, 0], [1, 0.01], [2, 0], [2, 1], [2, 2], [1, 2], [0, 2], [0, 1], [0, 0]])
+        res = douglas_peucker(ring, 0.1, closed=True)
+        self.assert_numpy_array_equal(np.flatnonzero(res), np.array([0, 2, 4, 6, 8]))
+
+        # closed ring keeps a triangle
+        res = douglas_peucker(ring, 100., closed=True)
+        self.assertEqual(res.sum(), 4)
+        self.assertTrue(res[0] and res[-1])
+
+    def test_visvalingam(self):
+        import numpy as np
+        line = np.array([[0, 0], [1, 0.1], [2, 0], [3, 0.05], [4, 0], [5, 3], [6, 0]])
+        res = visvalingam(line, 0.2)
+        self.assert_numpy_array_equal(np.flatnonzero(res), np.array([0, 4, 5, 6]))
+
+        res = visvalingam(line, 0.)
+        self.assertTrue(res.all())
+        res = visvalingam(line, 100.)
+        self.assert_numpy_array_equal(np.flatnonzero(res), np.array([0, 6]))
+
+        ring = np.array([[0, 0], [1, 0.01], [2, 0], [2, 2], [0, 2], [0, 0]])
+        res = visvalingam(ring, 100., closed=True)
+        self.assertEqual(res.sum(), 4)
+
+    def test_simplify(self):
+        import numpy as np
+        line = np.array([[0, 0, 10], [1, 0.01, 20], [2, 0, 30]])
+        res, removed = simplify(line, 0.1)
+        self.assertEqual(removed, 1)
+        self.assert_numpy_array_equal(res, np.array([[0., 0., 10.], [2., 0., 30.]]))
+
+        res, removed = simplify(line, 0.001, method='visvalingam')
+        self.assertEqual(removed, 0)
+        self.assertEqual(res.shape, (3, 3))
+
+        msg = "method must be 'douglas-peucker' or 'visvalingam': x"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            simplify(line, 0.1, method='x')
+
+        msg = "coordinates must be \\(N, 2\\) or \\(N, 3\\) shaped array"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            simplify([0, 1, 2], 0.1)
+
+    def test_level_of_detail(self):
+        p = cesiumpy.Polygon([0, 0, 1, 0.001, 2, 0, 2, 1, 2.1, 2, 0, 2, 0, 0],
+                             material='red')
+        res = level_of_detail(p, [(0, None), (1e5, 0.01), (1e6, 0.05), (5e6, 0.2)])
+        # 0.2 removes the same vertices as 0.05, thus merged
+        self.assertEqual(len(res), 3)
+
+        exp = ("{polygon : {hierarchy : Cesium.Cartesian3.fromDegreesArray([0, 0, 1, 0.001, 2, 0, 2, 1, 2.1, 2, 0, 2, 0, 0]), "
+               "material : Cesium.Color.RED, distanceDisplayCondition : new Cesium.DistanceDisplayCondition(0.0, 100000.0)}}")
+        self.assertEqual(res[0].script, exp)
+        self.assertEqual(res[0].removed_vertices, 0)
+        exp = ("{polygon : {hierarchy : Cesium.Cartesian3.fromDegreesArray([0.0, 0.0, 2.0, 0.0, 2.0, 1.0, 2.1, 2.0, 0.0, 2.0, 0.0, 0.0]), "
+               "material : Cesium.Color.RED, distanceDisplayCondition : new Cesium.DistanceDisplayCondition(100000.0, 1000000.0)}}")
+        self.assertEqual(res[1].script, exp)
+        self.assertEqual(res[1].removed_vertices, 1)
+        exp = ("{polygon : {hierarchy : Cesium.Cartesian3.fromDegreesArray([0.0, 0.0, 2.0, 0.0, 2.1, 2.0, 0.0, 2.0, 0.0, 0.0]), "
+               "material : Cesium.Color.RED, distanceDisplayCondition : new Cesium.DistanceDisplayCondition(1000000.0, Number.MAX_VALUE)}}")
+        self.assertEqual(res[2].script, exp)
+        self.assertEqual(res[2].removed_vertices, 2)
+
+        # original is not changed
+        self.assertIsNone(p.distanceDisplayCondition)
+
+        lines = [cesiumpy.Polyline([0, 0, 1, 0.001, 2, 0]), cesiumpy.Polyline([0, 0, 1, 1])]
+        res = level_of_detail(lines, [(0, None), (1e6, 0.01)])
+        self.assertEqual(len(res), 3)
+        self.assertEqual([e.removed_vertices for e in res], [0, 1, 0])
+        self.assertEqual(res[2].distanceDisplayCondition.script,
+                         'new Cesium.DistanceDisplayCondition(0.0, Number.MAX_VALUE)')
+
+    def test_level_of_detail_validation(self):
+        p = cesiumpy.Polygon([0, 0, 1, 0.001, 2, 0, 2, 1, 0, 0])
+        msg = 'levels must be a list of \\(distance, tolerance\\): \\[\\]'
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            level_of_detail(p, [])
+
+        msg = 'distances of levels must be increasing: \\[0, 10, 10\\]'
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            level_of_detail(p, [(0, None), (10, 0.1), (10, 0.2)])
+
+        msg = 'entities must be Polygon or Polyline: Point'
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            level_of_detail(cesiumpy.Point(position=[0, 0, 0]), [(0, None)])
+
+    def assert_numpy_array_equal(self, a, b):
+        import numpy as np
+        self.assertTrue(np.array_equal(a, b), '{0} != {1}'.format(a, b))
+
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
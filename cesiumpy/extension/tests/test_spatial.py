@@ -92,15 +92,115 @@ class TestVoronoi(unittest.TestCase):
                      131.03585127801438, 42.275291825551136, 130.99199913910985,
                      42.328426095963245, 131.39784031783313, 43.270076795621065]]
 
+        self.assertEqual(len(polygons), len(expected))
         for polygon, exp in zip(polygons, expected):
-            self.assertEqual(polygon.hierarchy.x, exp)
+            self._assert_same_region(polygon.hierarchy.x, exp)
 
         # testing scipy.spatial.Voronoi instance
         vor = scipy.spatial.Voronoi(points)
         vor = cesiumpy.spatial.Voronoi(vor)
         polygons = vor.get_polygons()
         for polygon, exp in zip(polygons, expected):
-            self.assertEqual(polygon.hierarchy.x, exp)
+            self._assert_same_region(polygon.hierarchy.x, exp)
+
+    def _assert_same_region(self, result, expected):
+        # the start vertex of the ring depends on the clipping
+        import numpy as np
+        import shapely.geometry
+
+        result = np.array(result).reshape(-1, 2)
+        expected = np.array(expected).reshape(-1, 2)
+        self.assertEqual(len(result), len(expected))
+        self.assertEqual(result[0].tolist(), result[-1].tolist())
+        result = shapely.geometry.Polygon(result)
+        self.assertTrue(result.equals(shapely.geometry.Polygon(expected)))
+
+    def test_voronoi_loop(self):
+        _skip_if_no_scipy()
+        _skip_if_no_shapely()
+
+        import numpy as np
+
+        np.random.seed(1)
+        points = np.random.rand(300, 2) * 5 + np.array([130, 40])
+        # points far from the center, whose regions are out of bounds
+        points[:3] += 20
+
+        vor = cesiumpy.spatial.Voronoi(points)
+        result = vor._get_coordinates()
+        expected = vor._get_coordinates_loop()
+        self.assertEqual(len(result), 300)
+        for r, e in zip(result, expected):
+            if r is None:
+                self.assertTrue(e.is_empty or e.geom_type != 'Polygon')
+            else:
+                self._assert_same_region(r.ravel().tolist(),
+                                         np.array(e.exterior.coords).ravel().tolist())
+        self.assertTrue(any(r is None for r in result))
+
+        polygons = vor.get_polygons()
+        self.assertEqual(len(polygons), 300)
+        self.assertTrue(all(p is None or isinstance(p, cesiumpy.Polygon)
+                            for p in polygons))
+
+
+class TestSphericalVoronoi(unittest.TestCase):
+
+    def setUp(self):
+        _skip_if_no_scipy()
+
+    def test_conversion(self):
+        import numpy as np
+
+        lon = np.array([0, 90, 180, -45, 30])
+        lat = np.array([0, 0, 0, 90, -60])
+        xyz = cesiumpy.spatial.to_cartesian(lon, lat)
+        self.assertEqual(xyz.shape, (5, 3))
+        np.testing.assert_allclose(xyz[:3], [[1, 0, 0], [0, 1, 0], [-1, 0, 0]], atol=1e-12)
+        np.testing.assert_allclose(np.linalg.norm(xyz, axis=1), 1)
+
+        result = cesiumpy.spatial.to_lonlat(xyz * 6378137.)
+        np.testing.assert_allclose(result[:, 1], lat, atol=1e-12)
+        # longitude is undefined at the pole
+        np.testing.assert_allclose(result[[0, 1, 2, 4], 0], [0, 90, 180, 30], atol=1e-12)
+
+    def test_spherical_voronoi(self):
+        import numpy as np
+        import scipy.spatial
+
+        # regions are faces of the cube
+        points = [(0, 0), (90, 0), (180, 0), (-90, 0), (0, 90), (0, -90)]
+        sv = cesiumpy.spatial.SphericalVoronoi(points)
+        coordinates, offsets = sv._get_coordinates()
+        self.assertEqual(offsets.tolist(), [0, 4, 8, 12, 16, 20, 24])
+
+        lat = np.degrees(np.arctan(1 / np.sqrt(2)))
+        np.testing.assert_allclose(np.abs(coordinates[:, 1]), lat)
+        # region across the antimeridian
+        np.testing.assert_allclose(sorted(np.abs(coordinates[8:12, 0])), [135] * 4)
+        # region contains the north pole
+        np.testing.assert_allclose(coordinates[16:20, 1], lat)
+        np.testing.assert_allclose(sorted(coordinates[16:20, 0]), [-135, -45, 45, 135])
+
+        polygons = sv.get_polygons()
+        self.assertEqual(len(polygons), 6)
+        self.assertTrue(all(isinstance(p, cesiumpy.Polygon) for p in polygons))
+
+        collection = sv.get_polygon_collection(material=cesiumpy.color.RED)
+        self.assertIsInstance(collection, cesiumpy.PolygonCollection)
+        self.assertEqual(len(collection), 6)
+        np.testing.assert_allclose(collection.coordinates, coordinates)
+
+        # testing scipy.spatial.SphericalVoronoi instance
+        sv = scipy.spatial.SphericalVoronoi(cesiumpy.spatial.to_cartesian(*np.array(points).T) * 2,
+                                            radius=2)
+        sv = cesiumpy.spatial.SphericalVoronoi(sv)
+        result, offsets = sv._get_coordinates()
+        np.testing.assert_allclose(result, coordinates, atol=1e-12)
+
+        msg = "input must be \\(longitude, latitude\\) points"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.spatial.SphericalVoronoi([(0, 0, 0), (1, 1, 1)])
 
 
 class TestConvex(unittest.TestCase):
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+from __future__ import unicode_literals
+
+import contextlib
+import traitlets
+
+
+class _Options(traitlets.HasTraits):
+    """
+    Global options of cesiumpy
+
+    Parameters
+    ----------
+
+    precision : int, default None
+        Number of decimals of float values written to JavaScript. None
+        writes the shortest representation which round-trips (up to 17
+        significant digits). For example, 6 decimals is about 0.1 m
+        for degrees.
+    array_encoding : {'text', 'float32', 'float64'}, default 'text'
+        Encoding of coordinates array, like Polyline and Polygon positions.
+        'float32' and 'float64' write base64-encoded little-endian buffer,
+        which is decoded to Float64Array in JavaScript. It is smaller and
+        faster to load than text. Note that 'float32' has about 7
+        significant digits, a few meters in degrees.
+    """
+
+    precision = traitlets.Int(allow_none=True, default_value=None)
+    array_encoding = traitlets.Enum(['text', 'float32', 'float64'],
+                                    default_value='text')
+
+    @traitlets.validate('precision')
+    def _validate_precision(self, proposal):
+        value = proposal['value']
+        if value is not None and value < 0:
+            msg = 'precision must be a non-negative integer: {x}'
+            raise ValueError(msg.format(x=value))
+        return value
+
+
+options = _Options()
+
+
+@contextlib.contextmanager
+def option_context(**kwargs):
+    """
+    Context manager to set options temporarily
+
+    >>> with cesiumpy.option_context(precision=6):
+    ...     html = v.to_html()
+    """
+    previous = dict((key, getattr(options, key)) for key in kwargs)
+    try:
+        for key, value in kwargs.items():
+            setattr(options, key, value)
+        yield
+    finally:
+        for key, value in previous.items():
+            setattr(options, key, value)
+
+
+def _iter_with_options(iterator, **kwargs):
+    """
+    Iterate over iterator, setting options only while each element is
+    generated. Options are restored while the caller consumes the element.
+    """
+    iterator = iter(iterator)
+    while True:
+        with option_context(**kwargs):
+            try:
+                value = next(iterator)
+            except StopIteration:
+                return
+        yield value
@@ -30,7 +30,7 @@ class PlottingAccessor(object):
     def __call__(self):
         raise NotImplementedError
 
-    def bar(self, x, y, z, size=10e3, color=None, bottom=0.):
+    def bar(self, x, y, z, size=10e3, color=None, bottom=0., bulk=False):
         """
         Plot cesiumpy.Cylinder like bar plot
 
@@ -49,7 +49,25 @@ class PlottingAccessor(object):
             Cylinder color
         bottom : list or float, default 0
             Bottom heights
+        bulk : bool, default False
+            Whether to add all cylinders as a single CylinderCollection,
+            which outputs values once and adds them by a JavaScript loop
         """
+        if bulk:
+            np = com._check_package('numpy')
+            z = com.validate_listlike(z, key='z')
+            z = np.asarray(z, dtype=np.float64)
+            if size is None:
+                size = 10e3
+            if bottom is None:
+                bottom = 0.
+            bottom = np.asarray(bottom, dtype=np.float64)
+            p = cesiumpy.CylinderCollection(x, y, z=bottom + z / 2., length=z,
+                                            topRadius=size, bottomRadius=size,
+                                            material=color)
+            self.widget.entities.add(p)
+            return self.widget
+
         x = com.validate_listlike(x, key='x')
 
         # for list validation (not allow scalar)
@@ -74,7 +92,8 @@ class PlottingAccessor(object):
             self.widget.entities.add(p)
         return self.widget
 
-    def scatter(self, x, y, z=None, size=None, color=None):
+    def scatter(self, x, y, z=None, size=None, color=None, bulk=False,
+                cluster=False, cluster_radius=1.):
         """
         Plot cesiumpy.Point like scatter plot
 
@@ -91,7 +110,28 @@ class PlottingAccessor(object):
             Pixel size
         color : list or Color
             Point color
+        bulk : bool, default False
+            Whether to add all points as a single PointCollection,
+            which outputs values once and adds them by a JavaScript loop
+        cluster : bool, default False
+            Whether to aggregate points into grid cells and add them as a
+            single ClusterCollection. Each cell is drawn as a point sized
+            and colored by the number of points. In this case, size is a
+            tuple of (min, max) pixel sizes and color is a ColorMap or Color.
+        cluster_radius : float, default 1.
+            Half width of a grid cell in degrees, used when cluster is True
         """
+        if cluster:
+            p = cesiumpy.ClusterCollection(x, y, z=z, radius=cluster_radius,
+                                           pixelSize=size, color=color)
+            self.widget.entities.add(p)
+            return self.widget
+
+        if bulk:
+            p = cesiumpy.PointCollection(x, y, z=z, pixelSize=size, color=color)
+            self.widget.entities.add(p)
+            return self.widget
+
         x = com.validate_listlike(x, key='x')
 
         # for list validation (not allow scalar)
@@ -109,7 +149,7 @@ class PlottingAccessor(object):
             self.widget.entities.add(p)
         return self.widget
 
-    def pin(self, x, y, z=None, text=None, size=None, color=None):
+    def pin(self, x, y, z=None, text=None, size=None, color=None, bulk=False):
         """
         Plot cesiumpy.Pin
 
@@ -128,7 +168,16 @@ class PlottingAccessor(object):
             Text size
         color : list or Color
             Text color
+        bulk : bool, default False
+            Whether to add all pins as a single PinCollection,
+            which outputs values once and adds them by a JavaScript loop
         """
+        if bulk:
+            p = cesiumpy.PinCollection(x, y, z=z, text=text, size=size,
+                                       color=color)
+            self.widget.entities.add(p)
+            return self.widget
+
         x = com.validate_listlike(x, key='x')
 
         # for list validation (not allow scalar)
@@ -146,7 +195,7 @@ class PlottingAccessor(object):
             self.widget.entities.add(p)
         return self.widget
 
-    def label(self, text, x, y, z=None, size=None, color=None):
+    def label(self, text, x, y, z=None, size=None, color=None, bulk=False):
         """
         Plot cesiumpy.Label
 
@@ -165,7 +214,17 @@ class PlottingAccessor(object):
             Text size
         color : list or Color
             Text color
+        bulk : bool, default False
+            Whether to add all labels as a single LabelCollection,
+            which outputs values once and adds them by a JavaScript loop
         """
+        if bulk:
+            text = com.validate_listlike(text, key='text')
+            p = cesiumpy.LabelCollection(x, y, z=z, text=text, scale=size,
+                                         fillColor=color)
+            self.widget.entities.add(p)
+            return self.widget
+
         x = com.validate_listlike(x, key='x')
 
         # for list validation (not allow scalar)
@@ -211,3 +270,110 @@ class PlottingAccessor(object):
                 self.widget.entities.add(p)
         plt.close()
         return self.widget
+
+    def density(self, x, y, weights=None, resolution=256, bounds=None,
+                color=None, log=False):
+        """
+        Plot density of points as an image on cesiumpy.Rectangle
+
+        Points are binned into a 2d histogram, and the histogram is encoded
+        as a PNG image embedded in the output. Thus the output size doesn't
+        depend on the number of points.
+
+        Parameters
+        ----------
+
+        x : list
+            List of longitudes
+        y : list
+            List of latitudes
+        weights : list, optional
+            Weight of each point
+        resolution : int or tuple of (nx, ny), default 256
+            Number of bins in longitude and latitude
+        bounds : tuple of (west, south, east, north), optional
+            Area of the image in degrees, default is the extent of points
+        color : ColorMap or Color, default Color(1., 0., 0.)
+            Colormap to map the density, or a single color whose alpha is
+            scaled by the density. Empty bins are transparent. ColorMap and
+            CSS color names require matplotlib.
+        log : bool, default False
+            Whether to map the log of the density
+        """
+        np = com._check_package('numpy')
+        import cesiumpy.util.image as image
+
+        x = np.asarray(com.validate_listlike(x, key='x'), dtype=np.float64).ravel()
+        y = np.asarray(com.validate_listlike(y, key='y'), dtype=np.float64).ravel()
+        if len(x) != len(y):
+            msg = "y length must be {length}: {x}"
+            raise ValueError(msg.format(length=len(x), x=y))
+        if weights is not None:
+            weights = np.asarray(com.validate_listlike(weights, key='weights'),
+                                 dtype=np.float64).ravel()
+            if len(weights) != len(x):
+                msg = "weights length must be {length}: {x}"
+                raise ValueError(msg.format(length=len(x), x=weights))
+
+        if bounds is None:
+            if len(x) == 0:
+                raise ValueError('bounds must be specified when x is empty')
+            bounds = (x.min(), y.min(), x.max(), y.max())
+        if not com.is_listlike(bounds) or len(bounds) != 4:
+            msg = 'bounds must be a list-like of (west, south, east, north): {x}'
+            raise ValueError(msg.format(x=bounds))
+        west, south, east, north = [float(b) for b in bounds]
+        if west == east:
+            west, east = max(west - 0.5, -180.), min(east + 0.5, 180.)
+        if south == north:
+            south, north = max(south - 0.5, -90.), min(north + 0.5, 90.)
+
+        if com.is_listlike(resolution):
+            nx, ny = resolution
+        else:
+            nx = ny = resolution
+
+        hist, _, _ = np.histogram2d(x, y, bins=(nx, ny), weights=weights,
+                                    range=((west, east), (south, north)))
+        # histogram2d returns (x, y) shaped, image rows start from north
+        hist = hist.T[::-1]
+
+        filled = hist > 0
+        scale = np.zeros(hist.shape, dtype=np.float64)
+        if filled.any():
+            # scale from 0 (log1p(0) is also 0), not to make the least
+            # dense bins transparent
+            values = np.log1p(hist) if log else hist
+            scale[filled] = values[filled] / values[filled].max()
+
+        if isinstance(color, cesiumpy.entities.color.ColorMap):
+            rgba = color.cm(scale)
+            rgba[~filled, 3] = 0.
+        else:
+            if color is None:
+                # not to require matplotlib to resolve CSS color name
+                color = cesiumpy.color.Color(1., 0., 0.)
+            rgba = np.empty(hist.shape + (4, ), dtype=np.float64)
+            rgba[:, :, :] = _to_rgba(color)
+            rgba[:, :, 3] *= scale
+        rgba = np.round(np.clip(rgba, 0., 1.) * 255).astype(np.uint8)
+
+        uri = image.to_data_uri(image.to_png(rgba))
+        material = cesiumpy.entities.material.ImageMaterialProperty(uri, transparent=True)
+        p = cesiumpy.Rectangle(coordinates=(west, south, east, north),
+                               material=material)
+        self.widget.entities.add(p)
+        return self.widget
+
+
+def _to_rgba(color):
+    """ Convert color to (red, green, blue, alpha) tuple of floats """
+    color = cesiumpy.color.Color.maybe(color)
+    if isinstance(color, cesiumpy.entities.color.CssColor):
+        # CSS color names are resolved by matplotlib
+        colors = com._check_package('matplotlib.colors')
+        rgba = colors.to_rgba(color.name.lower())
+    else:
+        rgba = (color.red, color.green, color.blue, 1.)
+    alpha = rgba[3] if color.alpha is None else color.alpha
+    return rgba[:3] + (alpha, )
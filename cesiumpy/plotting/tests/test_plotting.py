@@ -603,6 +603,155 @@ class TestNumpyLike(unittest.TestCase):
         self.assertEqual(v.to_html(), exp)
 
 
+class TestBulk(unittest.TestCase):
+
+    def setUp(self):
+        _skip_if_no_numpy()
+
+    def test_scatter_bulk(self):
+        v = cesiumpy.Viewer(divid='viewertest')
+        v.plot.scatter([130, 140, 150], [30, 40, 50], size=[10, 20, 30],
+                       color=cesiumpy.color.BLUE, bulk=True)
+        self.assertEqual(len(v.entities), 1)
+        self.assertIsInstance(v.entities[0], cesiumpy.PointCollection)
+        exp = ("""(function (entities) { var d = {position : [130.0, 30.0, 0.0, 140.0, 40.0, 0.0, 150.0, 50.0, 0.0], pixelSize : [10.0, 20.0, 30.0]}; """
+               """var pos = Cesium.Cartesian3.fromDegreesArrayHeights(d.position); """
+               """for (var i = 0; i < pos.length; i++) { entities.add({position : pos[i], point : {pixelSize : d.pixelSize[i], color : Cesium.Color.BLUE}}); } })(widget.entities);""")
+        self.assertEqual(v.script[1], exp)
+
+    def test_bar_bulk(self):
+        v = cesiumpy.Viewer(divid='viewertest')
+        v.plot.bar([130, 140], [30, 40], [1e6, 2e6], bottom=[0, 1e6],
+                   color=[cesiumpy.color.RED, cesiumpy.color.BLUE], bulk=True)
+        self.assertEqual(len(v.entities), 1)
+        exp = ("""(function (entities) { var d = {position : [130.0, 30.0, 500000.0, 140.0, 40.0, 2000000.0], length : [1000000.0, 2000000.0], material : [0, 1]}; """
+               """var p = {material : [Cesium.Color.RED, Cesium.Color.BLUE]}; """
+               """var pos = Cesium.Cartesian3.fromDegreesArrayHeights(d.position); """
+               """for (var i = 0; i < pos.length; i++) { entities.add({position : pos[i], cylinder : {length : d.length[i], topRadius : 10000.0, bottomRadius : 10000.0, material : p.material[d.material[i]]}}); } })(widget.entities);""")
+        self.assertEqual(v.script[1], exp)
+
+    def test_label_bulk(self):
+        v = cesiumpy.Viewer(divid='viewertest')
+        v.plot.label(['A', 'B'], [130, 140], [30, 40], size=2, bulk=True)
+        exp = ("""(function (entities) { var d = {position : [130.0, 30.0, 0.0, 140.0, 40.0, 0.0], text : ["A", "B"]}; """
+               """var pos = Cesium.Cartesian3.fromDegreesArrayHeights(d.position); """
+               """for (var i = 0; i < pos.length; i++) { entities.add({position : pos[i], label : {text : d.text[i], scale : 2.0}}); } })(widget.entities);""")
+        self.assertEqual(v.script[1], exp)
+
+    def test_pin_bulk(self):
+        v = cesiumpy.Viewer(divid='viewertest')
+        v.plot.pin([130, 140], [30, 40], bulk=True)
+        exp = ("""(function (entities) { var d = {position : [130.0, 30.0, 0.0, 140.0, 40.0, 0.0]}; """
+               """var pb = new Cesium.PinBuilder(); """
+               """var pos = Cesium.Cartesian3.fromDegreesArrayHeights(d.position); """
+               """for (var i = 0; i < pos.length; i++) { entities.add({position : pos[i], billboard : {image : pb.fromColor(Cesium.Color.ROYALBLUE, 48.0)}}); } })(widget.entities);""")
+        self.assertEqual(v.script[1], exp)
+
+        v = cesiumpy.Viewer(divid='viewertest')
+        v.plot.pin([130, 140], [30, 40], text=['!', None], size=24, bulk=True)
+        exp = """billboard : {image : d.text[i] === null ? pb.fromColor(Cesium.Color.ROYALBLUE, 24.0) : pb.fromText(d.text[i], Cesium.Color.ROYALBLUE, 24.0)}"""
+        self.assertTrue(exp in v.script[1])
+
+    def test_bulk_numpy(self):
+        import numpy as np
+        v = cesiumpy.Viewer(divid='viewertest')
+        x = np.random.uniform(120, 150, 1000)
+        y = np.random.uniform(20, 50, 1000)
+        v.plot.scatter(x, y, size=np.random.uniform(5, 10, 1000), bulk=True)
+        self.assertEqual(len(v.entities), 1)
+        self.assertEqual(len(v.entities[0]), 1000)
+
+    def test_scatter_cluster(self):
+        import numpy as np
+        v = cesiumpy.Viewer(divid='viewertest')
+        x = np.random.uniform(120, 150, 10000)
+        y = np.random.uniform(20, 50, 10000)
+        v.plot.scatter(x, y, cluster=True, cluster_radius=2.5)
+        self.assertEqual(len(v.entities), 1)
+        p = v.entities[0]
+        self.assertIsInstance(p, cesiumpy.ClusterCollection)
+        # 30 degrees are covered by 6 or 7 cells of 5 degrees
+        self.assertTrue(36 <= len(p) <= 49)
+        self.assertEqual(p.count.sum(), 10000)
+        self.assertTrue((p.statistics['minx'] >= 120).all())
+
+
+class TestDensity(unittest.TestCase):
+
+    def setUp(self):
+        _skip_if_no_numpy()
+
+    def _read_image(self, rectangle):
+        import base64
+        from cesiumpy.util.tests.test_image import _read_png
+
+        uri = rectangle.material.image
+        self.assertTrue(uri.startswith('data:image/png;base64,'))
+        return _read_png(base64.b64decode(uri.split(',')[1]))
+
+    def test_density(self):
+        v = cesiumpy.Viewer(divid='viewertest')
+        v.plot.density([130, 130, 131, 140], [30, 30, 31, 40], resolution=(10, 5),
+                       color=cesiumpy.color.Color(0, 0, 1))
+        self.assertEqual(len(v.entities), 1)
+        p = v.entities[0]
+        self.assertIsInstance(p, cesiumpy.Rectangle)
+        self.assertEqual(p.coordinates.script,
+                         'Cesium.Rectangle.fromDegrees(130.0, 30.0, 140.0, 40.0)')
+        self.assertTrue(p.material.transparent)
+
+        img = self._read_image(p)
+        self.assertEqual(img.shape, (5, 10, 4))
+        self.assertTrue((img[:, :, 2] == 255).all())
+        # the first row is north
+        self.assertEqual(img[-1, 0, 3], 255)
+        self.assertEqual(img[0, -1, 3], 128)
+        self.assertEqual((img[:, :, 3] > 0).sum(), 3)
+        self.assertEqual(img[-1, 1, 3], 128)
+
+    def test_density_default_color(self):
+        v = cesiumpy.Viewer(divid='viewertest')
+        v.plot.density([130, 140], [30, 40], resolution=2)
+        img = self._read_image(v.entities[0])
+        self.assertEqual(img[0, 1].tolist(), [255, 0, 0, 255])
+        self.assertEqual(img[0, 0, 3], 0)
+
+    def test_density_log(self):
+        v = cesiumpy.Viewer(divid='viewertest')
+        v.plot.density([130, 130, 131, 132], [30, 30, 31, 32], resolution=3, log=True)
+        img = self._read_image(v.entities[0])
+        # every filled bin is visible
+        self.assertEqual((img[:, :, 3] > 0).sum(), 3)
+        self.assertEqual(img[-1, 0, 3], 255)
+        self.assertEqual(img[1, 1, 3], 161)
+
+    def test_density_weights(self):
+        _skip_if_no_matplotlib()
+        v = cesiumpy.Viewer(divid='viewertest')
+        v.plot.density([130, 140], [30, 40], weights=[1, 3], resolution=2,
+                       bounds=(130, 30, 140, 40), color='red')
+        img = self._read_image(v.entities[0])
+        self.assertEqual(img[0, 1].tolist(), [255, 0, 0, 255])
+        self.assertEqual(img[1, 0].tolist(), [255, 0, 0, 85])
+        self.assertEqual(img[0, 0, 3], 0)
+
+    def test_density_colormap(self):
+        _skip_if_no_matplotlib()
+        v = cesiumpy.Viewer(divid='viewertest')
+        v.plot.density([130, 140], [30, 40], resolution=4,
+                       color=cesiumpy.color.get_cmap('viridis'))
+        img = self._read_image(v.entities[0])
+        self.assertEqual(img[0, 3, 3], 255)
+        self.assertEqual(img[0, 0, 3], 0)
+
+    def test_density_errors(self):
+        v = cesiumpy.Viewer(divid='viewertest')
+        with nose.tools.assert_raises_regexp(ValueError, 'weights length must be 2'):
+            v.plot.density([130, 140], [30, 40], weights=[1])
+        with nose.tools.assert_raises_regexp(ValueError, 'bounds must be a list-like of'):
+            v.plot.density([130, 140], [30, 40], bounds=(1, 2))
+
+
 class TestContour(unittest.TestCase):
 
     def test_contour_xyz(self):
@@ -25,3 +25,6 @@ class Scene(_CesiumObject):
     @property
     def script(self):
         return self._primitives.script
+
+    def _iter_script(self):
+        return self._primitives._iter_script()
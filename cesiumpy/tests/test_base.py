@@ -1,12 +1,16 @@
 #!/usr/bin/env python
 # coding: utf-8
 
+import io
+import os
+import tempfile
 import unittest
 import nose
 
 import six
 
 import cesiumpy
+from cesiumpy.testing import _skip_if_no_numpy
 
 
 class TestWidget(unittest.TestCase):
@@ -281,6 +285,108 @@ class TestViewer(unittest.TestCase):
         with nose.tools.assert_raises_regexp(ValueError, msg):
             viewer.scripts.add(1)
 
+    def test_write_html(self):
+        viewer = cesiumpy.Viewer(divid="viewertest")
+        viewer.entities.add(cesiumpy.Point(position=(-110, 40, 0)))
+        viewer.scripts.add('console.log("xxx");')
+
+        buf = six.StringIO()
+        viewer.write_html(buf)
+        self.assertEqual(buf.getvalue(), viewer.to_html())
+
+        fd, path = tempfile.mkstemp(suffix='.html')
+        os.close(fd)
+        try:
+            viewer.write_html(path)
+            with io.open(path, encoding='utf-8', newline='') as f:
+                self.assertEqual(f.read(), viewer.to_html())
+        finally:
+            os.remove(path)
+
+    def test_query_entities(self):
+        viewer = cesiumpy.Viewer(divid="viewertest")
+        p1 = cesiumpy.Point(position=(-110, 40, 0), name='a')
+        p2 = cesiumpy.Point(position=(139, 35, 0), name='b')
+        line = cesiumpy.Polyline(positions=[-120, 25, -90, 30], name='a')
+        rect = cesiumpy.Rectangle(coordinates=(170, 0, -170, 10))
+        viewer.entities.add([p1, p2, line, rect])
+
+        self.assertEqual(viewer.entities.query(), [p1, p2, line, rect])
+        self.assertEqual(viewer.entities.query(bbox=(-130, 20, -100, 45)), [p1, line])
+        self.assertEqual(viewer.entities.query(bbox=(130, 30, 140, 40)), [p2])
+        self.assertEqual(viewer.entities.query(name='a'), [p1, line])
+        self.assertEqual(viewer.entities.query(bbox=(-115, 35, -100, 45), name='a'), [p1])
+        # crossing the antimeridian
+        self.assertEqual(viewer.entities.query(bbox=(175, 0, -175, 5)), [rect])
+        self.assertEqual(viewer.entities.query(bbox=(0, 0, 10, 10)), [])
+
+        # the index is updated on add
+        p3 = cesiumpy.Point(position=(135, 35, 0), name='a')
+        viewer.entities.add(p3)
+        self.assertEqual(viewer.entities.query(bbox=(130, 30, 140, 40)), [p2, p3])
+        self.assertEqual(viewer.entities.query(name='a'), [p1, line, p3])
+
+        viewer.entities.clear()
+        self.assertEqual(viewer.entities.query(bbox=(130, 30, 140, 40)), [])
+
+        msg = 'bbox must be a list-like of'
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            viewer.entities.query(bbox=(1, 2))
+
+    def test_html_bbox(self):
+        viewer = cesiumpy.Viewer(divid="viewertest")
+        viewer.entities.add(cesiumpy.Point(position=(-110, 40, 0)))
+        viewer.entities.add(cesiumpy.Point(position=(139, 35, 0)))
+
+        expected = cesiumpy.Viewer(divid="viewertest")
+        expected.entities.add(cesiumpy.Point(position=(139, 35, 0)))
+
+        result = viewer.to_html(bbox=(130, 30, 140, 40))
+        self.assertEqual(result, expected.to_html())
+
+        buf = six.StringIO()
+        viewer.write_html(buf, bbox=(130, 30, 140, 40))
+        self.assertEqual(buf.getvalue(), result)
+
+        # entities are kept
+        self.assertEqual(len(viewer.entities), 2)
+
+    def test_html_bbox_collection(self):
+        _skip_if_no_numpy()
+
+        viewer = cesiumpy.Viewer(divid="viewertest")
+        points = cesiumpy.PointCollection([130, 170, 131], [30, 60, 31],
+                                          color=['red', 'blue', 'green'],
+                                          name=['a', 'b', 'c'])
+        polygons = cesiumpy.PolygonCollection([[[130, 30], [131, 30], [131, 31]],
+                                               [[170, 60], [171, 60], [171, 61]],
+                                               [], [[-10, 0], [132, 0], [0, 50]]],
+                                              height=[1, 2, 3, 4])
+        viewer.entities.add([points, polygons])
+
+        bbox = (129, 29, 132, 32)
+        result = viewer.entities.query(bbox=bbox, clip=True)
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0].position.tolist(), [[130, 30, 0], [131, 31, 0]])
+        exp = ("function (entities) { var d = {position : [130.0, 30.0, 0.0, 131.0, 31.0, 0.0], "
+               "name : [\"a\", \"c\"], color : [0, 2]}; "
+               "var p = {color : [Cesium.Color.RED, Cesium.Color.BLUE, Cesium.Color.GREEN]};")
+        self.assertTrue(result[0].script.startswith(exp))
+        self.assertEqual(result[1].offsets.tolist(), [0, 3, 6])
+        self.assertEqual(result[1][1].tolist(), [[-10, 0], [132, 0], [0, 50]])
+        self.assertTrue('height : [1.0, 4.0]' in result[1].script)
+
+        expected = cesiumpy.Viewer(divid="viewertest")
+        expected.entities.add([result[0], result[1]])
+        self.assertEqual(viewer.to_html(bbox=bbox), expected.to_html())
+
+        # collections are kept
+        self.assertEqual(len(viewer.entities[0]), 3)
+        self.assertEqual(len(viewer.entities[1]), 4)
+        self.assertEqual(viewer.entities.query(bbox=bbox), [points, polygons])
+        # no entity intersects though the bounds of the collection do
+        self.assertEqual(viewer.entities.query(bbox=(150, 40, 160, 50), clip=True), [])
+
 
 if __name__ == '__main__':
     nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
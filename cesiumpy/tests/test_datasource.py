@@ -4,7 +4,10 @@
 import unittest
 import nose
 
+import io
+
 import cesiumpy
+from cesiumpy.testing import _skip_if_no_numpy, _skip_if_no_shapely
 
 
 class TestDataSource(unittest.TestCase):
@@ -39,6 +42,73 @@ class TestDataSource(unittest.TestCase):
                                              stroke='blue', fill='green')
         self.assertEqual(ds.script, exp)
 
+    def test_geojsondatasource_embed(self):
+        data = {"type": "FeatureCollection",
+                "features": [{"type": "Feature",
+                              "properties": {"name": "</script>", "value": 1.23456789},
+                              "geometry": {"type": "Point",
+                                           "coordinates": [-105.0162123456, 39.57422]}}]}
+        ds = cesiumpy.GeoJsonDataSource(data, markerSymbol='?')
+        exp = ("""Cesium.GeoJsonDataSource.load({"type":"FeatureCollection","features":[{"type":"Feature","""
+               """"properties":{"name":"<\\/script>","value":1.23456789},"""
+               """"geometry":{"type":"Point","coordinates":[-105.0162123456,39.57422]}}]}, {markerSymbol : "?"})""")
+        self.assertEqual(ds.script, exp)
+
+        # options are applied when the script is generated
+        with cesiumpy.option_context(precision=6):
+            self.assertTrue('"coordinates":[-105.016212,39.57422]' in ds.script)
+            ds = cesiumpy.GeoJsonDataSource.load(data, precision=3)
+            self.assertTrue('"coordinates":[-105.016,39.574]' in ds.script)
+
+        f = io.StringIO(u'{"type": "Point", "coordinates": [-105.0162123456, 39.57422]}')
+        ds = cesiumpy.GeoJsonDataSource(f, precision=2)
+        exp = """Cesium.GeoJsonDataSource.load({"type":"Point","coordinates":[-105.02,39.57]})"""
+        self.assertEqual(ds.script, exp)
+
+        data = {"type": "Polygon",
+                "coordinates": [[[0.123, 0.], [1., 0.], [1., 1.], [0.123, 0.]],
+                                [[0.5, 0.5], [0.64, 0.5], [0.5, 0.5]]]}
+        ds = cesiumpy.GeoJsonDataSource(data, precision=1)
+        exp = '"coordinates":[[[0.1,0.0],[1.0,0.0],[1.0,1.0],[0.1,0.0]],[[0.5,0.5],[0.6,0.5],[0.5,0.5]]]'
+        self.assertTrue(exp in ds.script)
+
+        msg = "precision must be a non-negative integer: -1"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.GeoJsonDataSource(data, precision=-1)
+
+        msg = "sourceUri must be str, dict, file-like or object which has __geo_interface__: int"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.GeoJsonDataSource(1)
+
+    def test_geojsondatasource_geo_interface(self):
+        _skip_if_no_numpy()
+        _skip_if_no_shapely()
+        import numpy as np
+        import shapely.geometry
+
+        line = shapely.geometry.LineString([(np.float64(1.123456789), 2), (3, 4)])
+        ds = cesiumpy.GeoJsonDataSource(line, stroke='red', precision=6)
+        exp = """Cesium.GeoJsonDataSource.load({"type":"LineString","coordinates":[[1.123457,2.0],[3.0,4.0]]}, {stroke : Cesium.Color.RED})"""
+        self.assertEqual(ds.script, exp)
+
+        # Viewer precision is applied to the embedded GeoJSON
+        v = cesiumpy.Viewer(divid='viewertest', precision=2)
+        v.dataSources.add(cesiumpy.GeoJsonDataSource(line))
+        self.assertTrue('"coordinates":[[1.12,2.0],[3.0,4.0]]' in v.to_html())
+
+        class GeoInterface(object):
+            __geo_interface__ = {"type": "Feature", "properties": {"x": np.int64(3)},
+                                 "geometry": None}
+
+        ds = cesiumpy.GeoJsonDataSource(GeoInterface())
+        exp = """Cesium.GeoJsonDataSource.load({"type":"Feature","properties":{"x":3},"geometry":null})"""
+        self.assertEqual(ds.script, exp)
+
+        v = cesiumpy.Viewer(divid='viewertest')
+        v.dataSources.add(ds)
+        exp = """  widget.dataSources.add(Cesium.GeoJsonDataSource.load({"type":"Feature","properties":{"x":3},"geometry":null}));"""
+        self.assertTrue(exp in v.to_html())
+
     def test_kmldatasource(self):
         ds = cesiumpy.KmlDataSource('xxx.kml')
 
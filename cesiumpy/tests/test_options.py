@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+import unittest
+import nose
+
+import cesiumpy
+from cesiumpy.testing import _skip_if_no_numpy
+
+
+class TestOptions(unittest.TestCase):
+
+    def tearDown(self):
+        cesiumpy.options.precision = None
+
+    def test_precision(self):
+        p = cesiumpy.Point(position=(130.123456789, 30.987654321, 0),
+                           color=(0.1234567, 0.5, 0.25))
+        exp = """{position : Cesium.Cartesian3.fromDegrees(130.123456789, 30.987654321, 0.0), point : {pixelSize : 10.0, color : new Cesium.Color(0.1234567, 0.5, 0.25)}}"""
+        self.assertEqual(p.script, exp)
+
+        cesiumpy.options.precision = 3
+        exp = """{position : Cesium.Cartesian3.fromDegrees(130.123, 30.988, 0.0), point : {pixelSize : 10.0, color : new Cesium.Color(0.123, 0.5, 0.25)}}"""
+        self.assertEqual(p.script, exp)
+
+        cesiumpy.options.precision = None
+        with cesiumpy.option_context(precision=1):
+            exp = """{position : Cesium.Cartesian3.fromDegrees(130.1, 31.0, 0.0), point : {pixelSize : 10.0, color : new Cesium.Color(0.1, 0.5, 0.2)}}"""
+            self.assertEqual(p.script, exp)
+        self.assertIsNone(cesiumpy.options.precision)
+
+        p = cesiumpy.Polyline(positions=[130.123456789, 30.987654321, 131, 31])
+        with cesiumpy.option_context(precision=2):
+            exp = """{polyline : {positions : Cesium.Cartesian3.fromDegreesArray([130.12, 30.99, 131, 31])}}"""
+            self.assertEqual(p.script, exp)
+
+        msg = "precision must be a non-negative integer: -1"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.options.precision = -1
+
+    def test_precision_numpy(self):
+        _skip_if_no_numpy()
+        c = cesiumpy.PointCollection([130.123456789], [30.987654321], pixelSize=[5.56])
+        with cesiumpy.option_context(precision=1):
+            exp = """var d = {position : [130.1, 31.0, 0.0], pixelSize : [5.6]};"""
+            self.assertTrue(exp in c.script)
+
+    def test_viewer_precision(self):
+        v = cesiumpy.Viewer(divid='viewertest', precision=2)
+        p = cesiumpy.Point(position=(130.123456789, 30.987654321, 0))
+        v.entities.add(p)
+
+        result = v.to_html()
+        exp = """  widget.entities.add({position : Cesium.Cartesian3.fromDegrees(130.12, 30.99, 0.0), point : {pixelSize : 10.0, color : Cesium.Color.WHITE}});"""
+        self.assertTrue(exp in result)
+        # the option is restored after rendering
+        self.assertIsNone(cesiumpy.options.precision)
+        self.assertTrue('130.123456789' in p.script)
+
+        msg = "precision must be a non-negative integer: -1"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            cesiumpy.Viewer(precision=-1)
+
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
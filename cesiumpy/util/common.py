@@ -3,10 +3,14 @@
 
 from __future__ import unicode_literals
 
+import base64
 import collections
 import importlib
 import itertools
 import six
+import struct
+
+from cesiumpy.options import options
 
 # --------------------------------------------------
 # Misc
@@ -83,6 +87,15 @@ def validate_listlike_even(x, key):
 
 def validate_listlike_lonlat(x, key):
     """ validate whether x is list-likes consists from lon, lat pairs """
+    if hasattr(x, '__array__'):
+        values = x.__array__()
+        if values.ndim == 1 and values.dtype.kind in 'iuf':
+            # keep the array as it is
+            if len(values) % 2 != 0:
+                msg = '{key} length must be an even number: {x}'
+                raise ValueError(msg.format(key=key, x=values))
+            return _validate_array_lonlat(values, key, step=2)
+
     x = validate_listlike_even(x, key)
     try:
         all(validate_longitude(e, key=key) for e in x[::2])
@@ -95,6 +108,57 @@ def validate_listlike_lonlat(x, key):
     return x
 
 
+def validate_listlike_lonlatheight(x, key):
+    """ validate whether x is list-likes consists from lon, lat, height triples """
+    if hasattr(x, '__array__'):
+        values = x.__array__()
+        if values.ndim == 1 and values.dtype.kind in 'iuf':
+            # keep the array as it is
+            if len(values) % 3 != 0:
+                msg = '{key} length must be a multiple of 3: {x}'
+                raise ValueError(msg.format(key=key, x=values))
+            return _validate_array_lonlat(values, key, step=3)
+
+    x = validate_listlike(x, key)
+    if len(x) % 3 != 0:
+        raise ValueError('{key} length must be a multiple of 3: {x}'.format(key=key, x=x))
+    try:
+        all(validate_longitude(e, key=key) for e in x[::3])
+        all(validate_latitude(e, key=key) for e in x[1::3])
+        all(validate_numeric(e, key=key) for e in x[2::3])
+    except ValueError:
+        msg = '{key} must be a list consists from longitude, latitude and height: {x}'
+        raise ValueError(msg.format(key=key, x=x))
+
+    return x
+
+
+def _validate_array_lonlat(x, key, step):
+    """
+    validate 1-dimensional numeric array consists from lon, lat pairs
+    (step=2) or lon, lat, height triples (step=3)
+    """
+    if len(x) == 0:
+        return x
+
+    lon = x[::step]
+    lat = x[1::step]
+    # use "not" to regard NaN as invalid
+    valid = lon.min() >= -180 and lon.max() <= 180
+    valid = valid and lat.min() >= -90 and lat.max() <= 90
+    if step == 3:
+        # NaN is not equal to itself
+        heights = x[2::step].min()
+        valid = valid and heights == heights
+    if not valid:
+        if step == 2:
+            msg = '{key} must be a list consists from longitude and latitude: {x}'
+        else:
+            msg = '{key} must be a list consists from longitude, latitude and height: {x}'
+        raise ValueError(msg.format(key=key, x=x))
+    return x
+
+
 # --------------------------------------------------
 # Check Functions
 # --------------------------------------------------
@@ -135,6 +199,11 @@ def is_listlike(x):
     return isinstance(x, listlike_types)
 
 
+def is_iterator(x):
+    """ whether the input is an iterator, like generator """
+    return hasattr(x, '__iter__') and (hasattr(x, '__next__') or hasattr(x, 'next'))
+
+
 def is_listlike_2elem(x):
     if is_listlike(x):
         if all(is_listlike(e) and len(e) == 2 for e in x):
@@ -144,7 +213,7 @@ def is_listlike_2elem(x):
 
 def is_listlike_3elem(x):
     if is_listlike(x):
-        if all(is_listlike(e) and len(e) == 2 for e in x):
+        if all(is_listlike(e) and len(e) == 3 for e in x):
             return True
     return False
 
@@ -153,26 +222,132 @@ def is_listlike_3elem(x):
 # Converter Functions
 # --------------------------------------------------
 
+# functions to convert an instance to JavaScript representation, keyed by class
+_jsconverters = {}
+# converters resolved for subclasses, cleared when a converter is registered
+_jsconverters_cache = {}
+
+
+def register_jsconverter(klass):
+    """
+    Decorator to register a function which converts klass instance
+    (and its subclasses) to JavaScript representation
+
+    Parameters
+    ----------
+
+    klass : type or tuple of type
+        Class to be converted by the decorated function
+    """
+    if not isinstance(klass, tuple):
+        klass = (klass, )
+
+    def wrapper(func):
+        for k in klass:
+            _jsconverters[k] = func
+        _jsconverters_cache.clear()
+        return func
+    return wrapper
+
+
+def _get_jsconverter(klass):
+    try:
+        return _jsconverters_cache[klass]
+    except KeyError:
+        pass
+    # search registered superclass in method resolution order
+    for k in klass.__mro__:
+        if k in _jsconverters:
+            func = _jsconverters[k]
+            break
+    else:
+        func = _default_to_js
+    _jsconverters_cache[klass] = func
+    return func
+
+
 def to_jsscalar(x):
     """ convert x to JavaScript representation """
+    try:
+        # fast path for exact types
+        return _jsconverters[type(x)](x)
+    except KeyError:
+        return _get_jsconverter(type(x))(x)
 
-    from cesiumpy.base import _CesiumObject, _CesiumEnum
-    if isinstance(x, (_CesiumObject, _CesiumEnum)):
-        return x.script
-
-    if isinstance(x, bool):
-        # convert to JavaScript repr
-        x = 'true' if x else 'false'
-    elif isinstance(x, six.string_types):
-        x = '"{0}"'.format(x)
-    elif isinstance(x, dict):
-        x = ''.join(to_jsobject(x))
-    elif isinstance(x, list):
-        x = [str(to_jsscalar(e)) for e in x]
-        x = '[{0}]'.format(', '.join(x))
+
+def _default_to_js(x):
+    # unregistered types are returned as they are
     return x
 
 
+def _bool_to_js(x):
+    # convert to JavaScript repr
+    return 'true' if x else 'false'
+
+
+def _str_to_js(x):
+    return '"{0}"'.format(x)
+
+
+def _float_to_js(x):
+    x = float(x)
+    if options.precision is not None:
+        x = round(x, options.precision)
+    # repr is the shortest representation which round-trips
+    return repr(x)
+
+
+def _int_to_js(x):
+    return '{0}'.format(int(x))
+
+
+def _dict_to_js(x):
+    return ''.join(to_jsobject(x))
+
+
+# converters for the elements of numeric list, bool must not be included
+_numeric_jsconverters = {float: _float_to_js}
+for _t in six.integer_types:
+    _numeric_jsconverters[_t] = _int_to_js
+
+
+def _list_to_js(x):
+    try:
+        # fast path for list of numerics, avoid dispatching per element
+        values = [_numeric_jsconverters[type(e)](e) for e in x]
+    except KeyError:
+        values = [str(to_jsscalar(e)) for e in x]
+    return '[{0}]'.format(', '.join(values))
+
+
+register_jsconverter(bool)(_bool_to_js)
+register_jsconverter(six.string_types)(_str_to_js)
+register_jsconverter(float)(_float_to_js)
+register_jsconverter(six.integer_types)(_int_to_js)
+register_jsconverter(dict)(_dict_to_js)
+register_jsconverter(list)(_list_to_js)
+
+
+try:
+    import numpy as np
+
+    def _ndarray_to_js(x):
+        if options.precision is not None and x.dtype.kind == 'f':
+            # round at once rather than rounding each element
+            x = np.round(x, options.precision)
+            if x.ndim == 1:
+                return '[{0}]'.format(', '.join([repr(e) for e in x.tolist()]))
+        # tolist converts elements to python scalars at once
+        return _list_to_js(x.tolist())
+
+    register_jsconverter(np.ndarray)(_ndarray_to_js)
+    register_jsconverter(np.floating)(_float_to_js)
+    register_jsconverter(np.integer)(_int_to_js)
+    register_jsconverter(np.bool_)(_bool_to_js)
+except ImportError:
+    pass
+
+
 def to_jsobject(x):
     """ convert x to JavaScript Object """
 
@@ -196,5 +371,38 @@ def to_jsobject(x):
     return results
 
 
+_binary_formats = {'float32': 'f', 'float64': 'd'}
+
+
+def to_jsbinary(x, encoding):
+    """
+    Convert list of numerics to JavaScript expression which decodes
+    base64-encoded little-endian buffer to Float64Array
+
+    Parameters
+    ----------
+
+    x : list of numerics
+    encoding : {'float32', 'float64'}
+    """
+    fmt = _binary_formats[encoding]
+    if hasattr(x, 'astype'):
+        # numpy array, no copy if the array is little-endian of the dtype
+        data = x.astype('<' + fmt, copy=False).tobytes()
+    else:
+        data = struct.pack('<{0}{1}'.format(len(x), fmt), *x)
+    encoded = base64.b64encode(data).decode('ascii')
+    # loop is much faster than Uint8Array.from with mapping function
+    decoder = ('(function (s) {{ var b = new Uint8Array(s.length); '
+               'for (var i = 0; i < s.length; i++) {{ b[i] = s.charCodeAt(i); }} '
+               'return {result}; }})(atob("{encoded}"))')
+    if encoding == 'float32':
+        # Cesium handles coordinates as float64
+        result = 'new Float64Array(new Float32Array(b.buffer))'
+    else:
+        result = 'new Float64Array(b.buffer)'
+    return decoder.format(result=result, encoded=encoded)
+
+
 def _flatten_list_of_listlike(x):
     return list(itertools.chain(*x))
@@ -3,12 +3,16 @@
 
 from __future__ import unicode_literals
 
+import io
 import os
 import six
 import warnings
 
 
 def _check_uri(sourceUri):
+    if sourceUri.startswith('data:'):
+        # embedded data, no need to read
+        return True
     if not os.path.exists(sourceUri):
         msg = "Unable to read specified path, be sure to the output HTML can read the path: {0}"
         warnings.warn(msg.format(sourceUri))
@@ -27,10 +31,18 @@ def _wrap_uri(sourceUri):
 def _wrap_script(script):
     if not isinstance(script, list):
         script = [script]
-    # filter None and empty str
-    script = [s for s in script if s is not None and len(s) > 0]
-    script = _add_indent(script)
-    return ["""<script type="text/javascript">"""] + script + ["""</script>"""]
+    return list(_iter_wrap_script(script))
+
+
+def _iter_wrap_script(script, indent=2):
+    """ Generator version of _wrap_script, script must be an iterable """
+    indent = ' ' * indent
+    yield """<script type="text/javascript">"""
+    for s in script:
+        # filter None and empty str
+        if s is not None and len(s) > 0:
+            yield indent + s
+    yield """</script>"""
 
 
 def _add_indent(script, indent=2):
@@ -43,12 +55,36 @@ def _add_indent(script, indent=2):
 
 
 def _build_html(*args):
-    results = []
+    return os.linesep.join(_iter_html(*args))
+
+
+def _iter_html(*args):
+    """ Generator version of _build_html, args may contain iterators """
     for a in args:
-        if isinstance(a, list):
-            results.extend(a)
-        elif isinstance(a, six.string_types):
-            results.append(a)
+        if isinstance(a, six.string_types):
+            yield a
+        elif isinstance(a, list) or hasattr(a, '__next__') or hasattr(a, 'next'):
+            for line in a:
+                yield line
         else:
             raise ValueError(type(a))
-    return os.linesep.join(results)
+
+
+def _write_html(lines, path_or_buf):
+    """
+    Write lines to the file path or file-like object, joined by os.linesep.
+    Lines are written one by one to avoid building whole document on memory.
+    """
+    if isinstance(path_or_buf, six.string_types):
+        # disable newline translation as lines are joined by os.linesep
+        with io.open(path_or_buf, mode='w', encoding='utf-8', newline='') as f:
+            _write_lines(lines, f)
+    else:
+        _write_lines(lines, path_or_buf)
+
+
+def _write_lines(lines, f):
+    for i, line in enumerate(lines):
+        if i > 0:
+            f.write(os.linesep)
+        f.write(line)
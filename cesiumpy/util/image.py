@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+from __future__ import unicode_literals
+
+import base64
+import struct
+import zlib
+
+import cesiumpy.util.common as com
+
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# PNG color types by the number of channels
+_PNG_COLOR_TYPES = {1: 0, 2: 4, 3: 2, 4: 6}
+
+
+def _png_chunk(tag, data):
+    crc = zlib.crc32(tag + data) & 0xffffffff
+    return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', crc)
+
+
+def to_png(image, compression=6):
+    """
+    Encode image array as PNG bytes
+
+    Parameters
+    ----------
+
+    image : numpy.ndarray
+        (height, width) shaped grayscale or (height, width, channels) shaped
+        array of uint8, channels must be 1 to 4 (gray, gray + alpha, RGB, RGBA).
+        The first row is the top of the image.
+    compression : int, default 6
+        zlib compression level
+    """
+    np = com._check_package('numpy')
+
+    image = np.asarray(image)
+    if image.dtype != np.uint8:
+        msg = 'image must be uint8 array: {x}'
+        raise ValueError(msg.format(x=image.dtype))
+    if image.ndim == 2:
+        image = image[:, :, np.newaxis]
+    if image.ndim != 3 or image.shape[2] not in _PNG_COLOR_TYPES:
+        msg = 'image must be (height, width) or (height, width, channels) shaped: {x}'
+        raise ValueError(msg.format(x=image.shape))
+
+    height, width, channels = image.shape
+    # each scanline starts with filter type 0 (None)
+    raw = np.zeros((height, width * channels + 1), dtype=np.uint8)
+    raw[:, 1:] = image.reshape(height, width * channels)
+
+    header = struct.pack('>IIBBBBB', width, height, 8,
+                         _PNG_COLOR_TYPES[channels], 0, 0, 0)
+    return b''.join([_PNG_SIGNATURE,
+                     _png_chunk(b'IHDR', header),
+                     _png_chunk(b'IDAT', zlib.compress(raw.tobytes(), compression)),
+                     _png_chunk(b'IEND', b'')])
+
+
+def to_data_uri(data, mimetype='image/png'):
+    """ Return data URI which embeds the passed bytes """
+    encoded = base64.b64encode(data).decode('ascii')
+    return 'data:{mimetype};base64,{data}'.format(mimetype=mimetype, data=encoded)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+from __future__ import unicode_literals
+
+import collections
+import math
+
+import cesiumpy.util.common as com
+
+
+class GridIndex(object):
+    """
+    Uniform grid index of bounding boxes in degrees
+
+    Parameters
+    ----------
+
+    cell_size : float, default 1.
+        Size of a grid cell in degrees.
+    max_cells : int, default 64
+        Bounds covering more cells are not registered to cells, but
+        checked on every query.
+    """
+
+    def __init__(self, cell_size=1., max_cells=64):
+        if cell_size <= 0:
+            msg = 'cell_size must be positive: {x}'
+            raise ValueError(msg.format(x=cell_size))
+        self._cell_size = float(cell_size)
+        self._max_cells = max_cells
+        self._cells = collections.defaultdict(list)
+        self._large = []
+        self._bounds = {}
+
+    def __len__(self):
+        return len(self._bounds)
+
+    def _cell_range(self, bounds):
+        minx, miny, maxx, maxy = bounds
+        size = self._cell_size
+        return (int(math.floor(minx / size)), int(math.floor(miny / size)),
+                int(math.floor(maxx / size)), int(math.floor(maxy / size)))
+
+    def insert(self, key, bounds):
+        """
+        register key with its (minx, miny, maxx, maxy) bounds, minx larger
+        than maxx means the bounds cross the antimeridian
+        """
+        parts = _split_antimeridian(bounds)
+        self._bounds[key] = parts
+        for part in parts:
+            i0, j0, i1, j1 = self._cell_range(part)
+            if (i1 - i0 + 1) * (j1 - j0 + 1) > self._max_cells:
+                if key not in self._large:
+                    self._large.append(key)
+                continue
+            for i in range(i0, i1 + 1):
+                for j in range(j0, j1 + 1):
+                    self._cells[(i, j)].append(key)
+
+    def query(self, bbox):
+        """ return set of keys whose bounds intersect with bbox """
+        i0, j0, i1, j1 = self._cell_range(bbox)
+        candidates = set(self._large)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > len(self._cells):
+            # bbox is larger than the occupied area, scan occupied cells
+            for (i, j), keys in self._cells.items():
+                if i0 <= i <= i1 and j0 <= j <= j1:
+                    candidates.update(keys)
+        else:
+            for i in range(i0, i1 + 1):
+                for j in range(j0, j1 + 1):
+                    candidates.update(self._cells.get((i, j), ()))
+        return set(key for key in candidates
+                   if any(_intersects(part, bbox) for part in self._bounds[key]))
+
+
+def _intersects(left, right):
+    if left[0] > right[2] or right[0] > left[2]:
+        return False
+    return left[1] <= right[3] and right[1] <= left[3]
+
+
+def validate_bbox(bbox):
+    """
+    Validate (minx, miny, maxx, maxy) in degrees, return list of bboxes.
+    bbox whose minx is larger than maxx crosses the antimeridian, thus
+    it is splitted into 2 bboxes.
+    """
+    if not com.is_listlike(bbox) or len(bbox) != 4:
+        msg = 'bbox must be a list-like of (minx, miny, maxx, maxy): {x}'
+        raise ValueError(msg.format(x=bbox))
+    minx, miny, maxx, maxy = [float(e) for e in bbox]
+    if miny > maxy:
+        msg = 'bbox miny must be less than or equal to maxy: {x}'
+        raise ValueError(msg.format(x=bbox))
+    return _split_antimeridian((minx, miny, maxx, maxy))
+
+
+def _split_antimeridian(bounds):
+    minx, miny, maxx, maxy = bounds
+    if minx > maxx:
+        return [(minx, miny, 180., maxy), (-180., miny, maxx, maxy)]
+    return [(minx, miny, maxx, maxy)]
+
+
+def get_bounds(item):
+    """
+    Return (minx, miny, maxx, maxy) of the entity in degrees, or None if
+    it doesn't have positions in degrees. minx is larger than maxx if
+    the entity crosses the antimeridian.
+    """
+    if getattr(item, '_is_collection', False):
+        return item.bounds
+
+    position = getattr(item, 'position', None)
+    if position is not None:
+        if not position._is_degrees:
+            return None
+        return (position.x, position.y, position.x, position.y)
+
+    positions = getattr(item, 'positions', None)
+    if positions is not None:
+        return _array_bounds(positions)
+
+    rectangle = getattr(item, 'coordinates', None)
+    if rectangle is not None and rectangle._is_degrees:
+        return (rectangle.west, rectangle.south, rectangle.east, rectangle.north)
+    return None
+
+
+def _array_bounds(positions):
+    step = 3 if positions._heights else 2
+    x = positions.x
+    if len(x) == 0:
+        return None
+    lon, lat = x[0::step], x[1::step]
+    if hasattr(x, 'min'):
+        # numpy array
+        return (lon.min(), lat.min(), lon.max(), lat.max())
+    return (min(lon), min(lat), max(lon), max(lat))
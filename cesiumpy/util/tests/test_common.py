@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # coding: utf-8
 
+import collections
 import unittest
 import nose
 
@@ -58,6 +59,28 @@ class TestChecker(unittest.TestCase):
         self.assertFalse(com.is_longitude((1, 2)))
         self.assertFalse(com.is_latitude((1, 2)))
 
+    def test_validate_listlike_lonlat_numpy(self):
+        _skip_if_no_numpy()
+        import numpy as np
+
+        x = np.array([-180., -90., 180., 90.])
+        result = com.validate_listlike_lonlat(x, key='x')
+        # array is not converted
+        self.assertTrue(result is x)
+
+        x = np.array([1, 2, 3, 4])
+        result = com.validate_listlike_lonlat(x[::1], key='x')
+        self.assertTrue(isinstance(result, np.ndarray))
+
+        msg = "x length must be an even number"
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            com.validate_listlike_lonlat(np.array([1., 2., 3.]), key='x')
+
+        msg = "x must be a list consists from longitude and latitude"
+        for x in [np.array([181., 0.]), np.array([0., -91.]), np.array([0., np.nan])]:
+            with nose.tools.assert_raises_regexp(ValueError, msg):
+                com.validate_listlike_lonlat(x, key='x')
+
 
 class TestConverter(unittest.TestCase):
 
@@ -66,6 +89,51 @@ class TestConverter(unittest.TestCase):
         self.assertEqual('true', com.to_jsscalar(True))
         self.assertEqual('false', com.to_jsscalar(False))
         self.assertEqual('[false, true]', com.to_jsscalar([False, True]))
+        self.assertEqual('1.5', com.to_jsscalar(1.5))
+        self.assertEqual('[1, 2.5, "x", true]', com.to_jsscalar([1, 2.5, 'x', True]))
+        self.assertEqual('[[1, 2], []]', com.to_jsscalar([[1, 2], []]))
+        self.assertEqual('{a : 1, b : [0.5]}', com.to_jsscalar(collections.OrderedDict([('a', 1), ('b', [0.5])])))
+
+    def test_to_jsscalar_numpy(self):
+        _skip_if_no_numpy()
+        import numpy as np
+        self.assertEqual('[1.0, 2.5]', com.to_jsscalar(np.array([1., 2.5])))
+        self.assertEqual('[[1, 2], [3, 4]]', com.to_jsscalar(np.array([[1, 2], [3, 4]])))
+        self.assertEqual('1.5', com.to_jsscalar(np.float64(1.5)))
+        self.assertEqual('3', com.to_jsscalar(np.int32(3)))
+        self.assertEqual('true', com.to_jsscalar(np.bool_(True)))
+        self.assertEqual('[1, 2.0]', com.to_jsscalar([np.int64(1), np.float32(2.)]))
+
+    def test_to_jsbinary(self):
+        result = com.to_jsbinary([1, 2.5], 'float64')
+        self.assertTrue(result.endswith('return new Float64Array(b.buffer); })(atob("AAAAAAAA8D8AAAAAAAAEQA=="))'))
+        result = com.to_jsbinary([1, 2.5], 'float32')
+        self.assertTrue(result.endswith('return new Float64Array(new Float32Array(b.buffer)); })(atob("AACAPwAAIEA="))'))
+
+    def test_register_jsconverter(self):
+
+        class Dummy(object):
+            pass
+
+        class SubDummy(Dummy):
+            pass
+
+        # unregistered types are returned as they are
+        dummy = Dummy()
+        self.assertTrue(com.to_jsscalar(dummy) is dummy)
+        self.assertTrue(com.to_jsscalar(None) is None)
+
+        @com.register_jsconverter(Dummy)
+        def _dummy_to_js(x):
+            return 'dummy'
+
+        try:
+            self.assertEqual(com.to_jsscalar(Dummy()), 'dummy')
+            self.assertEqual(com.to_jsscalar(SubDummy()), 'dummy')
+            self.assertEqual(com.to_jsscalar([Dummy(), 1]), '[dummy, 1]')
+        finally:
+            com._jsconverters.pop(Dummy)
+            com._jsconverters_cache.clear()
 
 
 if __name__ == '__main__':
@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 # coding: utf-8
 
+import os
 import unittest
+import warnings
 
 import cesiumpy.util.html as html
 
@@ -17,6 +19,15 @@ class TestHTML(unittest.TestCase):
         exp = """<link rel="stylesheet" href="http://cesiumjs.org/Cesium/Build/Cesium/Widgets/widgets.css" type="text/css">"""
         self.assertEqual(res, exp)
 
+    def test_check_uri(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            self.assertTrue(html._check_uri('data:image/png;base64,YWJj'))
+            self.assertEqual(len(w), 0)
+
+            self.assertTrue(html._check_uri('not_existing.png'))
+            self.assertEqual(len(w), 1)
+
     def test_wrap_script(self):
         res = html._wrap_script('aaa')
         exp = ['<script type="text/javascript">', '  aaa', '</script>']
@@ -38,3 +49,15 @@ class TestHTML(unittest.TestCase):
         res = html._add_indent(['aaa', 'bbb'], indent=3)
         exp = ['   aaa', '   bbb']
         self.assertEqual(res, exp)
+
+    def test_iter_wrap_script(self):
+        res = html._iter_wrap_script(iter(['aaa', '', None, 'bbb']))
+        exp = ['<script type="text/javascript">', '  aaa', '  bbb', '</script>']
+        self.assertEqual(list(res), exp)
+
+    def test_build_html(self):
+        res = html._build_html('aaa', ['bbb', 'ccc'], iter(['ddd']))
+        self.assertEqual(res, os.linesep.join(['aaa', 'bbb', 'ccc', 'ddd']))
+
+        with self.assertRaises(ValueError):
+            html._build_html(1)
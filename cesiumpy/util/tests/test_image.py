@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+import base64
+import struct
+import unittest
+import zlib
+import nose
+
+import cesiumpy.util.image as image
+from cesiumpy.testing import _skip_if_no_numpy
+
+
+def _read_png(data):
+    """ decode PNG written by to_png, which only uses filter type 0 """
+    import numpy as np
+
+    assert data[:8] == b'\x89PNG\r\n\x1a\n'
+    pos = 8
+    chunks = []
+    while pos < len(data):
+        length, = struct.unpack('>I', data[pos:pos + 4])
+        tag = data[pos + 4:pos + 8]
+        body = data[pos + 8:pos + 8 + length]
+        crc, = struct.unpack('>I', data[pos + 8 + length:pos + 12 + length])
+        assert crc == zlib.crc32(tag + body) & 0xffffffff
+        chunks.append((tag, body))
+        pos += 12 + length
+
+    tags = [tag for tag, _ in chunks]
+    assert tags == [b'IHDR', b'IDAT', b'IEND']
+    width, height, depth, color_type = struct.unpack('>IIBB', chunks[0][1][:10])
+    channels = {0: 1, 4: 2, 2: 3, 6: 4}[color_type]
+    raw = np.frombuffer(zlib.decompress(chunks[1][1]), dtype=np.uint8)
+    raw = raw.reshape(height, width * channels + 1)
+    assert (raw[:, 0] == 0).all()
+    return raw[:, 1:].reshape(height, width, channels)
+
+
+class TestPNG(unittest.TestCase):
+
+    def setUp(self):
+        _skip_if_no_numpy()
+
+    def test_to_png(self):
+        import numpy as np
+
+        for channels in [1, 2, 3, 4]:
+            img = np.random.randint(0, 256, (5, 7, channels)).astype(np.uint8)
+            result = _read_png(image.to_png(img))
+            self.assertEqual(result.shape, (5, 7, channels))
+            self.assertTrue((result == img).all())
+
+        img = np.random.randint(0, 256, (3, 2)).astype(np.uint8)
+        result = _read_png(image.to_png(img))
+        self.assertTrue((result[:, :, 0] == img).all())
+
+    def test_to_png_errors(self):
+        import numpy as np
+
+        with nose.tools.assert_raises_regexp(ValueError, 'image must be uint8 array'):
+            image.to_png(np.zeros((3, 3)))
+        msg = 'image must be \\(height, width\\) or \\(height, width, channels\\) shaped'
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            image.to_png(np.zeros((3, 3, 5), dtype=np.uint8))
+
+    def test_to_data_uri(self):
+        result = image.to_data_uri(b'abc')
+        self.assertEqual(result, 'data:image/png;base64,YWJj')
+        self.assertEqual(base64.b64decode(result.split(',')[1]), b'abc')
+
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
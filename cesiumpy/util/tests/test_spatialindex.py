@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+import unittest
+import nose
+
+import cesiumpy
+import cesiumpy.util.spatialindex as spatialindex
+from cesiumpy.testing import _skip_if_no_numpy
+
+
+class TestGridIndex(unittest.TestCase):
+
+    def test_query(self):
+        index = spatialindex.GridIndex(cell_size=10)
+        index.insert('a', (1, 1, 1, 1))
+        index.insert('b', (-5, -5, 5, 5))
+        index.insert('c', (50, 50, 60, 60))
+        index.insert('d', (-180, -90, 180, 90))
+        self.assertEqual(len(index), 4)
+
+        self.assertEqual(index.query((0, 0, 2, 2)), set(['a', 'b', 'd']))
+        self.assertEqual(index.query((55, 55, 56, 56)), set(['c', 'd']))
+        self.assertEqual(index.query((-180, -90, 180, 90)), set(['a', 'b', 'c', 'd']))
+        # touching bounds intersect
+        self.assertEqual(index.query((5, 5, 6, 6)), set(['b', 'd']))
+
+        # crossing the antimeridian
+        index.insert('e', (170, 0, -170, 10))
+        self.assertEqual(index.query((175, 1, 176, 2)), set(['d', 'e']))
+        self.assertEqual(index.query((-176, 1, -175, 2)), set(['d', 'e']))
+        self.assertEqual(index.query((0, 1, 10, 2)), set(['a', 'b', 'd']))
+
+    def test_invalid(self):
+        with nose.tools.assert_raises_regexp(ValueError, 'cell_size must be positive'):
+            spatialindex.GridIndex(cell_size=0)
+
+
+class TestBounds(unittest.TestCase):
+
+    def test_validate_bbox(self):
+        self.assertEqual(spatialindex.validate_bbox((1, 2, 3, 4)), [(1., 2., 3., 4.)])
+        self.assertEqual(spatialindex.validate_bbox((170, 0, -170, 10)),
+                         [(170., 0., 180., 10.), (-180., 0., -170., 10.)])
+
+        msg = 'bbox must be a list-like of'
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            spatialindex.validate_bbox((1, 2, 3))
+        msg = 'bbox miny must be less than or equal to maxy'
+        with nose.tools.assert_raises_regexp(ValueError, msg):
+            spatialindex.validate_bbox((1, 5, 3, 4))
+
+    def test_get_bounds(self):
+        p = cesiumpy.Point(position=(-110, 40, 0))
+        self.assertEqual(spatialindex.get_bounds(p), (-110, 40, -110, 40))
+
+        p = cesiumpy.Polyline(positions=[-120, 25, -90, 30, -50, 25])
+        self.assertEqual(spatialindex.get_bounds(p), (-120, 25, -50, 30))
+
+        p = cesiumpy.Polygon(hierarchy=[-80, 40, -85, 40, -82.5, 45])
+        self.assertEqual(spatialindex.get_bounds(p), (-85, 40, -80, 45))
+
+        r = cesiumpy.Rectangle(coordinates=(-75, 40, -70, 45))
+        self.assertEqual(spatialindex.get_bounds(r), (-75, 40, -70, 45))
+
+        r = cesiumpy.Rectangle(coordinates=(170, 0, -170, 10))
+        self.assertEqual(spatialindex.get_bounds(r), (170, 0, -170, 10))
+
+    def test_get_bounds_collection(self):
+        _skip_if_no_numpy()
+
+        c = cesiumpy.PointCollection([1, 3], [2, -4])
+        self.assertEqual(spatialindex.get_bounds(c), (1, -4, 3, 2))
+
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
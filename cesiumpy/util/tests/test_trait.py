@@ -3,6 +3,7 @@
 
 import unittest
 
+import cesiumpy
 from cesiumpy.util.trait import _DIV
 
 
@@ -21,3 +22,51 @@ class TestTrait(unittest.TestCase):
 
         div = _DIV(divid='xxx', width='90%', height='60%')
         self.assertEqual(div.script, """<div id="xxx" style="width:90%; height:60%;"><div>""")
+
+    def test_script_cache(self):
+        p = cesiumpy.Point(position=(130, 40, 0))
+        exp = """{position : Cesium.Cartesian3.fromDegrees(130.0, 40.0, 0.0), point : {pixelSize : 10.0, color : Cesium.Color.WHITE}}"""
+        self.assertEqual(p.script, exp)
+        # cached
+        self.assertTrue(p.script is p.script)
+
+        p.pixelSize = 5
+        exp = """{position : Cesium.Cartesian3.fromDegrees(130.0, 40.0, 0.0), point : {pixelSize : 5.0, color : Cesium.Color.WHITE}}"""
+        self.assertEqual(p.script, exp)
+
+        # non-trait attribute
+        p.name = 'x'
+        exp = """{name : "x", position : Cesium.Cartesian3.fromDegrees(130.0, 40.0, 0.0), point : {pixelSize : 5.0, color : Cesium.Color.WHITE}}"""
+        self.assertEqual(p.script, exp)
+
+    def test_script_cache_version(self):
+        p = cesiumpy.Point(position=(130, 40, 0))
+        # versions which are not interned by CPython
+        for i in range(300):
+            p.pixelSize = i
+        script = p.script
+        self.assertTrue('pixelSize : 299.0' in script)
+        self.assertTrue(p.script is script)
+
+        # changes are counted by the public observer
+        p.observe(lambda change: None, names='pixelSize')
+        p.pixelSize = 1
+        self.assertTrue('pixelSize : 1.0' in p.script)
+
+    def test_script_cache_child(self):
+        c = cesiumpy.color.RED
+        p = cesiumpy.Point(position=(130, 40, 0), color=c)
+        exp = """{position : Cesium.Cartesian3.fromDegrees(130.0, 40.0, 0.0), point : {pixelSize : 10.0, color : Cesium.Color.RED}}"""
+        self.assertEqual(p.script, exp)
+
+        c.withAlpha(0.5)
+        p.position.x = 140
+        exp = """{position : Cesium.Cartesian3.fromDegrees(140.0, 40.0, 0.0), point : {pixelSize : 10.0, color : Cesium.Color.RED.withAlpha(0.5)}}"""
+        self.assertEqual(p.script, exp)
+
+        p = cesiumpy.Polygon(hierarchy=[1, 2, 3, 4, 5, 6])
+        exp = """{polygon : {hierarchy : Cesium.Cartesian3.fromDegreesArray([1, 2, 3, 4, 5, 6])}}"""
+        self.assertEqual(p.script, exp)
+        p.hierarchy.x = [1, 1, 2, 2]
+        exp = """{polygon : {hierarchy : Cesium.Cartesian3.fromDegreesArray([1, 1, 2, 2])}}"""
+        self.assertEqual(p.script, exp)
@@ -4,10 +4,12 @@
 from __future__ import unicode_literals
 
 import collections
+import six
 import traitlets
 
 from enum import Enum
 
+from cesiumpy.options import options
 import cesiumpy.util.common as com
 import cesiumpy.util.html as html
 
@@ -58,6 +60,11 @@ class _JavaScriptObject(_HTMLObject):
     """
     Base class for JavaScript instances, which can be converted to
     JavaScript instance
+
+    Generated script is cached with the values it is built from. The cache
+    is used while the instance and its child instances hold identical
+    values. Note that in-place modification of mutable values (like list)
+    is not detected.
     """
 
     @property
@@ -78,9 +85,79 @@ class _JavaScriptObject(_HTMLObject):
 
     @property
     def script(self):
+        state = self._script_state()
+        # script depends on options
+        state.append(options.precision)
+        state.append(options.array_encoding)
+        cache = self.__dict__.get('_script_cache')
+        if cache is not None and _is_same_state(cache[0], state):
+            return cache[1]
+
         props = self._property_dict
         results = com.to_jsobject(props)
-        return ''.join(results)
+        script = ''.join(results)
+        # use __dict__ not to be included in the state
+        self.__dict__['_script_cache'] = (state, script)
+        return script
+
+    @traitlets.observe(traitlets.All)
+    def _count_trait_change(self, change):
+        # traitlets notifies only when the value is changed
+        d = self.__dict__
+        d['_trait_version'] = d.get('_trait_version', 0) + 1
+
+    def _script_state(self):
+        """
+        Return values which the script is built from, includes values of
+        child instances. Trait changes are tracked by the version, other
+        attributes are compared by identity.
+        """
+        d = self.__dict__
+        version = d.get('_trait_version', 0)
+        children = d.get('_script_children')
+        if children is None or children[0] != version:
+            children = (version, _find_children(self._trait_values.values()))
+            d['_script_children'] = children
+
+        state = [version]
+        for key, value in six.iteritems(d):
+            if key[0] != '_':
+                state.append(value)
+                for child in _find_children((value, )):
+                    state.extend(child._script_state())
+        for child in children[1]:
+            state.extend(child._script_state())
+        return state
+
+
+def _find_children(values):
+    children = []
+    for value in values:
+        if isinstance(value, _JavaScriptObject):
+            children.append(value)
+        elif isinstance(value, list) and len(value) > 0:
+            # check only the first element not to scan list of numerics
+            if isinstance(value[0], _JavaScriptObject):
+                children.extend(value)
+    return children
+
+
+# state values compared by value, others are compared by identity
+_scalar_types = six.integer_types + (float, ) + six.string_types
+
+
+def _is_same_state(left, right):
+    if len(left) != len(right):
+        return False
+    for lvalue, rvalue in zip(left, right):
+        if lvalue is rvalue:
+            continue
+        # versions and options may be equal but not identical
+        if not isinstance(lvalue, _scalar_types) or type(lvalue) is not type(rvalue):
+            return False
+        if lvalue != rvalue:
+            return False
+    return True
 
 
 class _JavaScriptEnum(Enum):
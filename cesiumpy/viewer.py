@@ -90,6 +90,8 @@ class Viewer(_CesiumBase):
         The collection of data sources visualized by the widget. If this parameter is provided, the instance is assumed to be owned by the caller and will not be destroyed when the viewer is destroyed.
     terrainExaggeration : float, default 1.
         A scalar used to exaggerate the terrain. Note that terrain exaggeration will not modify any other primitive as they are positioned relative to the ellipsoid.
+    precision : int, default None
+        Number of decimals of float values in the generated script. If None, cesiumpy.options.precision is used.
     """
 
     # dataSources should be excluded from init, as it is handled separately
@@ -133,7 +135,7 @@ class Viewer(_CesiumBase):
                  showRenderLoopErrors=None, automaticallyTrackDataSourceClocks=None,
                  contextOptions=None, sceneMode=None, mapProjection=None, globe=None,
                  orderIndependentTranslucency=None, creditContainer=None, dataSources=None,
-                 terrainExaggeration=None):
+                 terrainExaggeration=None, precision=None):
 
         super(Viewer, self).__init__(divid=divid, width=width, height=height,
                                      scene3DOnly=scene3DOnly, clock=clock,
@@ -148,7 +150,8 @@ class Viewer(_CesiumBase):
                                      showRenderLoopErrors=showRenderLoopErrors,
                                      contextOptions=contextOptions,
                                      creditContainer=creditContainer,
-                                     terrainExaggeration=terrainExaggeration)
+                                     terrainExaggeration=terrainExaggeration,
+                                     precision=precision)
 
         self.animation = animation
 
@@ -52,5 +52,7 @@ class CesiumWidget(_CesiumBase):
         The DOM element or ID that will contain the CreditDisplay. If not specified, the credits are added to the bottom of the widget itself.
     terrainExaggeration : float, default 1.
         A scalar used to exaggerate the terrain. Note that terrain exaggeration will not modify any other primitive as they are positioned relative to the ellipsoid.
+    precision : int, default None
+        Number of decimals of float values in the generated script. If None, cesiumpy.options.precision is used.
     """
     pass
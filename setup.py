@@ -33,6 +33,8 @@ write_version_py(filename=version_file)
 install_requires = list(read(REQUIREMENTS).splitlines())
 if sys.version_info < (3, 4, 0):
     install_requires.append('enum34')
+if sys.version_info < (3, 2, 0):
+    install_requires.append('futures')
 
 setup(name=PACKAGE,
       version=VERSION,